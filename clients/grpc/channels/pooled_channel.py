@@ -0,0 +1,207 @@
+from itertools import count
+from typing import Any, Callable
+
+from grpc import (
+    Channel,
+    UnaryUnaryMultiCallable,
+    UnaryStreamMultiCallable,
+    StreamUnaryMultiCallable,
+    StreamStreamMultiCallable
+)
+
+from tools.config.grpc import GRPCChannelStrategy
+
+
+class GRPCChannelPoolStats:
+    """
+    Статистика пула gRPC-каналов.
+
+    Attributes:
+        in_flight: Количество незавершённых вызовов по каждому каналу пула.
+        calls: Общее количество вызовов, отправленных через каждый канал пула.
+    """
+
+    def __init__(self, channels: int):
+        self.in_flight = [0] * channels
+        self.calls = [0] * channels
+
+    @property
+    def channels(self) -> int:
+        """
+        Количество каналов в пуле.
+        """
+        return len(self.in_flight)
+
+    @property
+    def in_flight_total(self) -> int:
+        """
+        Суммарное количество незавершённых вызовов во всех каналах.
+        """
+        return sum(self.in_flight)
+
+
+class _PooledMultiCallable:
+    """
+    Обёртка над multi-callable объектами всех каналов пула.
+
+    При каждом вызове выбирает канал через пул и учитывает вызов как незавершённый
+    до тех пор, пока он не завершится (успешно или с ошибкой).
+    """
+
+    def __init__(self, pool: "PooledChannel", factory: Callable[[Channel], Any]):
+        self._pool = pool
+        self._factory = factory
+        self._callables: list[Any] = [None] * len(pool.channels)
+
+    def _get(self, index: int):
+        if self._callables[index] is None:
+            self._callables[index] = self._factory(self._pool.channels[index])
+        return self._callables[index]
+
+    def __call__(self, *args, **kwargs):
+        index = self._pool.acquire()
+        try:
+            return self._get(index)(*args, **kwargs)
+        finally:
+            self._pool.release(index)
+
+    def with_call(self, *args, **kwargs):
+        index = self._pool.acquire()
+        try:
+            return self._get(index).with_call(*args, **kwargs)
+        finally:
+            self._pool.release(index)
+
+    def future(self, *args, **kwargs):
+        index = self._pool.acquire()
+        try:
+            future = self._get(index).future(*args, **kwargs)
+        except Exception:
+            self._pool.release(index)
+            raise
+
+        future.add_done_callback(lambda _: self._pool.release(index))
+        return future
+
+
+class _PooledStreamingMultiCallable(_PooledMultiCallable):
+    """
+    Обёртка для вызовов с потоковым ответом: вызов считается завершённым,
+    когда gRPC сообщает о завершении RPC (callback на объекте вызова).
+    """
+
+    def __call__(self, *args, **kwargs):
+        index = self._pool.acquire()
+        try:
+            call = self._get(index)(*args, **kwargs)
+        except Exception:
+            self._pool.release(index)
+            raise
+
+        if not call.add_callback(lambda: self._pool.release(index)):
+            self._pool.release(index)
+        return call
+
+
+class _PooledUnaryUnaryMultiCallable(_PooledMultiCallable, UnaryUnaryMultiCallable):
+    pass
+
+
+class _PooledUnaryStreamMultiCallable(_PooledStreamingMultiCallable, UnaryStreamMultiCallable):
+    pass
+
+
+class _PooledStreamUnaryMultiCallable(_PooledMultiCallable, StreamUnaryMultiCallable):
+    pass
+
+
+class _PooledStreamStreamMultiCallable(_PooledStreamingMultiCallable, StreamStreamMultiCallable):
+    pass
+
+
+class PooledChannel(Channel):
+    """
+    gRPC-канал, распределяющий вызовы между несколькими реальными каналами (шардирование).
+
+    Реализует интерфейс grpc.Channel, поэтому может передаваться в stub'ы и в intercept_channel
+    так же, как обычный канал. Каждый вызов отправляется в канал, выбранный согласно стратегии:
+    по кругу (round robin) или в канал с наименьшим числом незавершённых вызовов.
+    """
+
+    def __init__(self, channels: list[Channel], strategy: GRPCChannelStrategy):
+        """
+        :param channels: Реальные gRPC-каналы, между которыми распределяются вызовы.
+        :param strategy: Стратегия выбора канала.
+        """
+        self.channels = channels
+        self.strategy = strategy
+        self.stats = GRPCChannelPoolStats(channels=len(channels))
+
+        self._counter = count()
+
+    def acquire(self) -> int:
+        """
+        Выбирает канал для очередного вызова и помечает вызов как незавершённый.
+
+        :return: Индекс выбранного канала.
+        """
+        in_flight = self.stats.in_flight
+        if self.strategy == GRPCChannelStrategy.LEAST_OUTSTANDING:
+            index = in_flight.index(min(in_flight))
+        else:
+            index = next(self._counter) % len(in_flight)
+
+        in_flight[index] += 1
+        self.stats.calls[index] += 1
+        return index
+
+    def release(self, index: int) -> None:
+        """
+        Помечает вызов в канале с указанным индексом как завершённый.
+
+        :param index: Индекс канала, полученный из acquire().
+        """
+        self.stats.in_flight[index] -= 1
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self.channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self.channels:
+            channel.unsubscribe(callback)
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return _PooledUnaryUnaryMultiCallable(
+            self,
+            lambda channel: channel.unary_unary(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return _PooledUnaryStreamMultiCallable(
+            self,
+            lambda channel: channel.unary_stream(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return _PooledStreamUnaryMultiCallable(
+            self,
+            lambda channel: channel.stream_unary(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return _PooledStreamStreamMultiCallable(
+            self,
+            lambda channel: channel.stream_stream(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -1,8 +1,12 @@
-from grpc import Channel
+from grpc import Channel, Future
 from locust.env import Environment
 
 from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client
+)
 from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
 from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
 from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import (
@@ -48,6 +52,15 @@ class AccountsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.GetAccounts(request)
 
+    def get_accounts_future_api(self, request: GetAccountsRequest) -> Future:
+        """
+        Неблокирующий вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Future, результатом которого будет GetAccountsResponse.
+        """
+        return self.stub.GetAccounts.future(request)
+
     def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
         """
         Низкоуровневый вызов метода OpenDepositAccount через gRPC.
@@ -88,6 +101,10 @@ class AccountsGatewayGRPCClient(GRPCClient):
         request = GetAccountsRequest(user_id=user_id)
         return self.get_accounts_api(request)
 
+    def get_accounts_future(self, user_id: str) -> Future:
+        request = GetAccountsRequest(user_id=user_id)
+        return self.get_accounts_future_api(request)
+
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
         request = OpenDepositAccountRequest(user_id=user_id)
         return self.open_deposit_account_api(request)
@@ -114,6 +131,18 @@ def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
     return AccountsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
 
+def build_accounts_gateway_async_grpc_client() -> AccountsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AccountsGatewayGRPCClient поверх асинхронного канала grpc.aio.
+
+    Методы такого клиента возвращают awaitable-объекты вызовов вместо готовых ответов.
+    Канал привязывается к текущему event loop, поэтому клиент нужно создавать внутри него.
+
+    :return: Инициализированный асинхронный клиент для AccountsGatewayService.
+    """
+    return AccountsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
 def build_accounts_gateway_locust_grpc_client(environment: Environment) -> AccountsGatewayGRPCClient:
     """
     Функция создаёт экземпляр AccountsGatewayGRPCClient адаптированного под Locust.
@@ -2,7 +2,11 @@ from grpc import Channel
 from locust.env import Environment
 
 from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client
+)
 from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
 from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardRequest, \
     IssuePhysicalCardResponse
@@ -82,6 +86,18 @@ def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
     return CardsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
 
+def build_cards_gateway_async_grpc_client() -> CardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра CardsGatewayGRPCClient поверх асинхронного канала grpc.aio.
+
+    Методы такого клиента возвращают awaitable-объекты вызовов вместо готовых ответов.
+    Канал привязывается к текущему event loop, поэтому клиент нужно создавать внутри него.
+
+    :return: Инициализированный асинхронный клиент для CardsGatewayService.
+    """
+    return CardsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
 def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGatewayGRPCClient:
     """
     Функция создаёт экземпляр CardsGatewayGRPCClient адаптированного под Locust.
@@ -1,9 +1,18 @@
-from grpc import Channel, insecure_channel, intercept_channel
+from weakref import WeakSet
+
+from grpc import Channel, aio, insecure_channel, intercept_channel
 from locust.env import Environment
 
+from clients.grpc.channels.pooled_channel import PooledChannel
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
 from config import settings
 
+# Все пулы каналов, созданные в текущем процессе. Используется для сбора статистики.
+gateway_grpc_channel_pools: WeakSet[PooledChannel] = WeakSet()
+
+# Общий на процесс пул каналов к grpc-gateway (создаётся лениво при первом обращении).
+_gateway_grpc_channel_pool: PooledChannel | None = None
+
 
 def build_gateway_grpc_client() -> Channel:
     """
@@ -14,15 +23,55 @@ def build_gateway_grpc_client() -> Channel:
     return insecure_channel(settings.gateway_grpc_client.client_url)
 
 
+def build_gateway_async_grpc_client() -> aio.Channel:
+    """
+    Фабричная функция для создания асинхронного gRPC-канала (grpc.aio) к сервису grpc-gateway.
+
+    Используется асинхронным движком сидинга. Не работает в процессе, пропатченном gevent.
+
+    :return: Асинхронный gRPC-канал, привязанный к текущему event loop.
+    """
+    return aio.insecure_channel(settings.gateway_grpc_client.client_url)
+
+
+def build_gateway_grpc_channel_pool() -> PooledChannel:
+    """
+    Возвращает общий на процесс пул gRPC-каналов к сервису grpc-gateway.
+
+    Количество каналов и стратегия их выбора задаются в GATEWAY_GRPC_CLIENT.POOL.
+    Каждый канал использует собственный пул подключений (grpc.use_local_subchannel_pool),
+    иначе gRPC объединил бы каналы с одинаковым адресом в одно HTTP/2-соединение.
+
+    :return: Пул каналов, который разделяют все stub'ы и все виртуальные пользователи воркера.
+    """
+    global _gateway_grpc_channel_pool
+
+    if _gateway_grpc_channel_pool is None:
+        pool = settings.gateway_grpc_client.pool
+        options = [("grpc.use_local_subchannel_pool", 1)] if pool.channels > 1 else None
+        _gateway_grpc_channel_pool = PooledChannel(
+            channels=[
+                insecure_channel(settings.gateway_grpc_client.client_url, options=options)
+                for _ in range(pool.channels)
+            ],
+            strategy=pool.strategy
+        )
+        gateway_grpc_channel_pools.add(_gateway_grpc_channel_pool)
+
+    return _gateway_grpc_channel_pool
+
+
 def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     """
     Фабричная функция для создания gRPC-канала, адаптированного для Locust.
     В канал автоматически встраивается интерцептор LocustInterceptor,
     который регистрирует вызовы в системе метрик Locust.
 
+    Новые соединения не открываются: все вызовы идут через общий пул каналов воркера
+    (см. build_gateway_grpc_channel_pool).
+
     :param environment: Среда выполнения Locust (необходима для отправки событий).
     :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
     """
     locust_interceptor = LocustInterceptor(environment=environment)
-    channel = insecure_channel(settings.gateway_grpc_client.client_url)
-    return intercept_channel(channel, locust_interceptor)
\ No newline at end of file
+    return intercept_channel(build_gateway_grpc_channel_pool(), locust_interceptor)
@@ -1,7 +1,9 @@
-from locust import TaskSet, SequentialTaskSet
+from locust import TaskSet, SequentialTaskSet, events
+from locust.env import Environment
 
 from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_locust_grpc_client
 from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient, build_cards_gateway_locust_grpc_client
+from clients.grpc.gateway.client import build_gateway_grpc_channel_pool
 from clients.grpc.gateway.documents.client import (
     DocumentsGatewayGRPCClient,
     build_documents_gateway_locust_grpc_client
@@ -11,9 +13,23 @@ from clients.grpc.gateway.operations.client import (
     build_operations_gateway_locust_grpc_client
 )
 from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from tools.locust.open_model import OpenModelTaskSetMixin
+from tools.logger import get_logger
 
+logger = get_logger("GATEWAY_GRPC_POOL")
 
-class GatewayGRPCTaskSet(TaskSet):
+
+@events.test_stop.add_listener
+def log_gateway_grpc_pool_stats(environment: Environment, **kwargs):
+    """
+    По завершении теста выводит статистику пула gRPC-каналов:
+    количество каналов, распределение вызовов между ними и число незавершённых вызовов.
+    """
+    stats = build_gateway_grpc_channel_pool().stats
+    logger.info(f"Channels: {stats.channels}, calls: {stats.calls}, in flight: {stats.in_flight_total}")
+
+
+class GatewayGRPCTaskSet(OpenModelTaskSetMixin, TaskSet):
     """
     Базовый TaskSet для gRPC-сценариев, работающих с grpc-gateway.
 
@@ -39,7 +55,7 @@ class GatewayGRPCTaskSet(TaskSet):
         self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
 
 
-class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
+class GatewayGRPCSequentialTaskSet(OpenModelTaskSetMixin, SequentialTaskSet):
     """
     Базовый SequentialTaskSet для gRPC-сценариев, где важен порядок выполнения задач.
 
@@ -1,8 +1,12 @@
-from grpc import Channel
+from grpc import Channel, Future
 from locust.env import Environment
 
 from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client
+)
 from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
 from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import GetOperationReceiptRequest, \
     GetOperationReceiptResponse
@@ -71,6 +75,15 @@ class OperationsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.GetOperations(request)
 
+    def get_operations_future_api(self, request: GetOperationsRequest) -> Future:
+        """
+        Неблокирующий вызов метода GetOperations через gRPC.
+
+        :param request: gRPC-запрос с ID счёта.
+        :return: Future, результатом которого будет GetOperationsResponse.
+        """
+        return self.stub.GetOperations.future(request)
+
     def get_operations_summary_api(self, request: GetOperationsSummaryRequest) -> GetOperationsSummaryResponse:
         """
         Низкоуровневый вызов метода GetOperationsSummary через gRPC.
@@ -80,6 +93,15 @@ class OperationsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.GetOperationsSummary(request)
 
+    def get_operations_summary_future_api(self, request: GetOperationsSummaryRequest) -> Future:
+        """
+        Неблокирующий вызов метода GetOperationsSummary через gRPC.
+
+        :param request: gRPC-запрос с ID счёта.
+        :return: Future, результатом которого будет GetOperationsSummaryResponse.
+        """
+        return self.stub.GetOperationsSummary.future(request)
+
     def make_fee_operation_api(self, request: MakeFeeOperationRequest) -> MakeFeeOperationResponse:
         """
         Низкоуровневый вызов метода MakeFeeOperation через gRPC.
@@ -155,10 +177,18 @@ class OperationsGatewayGRPCClient(GRPCClient):
         request = GetOperationsRequest(account_id=account_id)
         return self.get_operation_api(request)
 
+    def get_operations_future(self, account_id: str) -> Future:
+        request = GetOperationsRequest(account_id=account_id)
+        return self.get_operations_future_api(request)
+
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
         request = GetOperationsSummaryRequest(account_id=account_id)
         return self.get_operations_summary_api(request)
 
+    def get_operations_summary_future(self, account_id: str) -> Future:
+        request = GetOperationsSummaryRequest(account_id=account_id)
+        return self.get_operations_summary_future_api(request)
+
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
         request = MakeFeeOperationRequest(
             account_id=account_id,
@@ -233,6 +263,18 @@ def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     return OperationsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
 
+def build_operations_gateway_async_grpc_client() -> OperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsGatewayGRPCClient поверх асинхронного канала grpc.aio.
+
+    Методы такого клиента возвращают awaitable-объекты вызовов вместо готовых ответов.
+    Канал привязывается к текущему event loop, поэтому клиент нужно создавать внутри него.
+
+    :return: Инициализированный асинхронный клиент для OperationsGatewayService.
+    """
+    return OperationsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
 def build_operations_gateway_locust_grpc_client(environment: Environment) -> OperationsGatewayGRPCClient:
     """
     Функция создаёт экземпляр OperationsGatewayGRPCClient адаптированного под Locust.
@@ -2,7 +2,11 @@ from grpc import Channel
 from locust.env import Environment
 
 from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_async_grpc_client,
+    build_gateway_locust_grpc_client
+)
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
 from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
 from contracts.services.gateway.users.users_gateway_service_pb2_grpc import UsersGatewayServiceStub
@@ -78,6 +82,18 @@ def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
     return UsersGatewayGRPCClient(channel=build_gateway_grpc_client())
 
 
+def build_users_gateway_async_grpc_client() -> UsersGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра UsersGatewayGRPCClient поверх асинхронного канала grpc.aio.
+
+    Методы такого клиента возвращают awaitable-объекты вызовов вместо готовых ответов.
+    Канал привязывается к текущему event loop, поэтому клиент нужно создавать внутри него.
+
+    :return: Инициализированный асинхронный клиент для UsersGatewayService.
+    """
+    return UsersGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
 def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGatewayGRPCClient:
     """
     Функция создаёт экземпляр UsersGatewayGRPCClient адаптированного под Locust.
@@ -1,13 +1,131 @@
 import time
 
-from grpc import RpcError, UnaryUnaryClientInterceptor
+from grpc import (
+    Call,
+    Future,
+    RpcError,
+    FutureCancelledError,
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor
+)
 from locust.env import Environment
 
+from tools.metrics.corrected import CorrectedLatencyRecorder, build_corrected_latency_recorder, take_schedule_delay
+from tools.metrics.reporter import build_report_request
 
-class LocustInterceptor(UnaryUnaryClientInterceptor):
+
+class LocustResponseStream:
+    """
+    Обёртка над потоковым ответом gRPC, собирающая метрики по мере чтения сообщений.
+
+    В Locust регистрируются отдельные записи:
+    - "gRPC:first-message" — время от начала вызова до получения первого сообщения;
+    - "gRPC:message" — интервал между соседними сообщениями (по записи на каждое сообщение);
+    - "gRPC" — полная длительность стрима и суммарный объём полученных данных
+      ("gRPC:corrected", если передан recorder, регистрируется только в HDR статистике и Prometheus).
+
+    Все остальные атрибуты (cancel, code, details, trailing_metadata и т.д.)
+    проксируются на исходный объект вызова.
+    """
+
+    def __init__(
+            self,
+            environment: Environment,
+            call: Call,
+            method: str,
+            start_time: float,
+            recorder: CorrectedLatencyRecorder | None = None,
+            schedule_delay: float | None = None
+    ):
+        """
+        :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        :param call: Исходный объект потокового вызова (итератор сообщений).
+        :param method: Полное имя gRPC метода.
+        :param start_time: Момент начала вызова (time.perf_counter()).
+        :param recorder: Регистратор скорректированной задержки (None — не регистрировать).
+        :param schedule_delay: Опоздание старта итерации на момент вызова (см. take_schedule_delay).
+        """
+        self.environment = environment
+        self.call = call
+        self.method = method
+        self.start_time = start_time
+        self.recorder = recorder
+        self.schedule_delay = schedule_delay
+        self.report = build_report_request(environment)
+
+        self.last_message_time: float | None = None
+        self.response_length = 0
+        self.finished = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            message = next(self.call)
+        except StopIteration:
+            self.finish(None)
+            raise
+        except RpcError as error:
+            self.finish(error)
+            raise
+
+        now = time.perf_counter()
+        if self.last_message_time is None:
+            self.fire("gRPC:first-message", now - self.start_time, message.ByteSize())
+        else:
+            self.fire("gRPC:message", now - self.last_message_time, message.ByteSize())
+
+        self.last_message_time = now
+        self.response_length += message.ByteSize()
+
+        return message
+
+    def __getattr__(self, name: str):
+        return getattr(self.call, name)
+
+    def fire(self, request_type: str, elapsed: float, response_length: int, exception: Exception | None = None):
+        self.report(request_type, self.method, elapsed * 1000, response_length, exception, response=self.call)
+
+    def finish(self, exception: RpcError | None) -> None:
+        """
+        Регистрирует завершение стрима: полную длительность и суммарный объём данных.
+
+        :param exception: Ошибка, которой завершился стрим, или None при успешном завершении.
+        """
+        if self.finished:
+            return
+
+        self.finished = True
+        elapsed = time.perf_counter() - self.start_time
+        self.fire("gRPC", elapsed, self.response_length, exception)
+
+        if self.recorder is not None:
+            self.recorder.record("gRPC", self.method, elapsed * 1000, self.schedule_delay)
+
+
+class LocustInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor
+):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+
+    Интерцептор не дожидается результата вызова: время и размер ответа фиксируются
+    в callback'е, который gRPC вызывает по завершении RPC. Благодаря этому вызовы через
+    .future() не блокируются на уровне интерцептора и могут выполняться параллельно.
+
+    Для вызовов с потоковым ответом метрики собираются при чтении стрима (см. LocustResponseStream).
+    Метрики регистрируются через build_report_request (пакетно через RequestEventReporter или events.request).
+
+    Если включена запись скорректированной задержки, для записи "gRPC" дополнительно регистрируется
+    "gRPC:corrected" вне статистики Locust (см. CorrectedLatencyRecorder). Опоздание старта итерации
+    читается в момент вызова, так как callback завершения выполняется вне гринлета виртуального пользователя.
     """
 
     def __init__(self, environment: Environment):
@@ -15,6 +133,8 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
         """
         self.environment = environment
+        self.recorder = build_corrected_latency_recorder(environment)
+        self.report = build_report_request(environment)
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """
@@ -25,25 +145,98 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param request: Объект запроса, отправляемый на сервер.
         :return: gRPC response (future объект).
         """
-        response = None
-        exception: RpcError | None = None
         start_time = time.perf_counter()
-        response_length = 0
+
+        schedule_delay = take_schedule_delay()
+
+        response = continuation(client_call_details, request)
+        response.add_done_callback(
+            lambda future: self.on_unary_done(future, client_call_details.method, start_time, schedule_delay)
+        )
+
+        return response
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-stream gRPC вызовов (потоковый ответ сервера).
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Итератор сообщений ответа с подсчётом метрик.
+        """
+        start_time = time.perf_counter()
+
+        schedule_delay = take_schedule_delay()
+
+        response = continuation(client_call_details, request)
+        return LocustResponseStream(
+            self.environment, response, client_call_details.method, start_time, self.recorder, schedule_delay
+        )
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-unary gRPC вызовов (потоковый запрос клиента).
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request_iterator: Итератор сообщений запроса.
+        :return: gRPC response (future объект).
+        """
+        start_time = time.perf_counter()
+
+        schedule_delay = take_schedule_delay()
+
+        response = continuation(client_call_details, request_iterator)
+        response.add_done_callback(
+            lambda future: self.on_unary_done(future, client_call_details.method, start_time, schedule_delay)
+        )
+
+        return response
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-stream gRPC вызовов (двунаправленный стрим).
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request_iterator: Итератор сообщений запроса.
+        :return: Итератор сообщений ответа с подсчётом метрик.
+        """
+        start_time = time.perf_counter()
+
+        schedule_delay = take_schedule_delay()
+
+        response = continuation(client_call_details, request_iterator)
+        return LocustResponseStream(
+            self.environment, response, client_call_details.method, start_time, self.recorder, schedule_delay
+        )
+
+    def on_unary_done(
+            self,
+            future: Future,
+            method: str,
+            start_time: float,
+            schedule_delay: float | None = None
+    ) -> None:
+        """
+        Callback завершения вызова с одиночным ответом: регистрирует вызов в статистике Locust.
+
+        :param future: Завершённый gRPC вызов.
+        :param method: Полное имя gRPC метода.
+        :param start_time: Момент начала вызова (time.perf_counter()).
+        :param schedule_delay: Опоздание старта итерации на момент вызова (см. take_schedule_delay).
+        """
+        response_time = (time.perf_counter() - start_time) * 1000
 
         try:
-            response = continuation(client_call_details, request)
-            response_length = response.result().ByteSize()
-        except RpcError as error:
+            exception = future.exception()
+        except FutureCancelledError as error:
             exception = error
 
-        self.environment.events.request.fire(
-            name=client_call_details.method,
-            context=None,
-            response=response,
-            exception=exception,
-            request_type="gRPC",
-            response_time=(time.perf_counter() - start_time) * 1000,
-            response_length=response_length,
-        )
+        response_length = future.result().ByteSize() if exception is None else 0
+
+        self.report("gRPC", method, response_time, response_length, exception, response=future)
 
-        return response
\ No newline at end of file
+        if self.recorder is not None:
+            self.recorder.record("gRPC", method, response_time, schedule_delay)
@@ -1,6 +1,13 @@
-from typing import Any, TypedDict
+from typing import Any, TypedDict, TypeVar
 
-from httpx import Client, URL, Response, QueryParams
+from httpx import AsyncClient, Client, URL, Response, QueryParams
+from pydantic import BaseModel
+
+from clients.http.parsing import parse_response
+from clients.http.serializers import JSON_HEADERS
+from tools.config.http import HTTPParseMode
+
+T = TypeVar("T", bound=BaseModel)
 
 
 class HTTPClientExtension(TypedDict, total=False):
@@ -15,16 +22,30 @@ class HTTPClient:
     """
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
-    :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    Если передан httpx.AsyncClient, методы get/post возвращают корутины (см. Async*GatewayHTTPClient).
+
+    :param client: экземпляр httpx.Client (или httpx.AsyncClient) для выполнения HTTP-запросов
+    :param parse_mode: режим разбора ответов (см. HTTPParseMode)
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: Client | AsyncClient, parse_mode: HTTPParseMode = HTTPParseMode.FULL) -> None:
         self.client = client
+        self.parse_mode = parse_mode
+
+    def parse(self, schema: type[T], response: Response) -> T:
+        """
+        Разбирает тело ответа pydantic-схемой в режиме клиента (parse_mode).
+
+        :param schema: Pydantic-схема ответа.
+        :param response: Объект Response.
+        :return: Ответ в виде схемы (или объекта с теми же атрибутами в режимах LAZY и FIELDS).
+        """
+        return parse_response(schema, response.content, self.parse_mode)
 
     def get(
             self,
             url: str | URL,
-            params: QueryParams | None = None,
+            params: QueryParams | dict[str, Any] | None = None,
             extensions: HTTPClientExtensions | None = None
     ) -> Response:
         """
@@ -41,6 +62,7 @@ class HTTPClient:
             self,
             url: str | URL,
             json: Any | None = None,
+            content: bytes | None = None,
             extensions: HTTPClientExtensions | None = None
     ) -> Response:
         """
@@ -48,7 +70,11 @@ class HTTPClient:
 
         :param url: URL-адрес эндпоинта.
         :param json: Данные в формате JSON.
+        :param content: Готовое тело запроса в формате JSON (см. build_json_serializer), альтернатива json.
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
+        if content is not None:
+            return self.client.post(url=url, content=content, headers=JSON_HEADERS, extensions=extensions)
+
         return self.client.post(url=url, json=json, extensions=extensions)
\ No newline at end of file
@@ -3,30 +3,59 @@ import time
 from httpx import Request, Response, HTTPStatusError, HTTPError
 from locust.env import Environment
 
+from clients.http.transports.instrumented_transport import HTTPRequestTimings
+from tools.metrics.corrected import build_corrected_latency_recorder, take_schedule_delay
+from tools.metrics.reporter import build_report_metric, build_report_request
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    Сохраняет момент отправки запроса в `request.extensions["start_time"]`
+    (монотонные часы time.perf_counter_ns(), наносекунды), чтобы потом использовать его для расчёта времени ответа,
+    а опоздание старта итерации виртуального пользователя — в `request.extensions["schedule_delay"]`.
     """
-    request.extensions["start_time"] = time.time()
+    request.extensions["start_time"] = time.perf_counter_ns()
+    request.extensions["schedule_delay"] = take_schedule_delay()
 
 
 def locust_response_event_hook(environment: Environment):
     """
     Возвращает HTTPX event hook, вызываемый после получения ответа.
 
-    Использует `request.extensions["start_time"]` для вычисления времени отклика.
+    Хук вызывается, когда получены статус и заголовки, но тело ещё не прочитано, поэтому он
+    дочитывает тело сам. В статистике Locust каждый запрос — ровно одна запись "HTTP": полное время запроса
+    до получения тела целиком, длина ответа и ошибка. Разбивка времени регистрируется дополнительными
+    метриками (build_report_metric), которые попадают в HDR статистику и Prometheus, но не в статистику Locust:
+    - "HTTP:headers" — время от отправки запроса до получения заголовков (время сервера и сети);
+    - "HTTP:body" — время чтения тела ответа (передача данных).
+
+    Длина ответа — количество байт, полученных из сети (num_bytes_downloaded), без копирования
+    и декодирования тела. Прочитанное тело кэшируется в response.content, поэтому клиенты
+    валидируют схемы прямо из байт (model_validate_json(response.content)), не создавая response.text.
+
+    Если запрос прошёл через InstrumentedHTTPTransport (`request.extensions["timings"]`), тем же путём
+    регистрируются фазы установки соединения "HTTP:dns", "HTTP:connect" и "HTTP:tls" (только для новых
+    соединений), а в context записи "HTTP" передаётся connection_reused.
+
+    Если включена запись скорректированной задержки (LOCUST_USER.CORRECTED_LATENCY), для записи "HTTP"
+    тем же путём регистрируется "HTTP:corrected" (см. CorrectedLatencyRecorder).
+
+    Время считается по монотонным часам time.perf_counter_ns() от `request.extensions["start_time"]`.
     Извлекает route из `request.extensions["route"]`, если задан.
-    Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
+    Отправляет собранные метрики в статистику Locust через build_report_request: в кольцевой буфер
+    RequestEventReporter (METRICS.BATCH_REPORTING) или синхронно в `environment.events.request`.
 
     :param environment: Объект окружения Locust, через который отправляются метрики.
     :return: Функция-хук для HTTPX response event hook.
     """
+    recorder = build_corrected_latency_recorder(environment)
+    report = build_report_request(environment)
+    report_metric = build_report_metric(environment)
 
     def inner(response: Response) -> None:
+        headers_time = time.perf_counter_ns()
         exception: HTTPError | HTTPStatusError | None = None
 
         try:
@@ -37,18 +66,36 @@ def locust_response_event_hook(environment: Environment):
         request = response.request
 
         route = request.extensions.get("route", request.url.path)
-        start_time = request.extensions.get("start_time", time.time())
-        response_time = (time.time() - start_time) * 1000
-        response_length = len(response.read())
-
-        environment.events.request.fire(
-            name=f"{request.method} {route}",
-            context=None,
-            response=response,
-            exception=exception,
-            request_type="HTTP",
-            response_time=response_time,
-            response_length=response_length,
-        )
-
-    return inner
\ No newline at end of file
+        start_time = request.extensions.get("start_time", headers_time)
+        response.read()
+        body_time = time.perf_counter_ns()
+        response_length = response.num_bytes_downloaded
+
+        name = f"{request.method} {route}"
+        context = None
+
+        timings: HTTPRequestTimings | None = request.extensions.get("timings")
+        if timings is not None:
+            context = {"connection_reused": timings.connection_reused}
+            phases = (
+                ("HTTP:dns", timings.dns),
+                ("HTTP:connect", timings.connect),
+                ("HTTP:tls", timings.tls),
+            )
+            for request_type, elapsed in phases:
+                if elapsed is not None:
+                    report_metric(request_type, name, elapsed / 1_000_000)
+
+        report_metric("HTTP:headers", name, (headers_time - start_time) / 1_000_000)
+        report_metric("HTTP:body", name, (body_time - headers_time) / 1_000_000)
+        report("HTTP", name, (body_time - start_time) / 1_000_000, response_length, exception, context, response)
+
+        if recorder is not None:
+            recorder.record(
+                request_type="HTTP",
+                name=name,
+                response_time=(body_time - start_time) / 1_000_000,
+                delay=request.extensions.get("schedule_delay")
+            )
+
+    return inner
@@ -16,10 +16,27 @@ from clients.http.gateway.accounts.schema import (
 )
 from clients.http.gateway.client import (
     build_gateway_http_client,
+    build_gateway_async_http_client,
     build_gateway_locust_http_client
 )
+from clients.http.serializers import build_json_serializer, build_query_serializer
+from clients.http.transports.pooled_transport import PooledHTTPTransport
+from config import settings
 from tools.routes import APIRoutes
 
+# Маршруты и сериализаторы запросов вычисляются один раз при импорте модуля
+ACCOUNTS_URL = str(APIRoutes.ACCOUNTS)
+OPEN_DEPOSIT_ACCOUNT_URL = f"{APIRoutes.ACCOUNTS}/open-deposit-account"
+OPEN_SAVINGS_ACCOUNT_URL = f"{APIRoutes.ACCOUNTS}/open-savings-account"
+OPEN_DEBIT_CARD_ACCOUNT_URL = f"{APIRoutes.ACCOUNTS}/open-debit-card-account"
+OPEN_CREDIT_CARD_ACCOUNT_URL = f"{APIRoutes.ACCOUNTS}/open-credit-card-account"
+
+serialize_get_accounts_query = build_query_serializer(GetAccountsQuerySchema)
+serialize_open_deposit_account_request = build_json_serializer(OpenDepositAccountRequestSchema)
+serialize_open_savings_account_request = build_json_serializer(OpenSavingsAccountRequestSchema)
+serialize_open_debit_card_account_request = build_json_serializer(OpenDebitCardAccountRequestSchema)
+serialize_open_credit_card_account_request = build_json_serializer(OpenCreditCardAccountRequestSchema)
+
 
 class AccountsGatewayHTTPClient(HTTPClient):
     """
@@ -34,9 +51,9 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с данными о счетах.
         """
         return self.get(
-            f"{APIRoutes.ACCOUNTS}",
+            ACCOUNTS_URL,
             params=QueryParams(**query.model_dump(by_alias=True)),
-            extensions=HTTPClientExtensions(route=APIRoutes.ACCOUNTS)
+            extensions=HTTPClientExtensions(route=ACCOUNTS_URL)
         )
 
     def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
@@ -47,7 +64,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с результатом операции.
         """
         return self.post(
-            f"{APIRoutes.ACCOUNTS}/open-deposit-account",
+            OPEN_DEPOSIT_ACCOUNT_URL,
             json=request.model_dump(by_alias=True)
         )
 
@@ -59,7 +76,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response.
         """
         return self.post(
-            f"{APIRoutes.ACCOUNTS}/open-savings-account",
+            OPEN_SAVINGS_ACCOUNT_URL,
             json=request.model_dump(by_alias=True)
         )
 
@@ -71,7 +88,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response.
         """
         return self.post(
-            f"{APIRoutes.ACCOUNTS}/open-debit-card-account",
+            OPEN_DEBIT_CARD_ACCOUNT_URL,
             json=request.model_dump(by_alias=True)
         )
 
@@ -83,34 +100,89 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response.
         """
         return self.post(
-            f"{APIRoutes.ACCOUNTS}/open-credit-card-account",
+            OPEN_CREDIT_CARD_ACCOUNT_URL,
             json=request.model_dump(by_alias=True)
         )
 
     def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
-        query = GetAccountsQuerySchema(user_id=user_id)
-        response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        response = self.get(
+            ACCOUNTS_URL,
+            params=serialize_get_accounts_query(user_id=user_id),
+            extensions=HTTPClientExtensions(route=ACCOUNTS_URL)
+        )
+        return self.parse(GetAccountsResponseSchema, response)
 
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
-        request = OpenDepositAccountRequestSchema(user_id=user_id)
-        response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        response = self.post(
+            OPEN_DEPOSIT_ACCOUNT_URL,
+            content=serialize_open_deposit_account_request(user_id=user_id)
+        )
+        return self.parse(OpenDepositAccountResponseSchema, response)
 
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
-        request = OpenSavingsAccountRequestSchema(user_id=user_id)
-        response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        response = self.post(
+            OPEN_SAVINGS_ACCOUNT_URL,
+            content=serialize_open_savings_account_request(user_id=user_id)
+        )
+        return self.parse(OpenSavingsAccountResponseSchema, response)
 
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
-        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
-        response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        response = self.post(
+            OPEN_DEBIT_CARD_ACCOUNT_URL,
+            content=serialize_open_debit_card_account_request(user_id=user_id)
+        )
+        return self.parse(OpenDebitCardAccountResponseSchema, response)
 
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
-        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
-        response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        response = self.post(
+            OPEN_CREDIT_CARD_ACCOUNT_URL,
+            content=serialize_open_credit_card_account_request(user_id=user_id)
+        )
+        return self.parse(OpenCreditCardAccountResponseSchema, response)
+
+
+class AsyncAccountsGatewayHTTPClient(AccountsGatewayHTTPClient):
+    """
+    Асинхронный клиент для /api/v1/accounts, работающий поверх httpx.AsyncClient.
+
+    Низкоуровневые *_api методы наследуются без изменений и возвращают корутины.
+    """
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+        response = await self.get(
+            ACCOUNTS_URL,
+            params=serialize_get_accounts_query(user_id=user_id),
+            extensions=HTTPClientExtensions(route=ACCOUNTS_URL)
+        )
+        return self.parse(GetAccountsResponseSchema, response)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+        response = await self.post(
+            OPEN_DEPOSIT_ACCOUNT_URL,
+            content=serialize_open_deposit_account_request(user_id=user_id)
+        )
+        return self.parse(OpenDepositAccountResponseSchema, response)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+        response = await self.post(
+            OPEN_SAVINGS_ACCOUNT_URL,
+            content=serialize_open_savings_account_request(user_id=user_id)
+        )
+        return self.parse(OpenSavingsAccountResponseSchema, response)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+        response = await self.post(
+            OPEN_DEBIT_CARD_ACCOUNT_URL,
+            content=serialize_open_debit_card_account_request(user_id=user_id)
+        )
+        return self.parse(OpenDebitCardAccountResponseSchema, response)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+        response = await self.post(
+            OPEN_CREDIT_CARD_ACCOUNT_URL,
+            content=serialize_open_credit_card_account_request(user_id=user_id)
+        )
+        return self.parse(OpenCreditCardAccountResponseSchema, response)
 
 
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
@@ -122,7 +194,19 @@ def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
     return AccountsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_accounts_gateway_locust_http_client(environment: Environment) -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_async_http_client() -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient поверх httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncAccountsGatewayHTTPClient.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_accounts_gateway_locust_http_client(
+        environment: Environment,
+        transport: PooledHTTPTransport | None = None
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient адаптированного под Locust.
 
@@ -130,6 +214,10 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: общий пул соединений, разделяемый с другими API клиентами.
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return AccountsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport),
+        parse_mode=settings.gateway_http_client.parse_mode
+    )
\ No newline at end of file
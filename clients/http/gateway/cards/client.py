@@ -10,10 +10,21 @@ from clients.http.gateway.cards.schema import (
 )
 from clients.http.gateway.client import (
     build_gateway_http_client,
+    build_gateway_async_http_client,
     build_gateway_locust_http_client
 )
+from clients.http.serializers import build_json_serializer
+from clients.http.transports.pooled_transport import PooledHTTPTransport
+from config import settings
 from tools.routes import APIRoutes
 
+# Маршруты и сериализаторы тел запросов вычисляются один раз при импорте модуля
+ISSUE_VIRTUAL_CARD_URL = f"{APIRoutes.CARDS}/issue-virtual-card"
+ISSUE_PHYSICAL_CARD_URL = f"{APIRoutes.CARDS}/issue-physical-card"
+
+serialize_issue_virtual_card_request = build_json_serializer(IssueVirtualCardRequestSchema)
+serialize_issue_physical_card_request = build_json_serializer(IssuePhysicalCardRequestSchema)
+
 
 class CardsGatewayHTTPClient(HTTPClient):
     """
@@ -28,7 +39,7 @@ class CardsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.post(
-            f"{APIRoutes.CARDS}/issue-virtual-card",
+            ISSUE_VIRTUAL_CARD_URL,
             json=request.model_dump(by_alias=True)
         )
 
@@ -40,19 +51,45 @@ class CardsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.post(
-            f"{APIRoutes.CARDS}/issue-physical-card",
+            ISSUE_PHYSICAL_CARD_URL,
             json=request.model_dump(by_alias=True)
         )
 
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
-        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
-        response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        response = self.post(
+            ISSUE_VIRTUAL_CARD_URL,
+            content=serialize_issue_virtual_card_request(user_id=user_id, account_id=account_id)
+        )
+        return self.parse(IssueVirtualCardResponseSchema, response)
 
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
-        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
-        response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        response = self.post(
+            ISSUE_PHYSICAL_CARD_URL,
+            content=serialize_issue_physical_card_request(user_id=user_id, account_id=account_id)
+        )
+        return self.parse(IssuePhysicalCardResponseSchema, response)
+
+
+class AsyncCardsGatewayHTTPClient(CardsGatewayHTTPClient):
+    """
+    Асинхронный клиент для /api/v1/cards, работающий поверх httpx.AsyncClient.
+
+    Низкоуровневые *_api методы наследуются без изменений и возвращают корутины.
+    """
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+        response = await self.post(
+            ISSUE_VIRTUAL_CARD_URL,
+            content=serialize_issue_virtual_card_request(user_id=user_id, account_id=account_id)
+        )
+        return self.parse(IssueVirtualCardResponseSchema, response)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        response = await self.post(
+            ISSUE_PHYSICAL_CARD_URL,
+            content=serialize_issue_physical_card_request(user_id=user_id, account_id=account_id)
+        )
+        return self.parse(IssuePhysicalCardResponseSchema, response)
 
 
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
@@ -64,7 +101,19 @@ def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
     return CardsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_async_http_client() -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient поверх httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncCardsGatewayHTTPClient.
+    """
+    return AsyncCardsGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        transport: PooledHTTPTransport | None = None
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
@@ -72,6 +121,10 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: общий пул соединений, разделяемый с другими API клиентами.
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return CardsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport),
+        parse_mode=settings.gateway_http_client.parse_mode
+    )
\ No newline at end of file
@@ -1,13 +1,23 @@
 import logging
-from httpx import Client
+from weakref import WeakSet
+
+from httpx import AsyncClient, Client, Limits
 from locust.env import Environment
 
 from clients.http.event_hooks.locust_event_hook import (
     locust_request_event_hook,
     locust_response_event_hook
 )
+from clients.http.transports.instrumented_transport import InstrumentedHTTPTransport
+from clients.http.transports.pooled_transport import PooledHTTPTransport
 from config import settings
 
+# Все пулы соединений, созданные в текущем процессе. Используется для сбора статистики.
+gateway_http_transports: WeakSet[PooledHTTPTransport] = WeakSet()
+
+# Общий на процесс пул соединений (создаётся лениво при первом обращении).
+_shared_gateway_http_transport: PooledHTTPTransport | None = None
+
 
 def build_gateway_http_client() -> Client:
     """
@@ -18,19 +28,85 @@ def build_gateway_http_client() -> Client:
     return Client(timeout=100, base_url=settings.gateway_http_client.client_url)
 
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+def build_gateway_async_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient для сервиса http-gateway.
+
+    Используется асинхронным движком сидинга, лимиты пула соединений берутся из GATEWAY_HTTP_CLIENT.POOL.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    pool = settings.gateway_http_client.pool
+    return AsyncClient(
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url,
+        limits=Limits(
+            max_connections=pool.max_connections,
+            max_keepalive_connections=pool.max_keepalive_connections,
+            keepalive_expiry=pool.keepalive_expiry
+        )
+    )
+
+
+def build_gateway_http_transport() -> PooledHTTPTransport:
+    """
+    Создаёт новый пул соединений к сервису http-gateway с лимитами из настроек.
+    При GATEWAY_HTTP_CLIENT.PHASE_TIMINGS пул дополнительно замеряет фазы каждого запроса.
+
+    :return: Транспорт httpx с собственным пулом соединений.
+    """
+    pool = settings.gateway_http_client.pool
+    transport_class = InstrumentedHTTPTransport if settings.gateway_http_client.phase_timings else PooledHTTPTransport
+    transport = transport_class(
+        limits=Limits(
+            max_connections=pool.max_connections,
+            max_keepalive_connections=pool.max_keepalive_connections,
+            keepalive_expiry=pool.keepalive_expiry
+        )
+    )
+    gateway_http_transports.add(transport)
+    return transport
+
+
+def build_gateway_locust_http_transport() -> PooledHTTPTransport:
+    """
+    Возвращает пул соединений для Locust-клиентов.
+
+    Если в настройках включён общий пул (GATEWAY_HTTP_CLIENT.POOL.SHARED), возвращается один и тот же
+    транспорт на весь процесс — его разделяют все виртуальные пользователи воркера.
+    Иначе создаётся новый транспорт, который разделяют API клиенты одного виртуального пользователя.
+
+    :return: Транспорт httpx, который нужно передать во все API клиенты пользователя.
+    """
+    global _shared_gateway_http_transport
+
+    if not settings.gateway_http_client.pool.shared:
+        return build_gateway_http_transport()
+
+    if _shared_gateway_http_transport is None:
+        _shared_gateway_http_transport = build_gateway_http_transport()
+
+    return _shared_gateway_http_transport
+
+
+def build_gateway_locust_http_client(
+        environment: Environment,
+        transport: PooledHTTPTransport | None = None
+) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
     Отличается от обычного клиента тем, что:
     - добавляет хук `locust_request_event_hook` для фиксации времени начала запроса,
     - добавляет хук `locust_response_event_hook`, который вычисляет метрики
-    (время ответа, длину ответа и т.д.) и отправляет их в Locust через `environment.events.request`.
+    (время ответа, длину ответа и т.д.) и отправляет их в Locust через `environment.events.request`,
+    - работает поверх общего пула соединений, поэтому не открывает собственных TCP-соединений.
 
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param transport: Пул соединений. Если не передан, используется build_gateway_locust_http_transport().
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -38,8 +114,9 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     return Client(
         timeout=settings.gateway_http_client.timeout,
         base_url=settings.gateway_http_client.client_url,
+        transport=transport or build_gateway_locust_http_transport(),
         event_hooks={
             "request": [locust_request_event_hook],
             "response": [locust_response_event_hook(environment)]
         }
-    )
\ No newline at end of file
+    )
@@ -4,8 +4,16 @@ from locust.env import Environment
 from clients.http.client import HTTPClient, HTTPClientExtensions
 from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
 from clients.http.gateway.documents.schema import GetTariffDocumentResponseSchema, GetContractDocumentResponseSchema
+from clients.http.transports.pooled_transport import PooledHTTPTransport
+from config import settings
 from tools.routes import APIRoutes
 
+# Маршруты вычисляются один раз при импорте модуля
+TARIFF_DOCUMENT_URL = f"{APIRoutes.DOCUMENTS}/tariff-document"
+CONTRACT_DOCUMENT_URL = f"{APIRoutes.DOCUMENTS}/contract-document"
+TARIFF_DOCUMENT_ROUTE = f"{TARIFF_DOCUMENT_URL}/{{account_id}}"
+CONTRACT_DOCUMENT_ROUTE = f"{CONTRACT_DOCUMENT_URL}/{{account_id}}"
+
 
 class DocumentsGatewayHTTPClient(HTTPClient):
     """
@@ -20,8 +28,8 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.get(
-            f"{APIRoutes.DOCUMENTS}/tariff-document/{account_id}",
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/tariff-document/{{account_id}}")
+            f"{TARIFF_DOCUMENT_URL}/{account_id}",
+            extensions=HTTPClientExtensions(route=TARIFF_DOCUMENT_ROUTE)
         )
 
     def get_contract_document_api(self, account_id: str) -> Response:
@@ -32,8 +40,8 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.get(
-            f"{APIRoutes.DOCUMENTS}/contract-document/{account_id}",
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/contract-document/{{account_id}}")
+            f"{CONTRACT_DOCUMENT_URL}/{account_id}",
+            extensions=HTTPClientExtensions(route=CONTRACT_DOCUMENT_ROUTE)
         )
 
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
@@ -44,7 +52,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект GetTariffDocumentResponseSchema).
         """
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse(GetTariffDocumentResponseSchema, response)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         """
@@ -54,7 +62,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект GetContractDocumentResponseSchema).
         """
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse(GetContractDocumentResponseSchema, response)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
@@ -66,7 +74,10 @@ def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
     return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        transport: PooledHTTPTransport | None = None
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient адаптированного под Locust.
 
@@ -74,6 +85,10 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: общий пул соединений, разделяемый с другими API клиентами.
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return DocumentsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport),
+        parse_mode=settings.gateway_http_client.parse_mode
+    )
\ No newline at end of file
@@ -1,7 +1,9 @@
-from locust import TaskSet, SequentialTaskSet
+from locust import TaskSet, SequentialTaskSet, events
+from locust.env import Environment
 
 from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
 from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
+from clients.http.gateway.client import build_gateway_locust_http_transport, gateway_http_transports
 from clients.http.gateway.documents.client import (
     DocumentsGatewayHTTPClient,
     build_documents_gateway_locust_http_client
@@ -11,9 +13,29 @@ from clients.http.gateway.operations.client import (
     build_operations_gateway_locust_http_client
 )
 from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from tools.locust.open_model import OpenModelTaskSetMixin
+from tools.logger import get_logger
 
+logger = get_logger("GATEWAY_HTTP_POOL")
 
-class GatewayHTTPTaskSet(TaskSet):
+
+@events.test_stop.add_listener
+def log_gateway_http_pool_stats(environment: Environment, **kwargs):
+    """
+    По завершении теста выводит сводную статистику пулов соединений к http-gateway:
+    сколько соединений было создано и сколько запросов ушло по переиспользованным соединениям.
+    """
+    transports = list(gateway_http_transports)
+    created = sum(transport.stats.created for transport in transports)
+    reused = sum(transport.stats.reused for transport in transports)
+    opened = sum(transport.connections_open for transport in transports)
+
+    logger.info(
+        f"Pools: {len(transports)}, connections open: {opened}, created: {created}, reused: {reused}"
+    )
+
+
+class GatewayHTTPTaskSet(OpenModelTaskSetMixin, TaskSet):
     """
     Базовый TaskSet для HTTP-сценариев, работающих с http-gateway.
 
@@ -32,15 +54,18 @@ class GatewayHTTPTaskSet(TaskSet):
         """
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
+        Все клиенты работают поверх одного пула соединений.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        transport = build_gateway_locust_http_transport()
 
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, transport)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, transport)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, transport)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, transport)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, transport)
 
-class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
+
+class GatewayHTTPSequentialTaskSet(OpenModelTaskSetMixin, SequentialTaskSet):
     """
     Базовый SequentialTaskSet для HTTP-сценариев, где важен порядок выполнения задач.
 
@@ -58,8 +83,10 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
\ No newline at end of file
+        transport = build_gateway_locust_http_transport()
+
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, transport)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, transport)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, transport)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, transport)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, transport)
\ No newline at end of file
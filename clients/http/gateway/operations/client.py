@@ -2,7 +2,7 @@ from httpx import QueryParams, Response
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.gateway.client import build_gateway_http_client, build_gateway_async_http_client, build_gateway_locust_http_client
 from clients.http.gateway.operations.schema import GetOperationsQuerySchema, GetOperationsSummaryQuerySchema, \
     MakeOperationRequestSchema, MakePurchaseOperationRequestSchema, GetOperationResponseSchema, \
     GetOperationReceiptResponseSchema, GetOperationsResponseSchema, OperationsSummaryResponseSchema, \
@@ -11,8 +11,35 @@ from clients.http.gateway.operations.schema import GetOperationsQuerySchema, Get
     MakeCashWithdrawalOperationResponseSchema, MakeCashWithdrawalOperationRequestSchema, \
     MakeBillPaymentOperationRequestSchema, MakeTransferOperationRequestSchema, MakeCashBackOperationRequestSchema, \
     MakeTopUpOperationRequestSchema, MakeFeeOperationRequestSchema
+from clients.http.serializers import build_json_serializer, build_query_serializer
+from clients.http.transports.pooled_transport import PooledHTTPTransport
+from config import settings
 from tools.routes import APIRoutes
 
+# Маршруты и сериализаторы запросов вычисляются один раз при импорте модуля
+OPERATIONS_URL = str(APIRoutes.OPERATIONS)
+OPERATION_RECEIPT_URL = f"{APIRoutes.OPERATIONS}/operation-receipt"
+OPERATIONS_SUMMARY_URL = f"{APIRoutes.OPERATIONS}/operations-summary"
+GET_OPERATION_ROUTE = f"{APIRoutes.OPERATIONS}/{{operation_id}}"
+GET_OPERATION_RECEIPT_ROUTE = f"{OPERATION_RECEIPT_URL}/{{operation_id}}"
+MAKE_FEE_OPERATION_URL = f"{APIRoutes.OPERATIONS}/make-fee-operation"
+MAKE_TOP_UP_OPERATION_URL = f"{APIRoutes.OPERATIONS}/make-top-up-operation"
+MAKE_CASHBACK_OPERATION_URL = f"{APIRoutes.OPERATIONS}/make-cashback-operation"
+MAKE_TRANSFER_OPERATION_URL = f"{APIRoutes.OPERATIONS}/make-transfer-operation"
+MAKE_PURCHASE_OPERATION_URL = f"{APIRoutes.OPERATIONS}/make-purchase-operation"
+MAKE_BILL_PAYMENT_OPERATION_URL = f"{APIRoutes.OPERATIONS}/make-bill-payment-operation"
+MAKE_CASH_WITHDRAWAL_OPERATION_URL = f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation"
+
+serialize_get_operations_query = build_query_serializer(GetOperationsQuerySchema)
+serialize_get_operations_summary_query = build_query_serializer(GetOperationsSummaryQuerySchema)
+serialize_make_fee_operation_request = build_json_serializer(MakeFeeOperationRequestSchema)
+serialize_make_top_up_operation_request = build_json_serializer(MakeTopUpOperationRequestSchema)
+serialize_make_cashback_operation_request = build_json_serializer(MakeCashBackOperationRequestSchema)
+serialize_make_transfer_operation_request = build_json_serializer(MakeTransferOperationRequestSchema)
+serialize_make_purchase_operation_request = build_json_serializer(MakePurchaseOperationRequestSchema)
+serialize_make_bill_payment_operation_request = build_json_serializer(MakeBillPaymentOperationRequestSchema)
+serialize_make_cash_withdrawal_operation_request = build_json_serializer(MakeCashWithdrawalOperationRequestSchema)
+
 
 class OperationsGatewayHTTPClient(HTTPClient):
     """
@@ -27,8 +54,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с данными о счетах.
         """
         return self.get(
-            url=f"{APIRoutes.OPERATIONS}/{operation_id}",
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/{{operation_id}}")
+            url=f"{OPERATIONS_URL}/{operation_id}",
+            extensions=HTTPClientExtensions(route=GET_OPERATION_ROUTE)
         )
 
     def get_operation_receipt_api(self, operation_id: str) -> Response:
@@ -39,8 +66,8 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с данными о счетах.
         """
         return self.get(
-            url=f"{APIRoutes.OPERATIONS}/operation-receipt/{operation_id}",
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operation-receipt/{{operation_id}}")
+            url=f"{OPERATION_RECEIPT_URL}/{operation_id}",
+            extensions=HTTPClientExtensions(route=GET_OPERATION_RECEIPT_ROUTE)
         )
 
     def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
@@ -51,9 +78,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с данными о счетах.
         """
         return self.get(
-            url=f"{APIRoutes.OPERATIONS}",
+            url=OPERATIONS_URL,
             params=QueryParams(**query.model_dump(by_alias=True)),
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}")
+            extensions=HTTPClientExtensions(route=OPERATIONS_URL)
         )
 
     def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
@@ -64,9 +91,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Объект httpx.Response с данными о счетах.
         """
         return self.get(
-            url=f"{APIRoutes.OPERATIONS}/operations-summary",
+            url=OPERATIONS_SUMMARY_URL,
             params=QueryParams(**query.model_dump(by_alias=True)),
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operations-summary")
+            extensions=HTTPClientExtensions(route=OPERATIONS_SUMMARY_URL)
         )
 
     def make_fee_operation_api(self, request: MakeOperationRequestSchema) -> Response:
@@ -76,7 +103,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с параметрами запроса.
         :return: Объект httpx.Response.
         """
-        return self.post(url=f"{APIRoutes.OPERATIONS}/make-fee-operation", json=request.model_dump(by_alias=True))
+        return self.post(url=MAKE_FEE_OPERATION_URL, json=request.model_dump(by_alias=True))
 
     def make_top_up_operation_api(self, request: MakeOperationRequestSchema) -> Response:
         """
@@ -85,7 +112,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с параметрами запроса.
         :return: Объект httpx.Response.
         """
-        return self.post(url=f"{APIRoutes.OPERATIONS}/make-top-up-operation", json=request.model_dump(by_alias=True))
+        return self.post(url=MAKE_TOP_UP_OPERATION_URL, json=request.model_dump(by_alias=True))
 
     def make_cashback_operation_api(self, request: MakeOperationRequestSchema) -> Response:
         """
@@ -94,7 +121,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с параметрами запроса.
         :return: Объект httpx.Response.
         """
-        return self.post(url=f"{APIRoutes.OPERATIONS}/make-cashback-operation", json=request.model_dump(by_alias=True))
+        return self.post(url=MAKE_CASHBACK_OPERATION_URL, json=request.model_dump(by_alias=True))
 
     def make_transfer_operation_api(self, request: MakeOperationRequestSchema) -> Response:
         """
@@ -103,7 +130,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с параметрами запроса.
         :return: Объект httpx.Response.
         """
-        return self.post(url=f"{APIRoutes.OPERATIONS}/make-transfer-operation", json=request.model_dump(by_alias=True))
+        return self.post(url=MAKE_TRANSFER_OPERATION_URL, json=request.model_dump(by_alias=True))
 
     def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
         """
@@ -112,7 +139,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с параметрами запроса.
         :return: Объект httpx.Response.
         """
-        return self.post(url=f"{APIRoutes.OPERATIONS}/make-purchase-operation", json=request.model_dump(by_alias=True))
+        return self.post(url=MAKE_PURCHASE_OPERATION_URL, json=request.model_dump(by_alias=True))
 
     def make_bill_payment_operation_api(self, request: MakeOperationRequestSchema) -> Response:
         """
@@ -121,7 +148,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с параметрами запроса.
         :return: Объект httpx.Response.
         """
-        return self.post(url=f"{APIRoutes.OPERATIONS}/make-bill-payment-operation", json=request.model_dump(by_alias=True))
+        return self.post(url=MAKE_BILL_PAYMENT_OPERATION_URL, json=request.model_dump(by_alias=True))
 
     def make_cash_withdrawal_operation_api(self, request: MakeOperationRequestSchema) -> Response:
         """
@@ -130,85 +157,117 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Словарь с параметрами запроса.
         :return: Объект httpx.Response.
         """
-        return self.post(url=f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation", json=request.model_dump(by_alias=True))
+        return self.post(url=MAKE_CASH_WITHDRAWAL_OPERATION_URL, json=request.model_dump(by_alias=True))
 
     def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
         response = self.get_operation_api(operation_id=operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(GetOperationResponseSchema, response)
 
     def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
         response = self.get_operation_receipt_api(operation_id=operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.parse(GetOperationReceiptResponseSchema, response)
 
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
-        query = GetOperationsQuerySchema(
-            account_id=account_id
+        response = self.get(
+            url=OPERATIONS_URL,
+            params=serialize_get_operations_query(account_id=account_id),
+            extensions=HTTPClientExtensions(route=OPERATIONS_URL)
         )
-        response = self.get_operations_api(query=query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.parse(GetOperationsResponseSchema, response)
 
     def get_operations_summary(self, account_id: str) -> OperationsSummaryResponseSchema:
-        query = GetOperationsSummaryQuerySchema(
-            account_id=account_id
+        response = self.get(
+            url=OPERATIONS_SUMMARY_URL,
+            params=serialize_get_operations_summary_query(account_id=account_id),
+            extensions=HTTPClientExtensions(route=OPERATIONS_SUMMARY_URL)
         )
-        response = self.get_operations_summary_api(query=query)
-        return OperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.parse(OperationsSummaryResponseSchema, response)
 
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
-        request = MakeFeeOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            url=MAKE_FEE_OPERATION_URL,
+            content=serialize_make_fee_operation_request(card_id=card_id, account_id=account_id)
         )
-        response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(MakeFeeOperationResponseSchema, response)
 
     def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
-        request = MakeTopUpOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            url=MAKE_TOP_UP_OPERATION_URL,
+            content=serialize_make_top_up_operation_request(card_id=card_id, account_id=account_id)
         )
-        response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(MakeTopUpOperationResponseSchema, response)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashBackOperationResponseSchema:
-        request = MakeCashBackOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            url=MAKE_CASHBACK_OPERATION_URL,
+            content=serialize_make_cashback_operation_request(card_id=card_id, account_id=account_id)
         )
-        response = self.make_cashback_operation_api(request)
-        return MakeCashBackOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(MakeCashBackOperationResponseSchema, response)
 
     def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
-        request = MakeTransferOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            url=MAKE_TRANSFER_OPERATION_URL,
+            content=serialize_make_transfer_operation_request(card_id=card_id, account_id=account_id)
         )
-        response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(MakeTransferOperationResponseSchema, response)
 
     def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchasesOperationResponseSchema:
-        request = MakePurchaseOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            url=MAKE_PURCHASE_OPERATION_URL,
+            content=serialize_make_purchase_operation_request(card_id=card_id, account_id=account_id)
         )
-        response = self.make_purchase_operation_api(request)
-        return MakePurchasesOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(MakePurchasesOperationResponseSchema, response)
 
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
-        request = MakeBillPaymentOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            url=MAKE_BILL_PAYMENT_OPERATION_URL,
+            content=serialize_make_bill_payment_operation_request(card_id=card_id, account_id=account_id)
         )
-        response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(MakeBillPaymentOperationResponseSchema, response)
 
     def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
-        request = MakeCashWithdrawalOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            url=MAKE_CASH_WITHDRAWAL_OPERATION_URL,
+            content=serialize_make_cash_withdrawal_operation_request(card_id=card_id, account_id=account_id)
+        )
+        return self.parse(MakeCashWithdrawalOperationResponseSchema, response)
+
+
+class AsyncOperationsGatewayHTTPClient(OperationsGatewayHTTPClient):
+    """
+    Асинхронный клиент для /api/v1/operations, работающий поверх httpx.AsyncClient.
+
+    Низкоуровневые *_api методы наследуются без изменений и возвращают корутины.
+    Асинхронные версии есть только у методов, которые используются при сидинге.
+    """
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+        response = await self.post(
+            url=MAKE_TOP_UP_OPERATION_URL,
+            content=serialize_make_top_up_operation_request(card_id=card_id, account_id=account_id)
         )
-        response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(MakeTopUpOperationResponseSchema, response)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
+        response = await self.post(
+            url=MAKE_TRANSFER_OPERATION_URL,
+            content=serialize_make_transfer_operation_request(card_id=card_id, account_id=account_id)
+        )
+        return self.parse(MakeTransferOperationResponseSchema, response)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchasesOperationResponseSchema:
+        response = await self.post(
+            url=MAKE_PURCHASE_OPERATION_URL,
+            content=serialize_make_purchase_operation_request(card_id=card_id, account_id=account_id)
+        )
+        return self.parse(MakePurchasesOperationResponseSchema, response)
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
+        response = await self.post(
+            url=MAKE_CASH_WITHDRAWAL_OPERATION_URL,
+            content=serialize_make_cash_withdrawal_operation_request(card_id=card_id, account_id=account_id)
+        )
+        return self.parse(MakeCashWithdrawalOperationResponseSchema, response)
 
 
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
@@ -220,7 +279,19 @@ def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
     return OperationsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_operations_gateway_locust_http_client(environment: Environment) -> OperationsGatewayHTTPClient:
+def build_operations_gateway_async_http_client() -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient поверх httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncOperationsGatewayHTTPClient.
+    """
+    return AsyncOperationsGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        transport: PooledHTTPTransport | None = None
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient адаптированного под Locust.
 
@@ -228,6 +299,10 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: общий пул соединений, разделяемый с другими API клиентами.
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return OperationsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport),
+        parse_mode=settings.gateway_http_client.parse_mode
+    )
\ No newline at end of file
@@ -229,4 +229,4 @@ class MakePurchaseOperationRequestSchema(MakeOperationRequestSchema):
     """
     Структура данных для создания операции покупки.
     """
-    category: str = Field(alias="lastName", default_factory=fake.category())
\ No newline at end of file
+    category: str = Field(alias="category", default_factory=fake.category)
\ No newline at end of file
@@ -2,10 +2,19 @@ from httpx import Response
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.gateway.client import build_gateway_http_client, build_gateway_async_http_client, build_gateway_locust_http_client
 from clients.http.gateway.users.schema import CreateUserRequestSchema, GetUserResponseSchema, CreateUserResponseSchema
+from clients.http.serializers import build_json_serializer
+from clients.http.transports.pooled_transport import PooledHTTPTransport
+from config import settings
 from tools.routes import APIRoutes
 
+# Маршруты и сериализаторы тел запросов вычисляются один раз при импорте модуля
+USERS_URL = str(APIRoutes.USERS)
+GET_USER_ROUTE = f"{APIRoutes.USERS}/{{user_id}}"
+
+serialize_create_user_request = build_json_serializer(CreateUserRequestSchema)
+
 
 class UsersGatewayHTTPClient(HTTPClient):
     """
@@ -20,8 +29,8 @@ class UsersGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.get(
-            f"/api/v1/users/{user_id}",
-            extensions=HTTPClientExtensions(route=f"{APIRoutes.USERS}/{{user_id}}")
+            f"{USERS_URL}/{user_id}",
+            extensions=HTTPClientExtensions(route=GET_USER_ROUTE)
         )
 
     def create_user_api(self, request: CreateUserRequestSchema) -> Response:
@@ -31,16 +40,31 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными нового пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+        return self.post(USERS_URL, json=request.model_dump(by_alias=True))
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.parse(GetUserResponseSchema, response)
 
     def create_user(self) -> CreateUserResponseSchema:
-        request = CreateUserRequestSchema()
-        response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        response = self.post(USERS_URL, content=serialize_create_user_request())
+        return self.parse(CreateUserResponseSchema, response)
+
+
+class AsyncUsersGatewayHTTPClient(UsersGatewayHTTPClient):
+    """
+    Асинхронный клиент для /api/v1/users, работающий поверх httpx.AsyncClient.
+
+    Низкоуровневые *_api методы наследуются без изменений и возвращают корутины.
+    """
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_user_api(user_id)
+        return self.parse(GetUserResponseSchema, response)
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        response = await self.post(USERS_URL, content=serialize_create_user_request())
+        return self.parse(CreateUserResponseSchema, response)
 
 
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
@@ -52,7 +76,19 @@ def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
     return UsersGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_async_http_client() -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient поверх httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncUsersGatewayHTTPClient.
+    """
+    return AsyncUsersGatewayHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        transport: PooledHTTPTransport | None = None
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -60,6 +96,10 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param transport: общий пул соединений, разделяемый с другими API клиентами.
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return UsersGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport),
+        parse_mode=settings.gateway_http_client.parse_mode
+    )
\ No newline at end of file
@@ -0,0 +1,121 @@
+from functools import lru_cache
+from typing import Any, TypeVar, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from tools.config.http import HTTPParseMode
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def get_schema_fields(schema: type[BaseModel]) -> dict[str, tuple[str, type[BaseModel] | None]]:
+    """
+    Строит карту полей схемы: имя атрибута -> (ключ в JSON, вложенная схема или None).
+
+    Вложенная схема определяется для полей вида `Schema` и `list[Schema]`. Результат кэшируется,
+    поэтому карта строится один раз на схему.
+
+    :param schema: Pydantic-схема ответа.
+    :return: Карта полей схемы.
+    """
+    fields = {}
+    for name, field in schema.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) is list:
+            annotation = get_args(annotation)[0]
+
+        nested = annotation if isinstance(annotation, type) and issubclass(annotation, BaseModel) else None
+        fields[name] = (field.alias or name, nested)
+
+    return fields
+
+
+class LazyResponse:
+    """
+    Ответ, который валидируется схемой только при первом обращении к атрибуту.
+
+    Если сценарий не читает ответ (например, задача только нагружает GET-эндпоинт),
+    тело ответа вообще не разбирается.
+    """
+    __slots__ = ("_schema", "_content", "_model")
+
+    def __init__(self, schema: type[BaseModel], content: bytes):
+        """
+        :param schema: Pydantic-схема ответа.
+        :param content: Тело ответа в байтах.
+        """
+        self._schema = schema
+        self._content = content
+        self._model: BaseModel | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._model is None:
+            self._model = self._schema.model_validate_json(self._content)
+
+        return getattr(self._model, name)
+
+    def __repr__(self) -> str:
+        return f"LazyResponse({self._schema.__name__})"
+
+
+class FieldsResponse:
+    """
+    Представление JSON-ответа с доступом к полям по именам атрибутов схемы, без валидации.
+
+    JSON разбирается один раз (pydantic_core.from_json), а значения читаются только для тех полей,
+    к которым обращается сценарий. Типы не приводятся: даты, перечисления и числа возвращаются
+    в том виде, в котором пришли в JSON.
+    """
+    __slots__ = ("_schema", "_data")
+
+    def __init__(self, schema: type[BaseModel], data: dict):
+        """
+        :param schema: Pydantic-схема, задающая имена полей и их ключи в JSON.
+        :param data: Разобранный JSON-объект.
+        """
+        self._schema = schema
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            alias, nested = get_schema_fields(self._schema)[name]
+        except KeyError:
+            raise AttributeError(f"{self._schema.__name__} has no field {name!r}") from None
+
+        value = self._data.get(alias)
+        if nested is None or value is None:
+            return value
+
+        if isinstance(value, list):
+            return [FieldsResponse(nested, item) for item in value]
+
+        return FieldsResponse(nested, value)
+
+    def __repr__(self) -> str:
+        return f"FieldsResponse({self._schema.__name__})"
+
+
+def parse_response(schema: type[T], content: bytes, mode: HTTPParseMode = HTTPParseMode.FULL) -> T:
+    """
+    Разбирает тело ответа в соответствии с режимом.
+
+    - FULL — полная валидация схемой (model_validate_json);
+    - LAZY — LazyResponse, полная валидация при первом обращении к атрибуту;
+    - FIELDS — FieldsResponse, без валидации, читаются только запрошенные поля.
+
+    В режимах LAZY и FIELDS возвращается не экземпляр схемы, а объект с теми же атрибутами.
+
+    :param schema: Pydantic-схема ответа.
+    :param content: Тело ответа в байтах.
+    :param mode: Режим разбора.
+    :return: Объект ответа.
+    """
+    if mode == HTTPParseMode.LAZY:
+        return LazyResponse(schema, content)
+
+    if mode == HTTPParseMode.FIELDS:
+        return FieldsResponse(schema, from_json(content))
+
+    return schema.model_validate_json(content)
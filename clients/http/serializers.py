@@ -0,0 +1,103 @@
+from enum import Enum
+from math import isfinite
+from json import JSONEncoder
+from json.encoder import encode_basestring
+from typing import Any, Callable
+
+from pydantic import BaseModel, EmailStr
+
+# Тот же формат JSON, что использует httpx для json= (компактные разделители, UTF-8 без экранирования)
+json_encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+# Заголовки запроса с телом, сериализованным build_json_serializer
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def encode_float(value: float) -> str:
+    value = float(value)
+    if not isfinite(value):
+        # Как json.dumps(allow_nan=False) в httpx: NaN и бесконечности не являются валидным JSON
+        raise ValueError("Out of range float values are not JSON compliant")
+
+    return float.__repr__(value)
+
+
+def get_value_encoder(annotation: Any) -> Callable[[Any], str]:
+    """
+    Подбирает функцию кодирования значения поля в JSON по аннотации поля.
+
+    :param annotation: Аннотация поля pydantic-схемы.
+    :return: Функция, возвращающая JSON-представление значения.
+    """
+    if annotation is EmailStr or (isinstance(annotation, type) and issubclass(annotation, str)):
+        return encode_basestring
+
+    if annotation is float:
+        return encode_float
+
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return lambda value: json_encoder.encode(value.value if isinstance(value, Enum) else value)
+
+    return json_encoder.encode
+
+
+def build_json_serializer(schema: type[BaseModel]) -> Callable[..., bytes]:
+    """
+    Строит функцию, которая сериализует аргументы запроса сразу в тело JSON, минуя pydantic.
+
+    Функция генерируется один раз на схему: ключи (alias полей) и их порядок, функции кодирования
+    значений и фабрики значений по умолчанию вычисляются заранее. Результат побайтово совпадает
+    с телом, которое httpx формирует из `json=schema(...).model_dump(by_alias=True)`.
+    Значения не валидируются.
+
+    Пример:
+        serialize = build_json_serializer(MakeTopUpOperationRequestSchema)
+        serialize(card_id="...", account_id="...")  # b'{"status":"...","amount":...,"cardId":"...","accountId":"..."}'
+
+    :param schema: Pydantic-схема тела запроса.
+    :return: Функция с keyword-only аргументами по именам полей схемы, возвращающая bytes.
+    """
+    namespace: dict[str, Any] = {"missing": object()}
+    arguments, defaults, parts = [], [], []
+
+    for index, (name, field) in enumerate(schema.model_fields.items()):
+        namespace[f"encode_{index}"] = get_value_encoder(field.annotation)
+        key = encode_basestring(field.alias or name).replace("{", "{{").replace("}", "}}")
+        parts.append(f"{key}:{{encode_{index}({name})}}")
+
+        if field.is_required():
+            arguments.append(name)
+            continue
+
+        arguments.append(f"{name}=missing")
+        if field.default_factory is not None:
+            namespace[f"default_{index}"] = field.default_factory
+            defaults.append(f"    if {name} is missing: {name} = default_{index}()")
+        else:
+            namespace[f"default_{index}"] = field.default
+            defaults.append(f"    if {name} is missing: {name} = default_{index}")
+
+    body = ",".join(parts)
+    source = "\n".join([
+        f"def serialize(*, {', '.join(arguments)}):",
+        *defaults,
+        f"    return f'{{{{{body}}}}}'.encode()",
+    ])
+    exec(source, namespace)
+    return namespace["serialize"]
+
+
+def build_query_serializer(schema: type[BaseModel]) -> Callable[..., dict[str, Any]]:
+    """
+    Строит функцию, которая превращает аргументы запроса в GET-параметры с ключами по alias полей схемы,
+    не создавая pydantic-модель и QueryParams.
+
+    :param schema: Pydantic-схема GET-параметров.
+    :return: Функция с keyword-аргументами по именам полей схемы, возвращающая словарь параметров.
+    """
+    aliases = {name: field.alias or name for name, field in schema.model_fields.items()}
+
+    def serialize(**values: Any) -> dict[str, Any]:
+        return {aliases[name]: value for name, value in values.items()}
+
+    return serialize
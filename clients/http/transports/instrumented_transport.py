@@ -0,0 +1,159 @@
+import socket
+import ssl
+import time
+from typing import Any, Callable, Iterable
+
+from httpcore import ConnectError, ConnectionPool, NetworkStream, SyncBackend
+from httpx import Limits, Request, Response, create_ssl_context
+
+from clients.http.transports.pooled_transport import PooledHTTPTransport
+
+
+class HTTPRequestTimings:
+    """
+    Длительности фаз одного HTTP-запроса (в наносекундах, time.perf_counter_ns()).
+
+    Фазы установки соединения заполнены только для запросов, которым понадобилось новое соединение;
+    для запросов по keep-alive соединению они равны None. Время до заголовков и чтение тела
+    замеряет сам event hook (записи "HTTP:headers" и "HTTP:body").
+
+    Attributes:
+        dns: Разрешение имени хоста.
+        connect: Установка TCP-соединения (без учёта DNS).
+        tls: TLS-рукопожатие.
+        connection_reused: Запрос отправлен по уже открытому соединению.
+    """
+
+    def __init__(self):
+        self.dns: int | None = None
+        self.connect: int | None = None
+        self.tls: int | None = None
+        self.connection_reused = True
+
+        self._started: dict[str, int] = {}
+
+    def trace(self, event_name: str, info: dict) -> None:
+        """
+        Обработчик trace-событий httpcore (например, "connection.connect_tcp.started",
+        "connection.start_tls.complete").
+        """
+        now = time.perf_counter_ns()
+        step, _, state = event_name.rpartition(".")
+        step = step.rpartition(".")[2]
+
+        if state == "started":
+            self._started[step] = now
+            return
+
+        if state != "complete" or step not in self._started:
+            return
+
+        if step == "connect_tcp":
+            self.connection_reused = False
+            self.dns = getattr(info.get("return_value"), "dns_time", None)
+            self.connect = now - self._started[step] - (self.dns or 0)
+        elif step == "start_tls":
+            self.tls = now - self._started[step]
+
+
+class InstrumentedNetworkBackend(SyncBackend):
+    """
+    Сетевой бэкенд httpcore, который разрешает имя хоста сам и замеряет время DNS.
+
+    Стандартный бэкенд выполняет DNS внутри socket.create_connection, поэтому время разрешения
+    имени неотделимо от установки соединения. Здесь адреса получаются через socket.getaddrinfo,
+    а время разрешения сохраняется в атрибуте dns_time возвращаемого потока.
+    """
+
+    def connect_tcp(
+            self,
+            host: str,
+            port: int,
+            timeout: float | None = None,
+            local_address: str | None = None,
+            socket_options: Iterable[Any] | None = None,
+    ) -> NetworkStream:
+        start_time = time.perf_counter_ns()
+        try:
+            addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError as error:
+            raise ConnectError(error) from error
+
+        dns_time = time.perf_counter_ns() - start_time
+
+        # Как и socket.create_connection, перебираем адреса, пока не удастся подключиться
+        error: ConnectError | None = None
+        for *_, address in addresses:
+            try:
+                stream = super().connect_tcp(address[0], port, timeout, local_address, socket_options)
+            except ConnectError as connect_error:
+                error = connect_error
+                continue
+
+            stream.dns_time = dns_time
+            return stream
+
+        raise error or ConnectError(f"No addresses resolved for {host}")
+
+
+class InstrumentedHTTPTransport(PooledHTTPTransport):
+    """
+    Пул соединений (PooledHTTPTransport), который замеряет фазы установки соединения:
+    DNS, TCP connect и TLS.
+
+    Замеры собираются из trace-событий httpcore в объект HTTPRequestTimings и сохраняются
+    в `request.extensions["timings"]`. Пул httpcore создаётся явно с InstrumentedNetworkBackend,
+    поэтому прокси и unix-сокеты этим транспортом не поддерживаются.
+    """
+
+    def __init__(
+            self,
+            limits: Limits,
+            verify: ssl.SSLContext | str | bool = True,
+            cert: Any = None,
+            trust_env: bool = True,
+            http1: bool = True,
+            http2: bool = False,
+            local_address: str | None = None,
+            retries: int = 0,
+            socket_options: Iterable[Any] | None = None
+    ):
+        """
+        :param limits: Ограничения пула соединений (max_connections, keepalive и т.д.).
+        :param verify: Проверка TLS-сертификатов сервера (как в httpx.HTTPTransport).
+        :param cert: Клиентский сертификат (как в httpx.HTTPTransport).
+        :param trust_env: Использовать переменные окружения SSL_CERT_FILE/SSL_CERT_DIR.
+        :param http1: Разрешить HTTP/1.1.
+        :param http2: Разрешить HTTP/2.
+        :param local_address: Локальный адрес исходящих соединений.
+        :param retries: Количество повторных попыток установки соединения.
+        :param socket_options: Опции сокетов новых соединений.
+        """
+        # httpx.HTTPTransport.__init__ не вызываем: он создал бы ещё один пул и SSL-контекст,
+        # которые тут же пришлось бы выбросить
+        self._init_stats(limits)
+        self._pool = ConnectionPool(
+            ssl_context=create_ssl_context(verify=verify, cert=cert, trust_env=trust_env),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=http1,
+            http2=http2,
+            local_address=local_address,
+            retries=retries,
+            socket_options=socket_options,
+            network_backend=InstrumentedNetworkBackend()
+        )
+
+    def handle_request(self, request: Request) -> Response:
+        timings = HTTPRequestTimings()
+        trace: Callable[[str, dict], None] | None = request.extensions.get("trace")
+
+        def inner(event_name: str, info: dict) -> None:
+            timings.trace(event_name, info)
+            if trace is not None:
+                trace(event_name, info)
+
+        request.extensions["timings"] = timings
+        request.extensions["trace"] = inner
+        return super().handle_request(request)
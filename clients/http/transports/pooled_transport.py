@@ -0,0 +1,99 @@
+from typing import Any, Callable
+
+from httpx import HTTPTransport, Limits, Request, Response
+
+
+class HTTPConnectionPoolStats:
+    """
+    Статистика пула соединений httpx.
+
+    Attributes:
+        created: Сколько раз запрос потребовал установки нового TCP-соединения (и TLS-рукопожатия).
+        reused: Сколько раз запрос был отправлен по уже открытому keep-alive соединению.
+        in_flight: Количество запросов, которые сейчас ждут соединения или заголовков ответа.
+    """
+
+    def __init__(self):
+        self.created = 0
+        self.reused = 0
+        self.in_flight = 0
+
+    @property
+    def requests(self) -> int:
+        """
+        Общее количество запросов, прошедших через пул.
+        """
+        return self.created + self.reused
+
+    @property
+    def reuse_ratio(self) -> float:
+        """
+        Доля запросов, обслуженных без установки нового соединения.
+        """
+        return self.reused / self.requests if self.requests else 0.0
+
+
+class PooledHTTPTransport(HTTPTransport):
+    """
+    HTTP-транспорт на базе httpx.HTTPTransport, который можно разделять между несколькими httpx.Client.
+
+    Помимо обычной работы транспорта считает, сколько соединений было создано и сколько раз
+    соединение было переиспользовано. Для этого используется trace-расширение httpcore:
+    если во время запроса произошло событие connect_tcp — соединение новое, иначе — переиспользованное.
+    """
+
+    def __init__(self, limits: Limits, **kwargs: Any):
+        """
+        :param limits: Ограничения пула соединений (max_connections, keepalive и т.д.).
+        :param kwargs: Остальные параметры httpx.HTTPTransport.
+        """
+        super().__init__(limits=limits, **kwargs)
+        self._init_stats(limits)
+
+    def _init_stats(self, limits: Limits) -> None:
+        """
+        Инициализирует лимиты и статистику пула. Вызывается наследниками, которые создают
+        пул httpcore сами, не проходя через httpx.HTTPTransport.__init__.
+
+        :param limits: Ограничения пула соединений.
+        """
+        self.limits = limits
+        self.stats = HTTPConnectionPoolStats()
+
+    @property
+    def connections_open(self) -> int:
+        """
+        Количество соединений, открытых в пуле в данный момент.
+        """
+        return len(self._pool.connections)
+
+    @property
+    def connections_idle(self) -> int:
+        """
+        Количество открытых соединений, которые сейчас простаивают в keep-alive.
+        """
+        return sum(1 for connection in self._pool.connections if connection.is_idle())
+
+    def handle_request(self, request: Request) -> Response:
+        connect_events: list[str] = []
+        trace: Callable[[str, dict], None] | None = request.extensions.get("trace")
+
+        def inner(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                connect_events.append(event_name)
+            if trace is not None:
+                trace(event_name, info)
+
+        request.extensions["trace"] = inner
+        self.stats.in_flight += 1
+        try:
+            response = super().handle_request(request)
+        finally:
+            self.stats.in_flight -= 1
+
+        if connect_events:
+            self.stats.created += 1
+        else:
+            self.stats.reused += 1
+
+        return response
@@ -1,9 +1,12 @@
 import locust.stats
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from tools.config.fakers import FakersConfig
 from tools.config.grpc import GRPCClientConfig
 from tools.config.http import HTTPClientConfig
 from tools.config.locust import LocustUserConfig
+from tools.config.metrics import MetricsConfig
+from tools.config.seeds import SeedsConfig
 
 
 locust.stats.PERCENTILES_TO_REPORT = [0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 0.99, 1.0]
@@ -24,6 +27,9 @@ class Settings(BaseSettings):
     locust_user: LocustUserConfig
     gateway_http_client: HTTPClientConfig
     gateway_grpc_client: GRPCClientConfig
+    seeds: SeedsConfig = SeedsConfig()
+    fakers: FakersConfig = FakersConfig()
+    metrics: MetricsConfig = MetricsConfig()
 
 
 settings = Settings()
\ No newline at end of file
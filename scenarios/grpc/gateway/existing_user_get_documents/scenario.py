@@ -2,6 +2,7 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.coordinator import setup_seeds
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
 from seeds.schema.result import SeedUserResult
 from tools.locust.user import LocustBaseUser
@@ -9,9 +10,7 @@ from tools.locust.user import LocustBaseUser
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
-    seeds_scenario.build()
-    environment.seeds = seeds_scenario.load()
+    setup_seeds(environment, ExistingUserGetDocumentsSeedsScenario())
 
 
 class GetDocumentsTaskSet(GatewayGRPCTaskSet):
@@ -19,7 +18,10 @@ class GetDocumentsTaskSet(GatewayGRPCTaskSet):
 
     def on_start(self) -> None:
         super().on_start()
-        self.seed_user = self.user.environment.seeds.get_next_user()
+        self.seed_user = self.user.environment.seeds_pool.checkout()
+
+    def on_stop(self) -> None:
+        self.user.environment.seeds_pool.release(self.seed_user)
 
     @task(1)
     def get_accounts(self):
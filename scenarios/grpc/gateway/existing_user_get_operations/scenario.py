@@ -2,6 +2,7 @@ from locust import events, task
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.coordinator import setup_seeds
 from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
 from seeds.schema.result import SeedUserResult
 from tools.locust.user import LocustBaseUser
@@ -9,9 +10,7 @@ from tools.locust.user import LocustBaseUser
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()
-    environment.seeds = seeds_scenario.load()
+    setup_seeds(environment, ExistingUserGetOperationsSeedsScenario())
 
 
 class GetOperationsTaskSet(GatewayGRPCTaskSet):
@@ -19,7 +18,10 @@ class GetOperationsTaskSet(GatewayGRPCTaskSet):
 
     def on_start(self) -> None:
         super().on_start()
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        self.seed_user = self.user.environment.seeds_pool.checkout()
+
+    def on_stop(self) -> None:
+        self.user.environment.seeds_pool.release(self.seed_user)
 
     @task(2)
     def get_accounts(self):
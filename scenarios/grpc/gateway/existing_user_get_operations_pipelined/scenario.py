@@ -0,0 +1,53 @@
+from grpc import FutureCancelledError, RpcError
+from locust import events, task
+from locust.env import Environment
+
+from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.coordinator import setup_seeds
+from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
+from seeds.schema.result import SeedUserResult
+from tools.locust.user import LocustBaseUser
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    setup_seeds(environment, ExistingUserGetOperationsSeedsScenario())
+
+
+class GetOperationsPipelinedTaskSet(GatewayGRPCTaskSet):
+    """
+    Конвейерный (pipelined) вариант сценария existing_user_get_operations.
+
+    Виртуальный пользователь не ждёт ответа на каждый вызов по очереди, а отправляет
+    get_accounts, get_operations и get_operations_summary одновременно через .future()
+    и дожидается завершения всех трёх.
+    """
+    seed_user: SeedUserResult
+
+    def on_start(self) -> None:
+        super().on_start()
+        self.seed_user = self.user.environment.seeds_pool.checkout()
+
+    def on_stop(self) -> None:
+        self.user.environment.seeds_pool.release(self.seed_user)
+
+    @task
+    def get_operations_pipelined(self):
+        account_id = self.seed_user.credit_card_accounts[0].account_id
+
+        futures = [
+            self.accounts_gateway_client.get_accounts_future(user_id=self.seed_user.user_id),
+            self.operations_gateway_client.get_operations_future(account_id=account_id),
+            self.operations_gateway_client.get_operations_summary_future(account_id=account_id)
+        ]
+
+        # Ошибки уже зарегистрированы интерцептором, здесь только дожидаемся завершения
+        for future in futures:
+            try:
+                future.result()
+            except (RpcError, FutureCancelledError):
+                pass
+
+
+class GetOperationsPipelinedScenarioUser(LocustBaseUser):
+    tasks = [GetOperationsPipelinedTaskSet]
\ No newline at end of file
@@ -0,0 +1,445 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+
+from gevent import monkey
+
+from clients.grpc.gateway.accounts.client import build_accounts_gateway_async_grpc_client, AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import build_cards_gateway_async_grpc_client, CardsGatewayGRPCClient
+from clients.grpc.gateway.operations.client import build_operations_gateway_async_grpc_client, OperationsGatewayGRPCClient
+from clients.grpc.gateway.users.client import build_users_gateway_async_grpc_client, UsersGatewayGRPCClient
+from clients.http.client import HTTPClient
+from clients.http.gateway.accounts.client import build_accounts_gateway_async_http_client, AsyncAccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import build_cards_gateway_async_http_client, AsyncCardsGatewayHTTPClient
+from clients.http.gateway.operations.client import (
+    build_operations_gateway_async_http_client,
+    AsyncOperationsGatewayHTTPClient
+)
+from clients.http.gateway.users.client import build_users_gateway_async_http_client, AsyncUsersGatewayHTTPClient
+from seeds.builder import count_user_requests, get_card_account_stages
+from seeds.schema.plan import (
+    SeedsPlan,
+    SeedUsersPlan,
+    SeedAccountsPlan,
+)
+from seeds.schema.result import (
+    SeedsResult,
+    SeedUserResult,
+    SeedCardResult,
+    SeedAccountResult,
+    SeedOperationResult
+)
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("ASYNC_SEEDS_BUILDER")
+
+
+class AsyncSeedsBuilder:
+    """
+    AsyncSeedsBuilder — асинхронный аналог SeedsBuilder на asyncio (grpc.aio / httpx.AsyncClient).
+
+    В отличие от SeedsBuilder, параллельно выполняются не только пользователи, но и независимые
+    запросы внутри пользователя: счета пользователя, а также карты и операции одного счёта.
+    Общее число одновременно выполняющихся запросов ограничено семафором (max_in_flight),
+    что создаёт обратное давление и не даёт перегрузить gateway при больших планах.
+
+    Attributes:
+        users_gateway_client: Асинхронный клиент для работы с пользователями (HTTP или gRPC)
+        cards_gateway_client: Асинхронный клиент для выпуска карт
+        accounts_gateway_client: Асинхронный клиент для открытия счетов
+        operations_gateway_client: Асинхронный клиент для операций (топ-ап, покупки и т.д.)
+        max_in_flight: Максимальное число одновременно выполняющихся запросов
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: UsersGatewayGRPCClient | AsyncUsersGatewayHTTPClient,
+            cards_gateway_client: CardsGatewayGRPCClient | AsyncCardsGatewayHTTPClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient | AsyncAccountsGatewayHTTPClient,
+            operations_gateway_client: OperationsGatewayGRPCClient | AsyncOperationsGatewayHTTPClient,
+            max_in_flight: int = 1000
+    ):
+        self.users_gateway_client = users_gateway_client
+        self.cards_gateway_client = cards_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.operations_gateway_client = operations_gateway_client
+        self.max_in_flight = max(max_in_flight, 1)
+        self.semaphore = asyncio.Semaphore(self.max_in_flight)
+
+    async def request(self, method: Callable[..., Awaitable[Any]], **kwargs) -> Any:
+        """
+        Выполняет запрос к API, дожидаясь свободного слота семафора.
+
+        Args:
+            method: Метод асинхронного клиента
+            **kwargs: Аргументы метода
+
+        Returns:
+            Any: Ответ API
+        """
+        async with self.semaphore:
+            return await method(**kwargs)
+
+    @staticmethod
+    async def repeat(count: int, method: Callable[..., Awaitable[Any]], **kwargs) -> list[Any]:
+        """
+        Параллельно выполняет метод билдера указанное количество раз.
+
+        Args:
+            count: Количество выполнений
+            method: Асинхронный метод билдера
+            **kwargs: Аргументы метода
+
+        Returns:
+            list[Any]: Результаты в порядке запуска
+        """
+        return list(await asyncio.gather(*(method(**kwargs) for _ in range(count))))
+
+    async def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        response = await self.request(
+            self.cards_gateway_client.issue_physical_card,
+            user_id=user_id,
+            account_id=account_id
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        response = await self.request(
+            self.cards_gateway_client.issue_virtual_card,
+            user_id=user_id,
+            account_id=account_id
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        response = await self.request(
+            self.operations_gateway_client.make_top_up_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        response = await self.request(
+            self.operations_gateway_client.make_purchase_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        response = await self.request(
+            self.operations_gateway_client.make_transfer_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
+        response = await self.request(self.accounts_gateway_client.open_savings_account, user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
+        response = await self.request(self.accounts_gateway_client.open_deposit_account, user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            open_account: Callable[..., Awaitable[Any]]
+    ) -> SeedAccountResult:
+        """
+        Открывает карточный счёт (дебетовый или кредитный) и выполняет действия по плану этапами
+        get_card_account_stages: сначала дожидается всех пополнений, затем параллельно выпускает карты
+        и выполняет списания (покупки, переводы, снятия наличных) по уже пополненному счёту.
+
+        Args:
+            plan: План создания счёта
+            user_id: Идентификатор пользователя
+            open_account: Метод клиента, открывающий счёт
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта, картами и операциями
+        """
+        response = await self.request(open_account, user_id=user_id)
+        card_id = response.account.cards[0].id
+        account_id = response.account.id
+
+        results: dict[str, list] = {}
+        for stage in get_card_account_stages(self, plan, user_id, card_id, account_id):
+            stage_results = await asyncio.gather(
+                *(self.repeat(count, method, **kwargs) for _, method, count, kwargs in stage)
+            )
+            results.update(zip((field for field, *_ in stage), stage_results))
+
+        return SeedAccountResult(account_id=account_id, **results)
+
+    async def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+        """
+        Создаёт пользователя и параллельно открывает все его счета согласно плану.
+
+        Args:
+            plan: План генерации пользователя
+
+        Returns:
+            SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
+        """
+        response = await self.request(self.users_gateway_client.create_user)
+        user_id = response.user.id
+
+        savings_accounts, deposit_accounts, debit_card_accounts, credit_card_accounts = await asyncio.gather(
+            self.repeat(plan.savings_accounts.count, self.build_savings_account_result, user_id=user_id),
+            self.repeat(plan.deposit_accounts.count, self.build_deposit_account_result, user_id=user_id),
+            self.repeat(
+                plan.debit_card_accounts.count,
+                self.build_card_account_result,
+                plan=plan.debit_card_accounts,
+                user_id=user_id,
+                open_account=self.accounts_gateway_client.open_debit_card_account
+            ),
+            self.repeat(
+                plan.credit_card_accounts.count,
+                self.build_card_account_result,
+                plan=plan.credit_card_accounts,
+                user_id=user_id,
+                open_account=self.accounts_gateway_client.open_credit_card_account
+            )
+        )
+
+        return SeedUserResult(
+            user_id=user_id,
+            savings_accounts=savings_accounts,
+            deposit_accounts=deposit_accounts,
+            debit_card_accounts=debit_card_accounts,
+            credit_card_accounts=credit_card_accounts
+        )
+
+    async def build_users(self, plan: SeedUsersPlan, count: int) -> AsyncIterator[SeedUserResult]:
+        """
+        Создаёт пользователей по плану и отдаёт каждого сразу после создания (в порядке завершения).
+
+        Пользователей обрабатывают max_in_flight корутин-воркеров, поэтому даже для плана на сотни тысяч
+        пользователей одновременно существует ограниченное число корутин.
+
+        Args:
+            plan: План генерации пользователя
+            count: Количество пользователей
+
+        Yields:
+            SeedUserResult: Очередной созданный пользователь
+        """
+        start_time = time.perf_counter()
+
+        indexes = iter(range(count))
+        results: asyncio.Queue[SeedUserResult | BaseException] = asyncio.Queue()
+
+        async def worker():
+            for _ in indexes:
+                await results.put(await self.build_user(plan=plan))
+
+        def on_worker_done(task: asyncio.Task):
+            # Ошибка воркера передаётся через очередь, иначе ожидание результата зависло бы навсегда
+            if not task.cancelled() and task.exception() is not None:
+                results.put_nowait(task.exception())
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_in_flight, count))]
+        for task in workers:
+            task.add_done_callback(on_worker_done)
+
+        try:
+            for _ in range(count):
+                result = await results.get()
+                if isinstance(result, BaseException):
+                    raise result
+
+                yield result
+        finally:
+            for task in workers:
+                task.cancel()
+
+        elapsed = time.perf_counter() - start_time
+        requests = count_user_requests(plan) * count
+        logger.info(
+            f"Seeded {count} users with {requests} requests in {elapsed:.2f}s "
+            f"(max in flight: {self.max_in_flight}, throughput: {requests / elapsed if elapsed else 0:.1f} requests/s)"
+        )
+
+    async def build(self, plan: SeedsPlan) -> SeedsResult:
+        """
+        Генерирует полную структуру данных на основе плана.
+
+        Args:
+            plan: Полный план генерации данных
+
+        Returns:
+            SeedsResult: Результат с данными всех созданных пользователей
+        """
+        return SeedsResult(users=[user async for user in self.build_users(plan=plan.users, count=plan.users.count)])
+
+    async def close(self) -> None:
+        """
+        Закрывает каналы и HTTP-клиенты, использованные билдером.
+        """
+        for client in (
+                self.users_gateway_client,
+                self.cards_gateway_client,
+                self.accounts_gateway_client,
+                self.operations_gateway_client
+        ):
+            if isinstance(client, HTTPClient):
+                await client.client.aclose()
+            else:
+                await client.channel.close()
+
+
+def build_grpc_async_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания AsyncSeedsBuilder с gRPC-клиентами (grpc.aio).
+    Должна вызываться внутри запущенного event loop.
+
+    Returns:
+        AsyncSeedsBuilder: Билдер для асинхронной генерации через gRPC
+    """
+    return AsyncSeedsBuilder(
+        users_gateway_client=build_users_gateway_async_grpc_client(),
+        cards_gateway_client=build_cards_gateway_async_grpc_client(),
+        accounts_gateway_client=build_accounts_gateway_async_grpc_client(),
+        operations_gateway_client=build_operations_gateway_async_grpc_client(),
+        max_in_flight=settings.seeds.max_in_flight
+    )
+
+
+def build_http_async_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания AsyncSeedsBuilder с HTTP-клиентами (httpx.AsyncClient).
+    Должна вызываться внутри запущенного event loop.
+
+    Returns:
+        AsyncSeedsBuilder: Билдер для асинхронной генерации через HTTP
+    """
+    return AsyncSeedsBuilder(
+        users_gateway_client=build_users_gateway_async_http_client(),
+        cards_gateway_client=build_cards_gateway_async_http_client(),
+        accounts_gateway_client=build_accounts_gateway_async_http_client(),
+        operations_gateway_client=build_operations_gateway_async_http_client(),
+        max_in_flight=settings.seeds.max_in_flight
+    )
+
+
+ASYNC_SEEDS_BUILDERS: dict[str, Callable[[], AsyncSeedsBuilder]] = {
+    "grpc": build_grpc_async_seeds_builder,
+    "http": build_http_async_seeds_builder
+}
+
+
+async def build_async_seeds_result(plan: SeedsPlan, protocol: str) -> SeedsResult:
+    """
+    Создаёт асинхронный билдер для указанного протокола, выполняет план и закрывает соединения.
+
+    Args:
+        plan: Полный план генерации данных
+        protocol: Протокол клиентов ("grpc" или "http")
+
+    Returns:
+        SeedsResult: Результат с данными всех созданных пользователей
+    """
+    builder = ASYNC_SEEDS_BUILDERS[protocol]()
+    try:
+        return await builder.build(plan)
+    finally:
+        await builder.close()
+
+
+def stream_async_seeds_users(plan: SeedsPlan, protocol: str = "grpc") -> Iterator[SeedUserResult]:
+    """
+    Выполняет план асинхронным движком в отдельном интерпретаторе (python -m seeds.async_builder)
+    и отдаёт пользователей по мере их создания.
+
+    grpc.aio и asyncio не работают в процессе, пропатченном gevent (а Locust патчит процесс при импорте),
+    поэтому дочерний процесс запускается без monkey patching. План передаётся через stdin,
+    созданные пользователи возвращаются через stdout построчно в формате JSON Lines.
+    В процессе, пропатченном gevent, чтение stdout не блокирует остальные гринлеты.
+
+    Args:
+        plan: Полный план генерации данных
+        protocol: Протокол клиентов ("grpc" или "http")
+
+    Yields:
+        SeedUserResult: Очередной созданный пользователь
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-m", "seeds.async_builder", protocol],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env={**os.environ, "LOCUST_SKIP_MONKEY_PATCH": "1"}
+    )
+    try:
+        process.stdin.write(plan.model_dump_json().encode())
+        process.stdin.close()
+
+        for line in process.stdout:
+            yield SeedUserResult.model_validate_json(line)
+    except BaseException:
+        process.kill()
+        raise
+    finally:
+        process.stdout.close()
+
+    if process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, process.args)
+
+
+def run_async_seeds_builder(plan: SeedsPlan, protocol: str = "grpc") -> SeedsResult:
+    """
+    Синхронная точка входа в асинхронный движок сидинга.
+
+    В процессе, пропатченном gevent, сидинг выполняется в отдельном интерпретаторе
+    (см. stream_async_seeds_users), иначе — в новом event loop текущего процесса.
+
+    Args:
+        plan: Полный план генерации данных
+        protocol: Протокол клиентов ("grpc" или "http")
+
+    Returns:
+        SeedsResult: Результат с данными всех созданных пользователей
+    """
+    if not monkey.is_module_patched("socket"):
+        return asyncio.run(build_async_seeds_result(plan, protocol))
+
+    return SeedsResult(users=list(stream_async_seeds_users(plan, protocol)))
+
+
+async def main(plan: SeedsPlan, protocol: str) -> None:
+    """
+    Точка входа дочернего процесса: пишет созданных пользователей в stdout в формате JSON Lines.
+
+    Args:
+        plan: Полный план генерации данных
+        protocol: Протокол клиентов ("grpc" или "http")
+    """
+    builder = ASYNC_SEEDS_BUILDERS[protocol]()
+    try:
+        async for user in builder.build_users(plan=plan.users, count=plan.users.count):
+            sys.stdout.write(user.model_dump_json() + "\n")
+            sys.stdout.flush()
+    finally:
+        await builder.close()
+
+
+if __name__ == "__main__":
+    exit_code = 0
+    try:
+        asyncio.run(main(plan=SeedsPlan.model_validate_json(sys.stdin.buffer.read()), protocol=sys.argv[1]))
+    except Exception:
+        logger.exception("Async seeding failed")
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        # После массовых ошибок RPC grpc.aio может зависнуть при финализации интерпретатора,
+        # поэтому дочерний процесс завершается без неё
+        os._exit(exit_code)
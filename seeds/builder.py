@@ -1,3 +1,8 @@
+import time
+from typing import Any, Callable, Iterator
+
+from gevent.pool import Pool
+
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
@@ -18,6 +23,95 @@ from seeds.schema.result import (
     SeedAccountResult,
     SeedOperationResult
 )
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_BUILDER")
+
+
+def count_user_requests(plan: SeedUsersPlan) -> int:
+    """
+    Подсчитывает, сколько запросов к API требуется для создания одного пользователя по плану.
+
+    Args:
+        plan: План генерации пользователя
+
+    Returns:
+        int: Количество запросов (создание пользователя, счетов, карт и операций)
+    """
+    requests = 1 + plan.savings_accounts.count + plan.deposit_accounts.count
+    for accounts_plan in (plan.debit_card_accounts, plan.credit_card_accounts):
+        requests += accounts_plan.count * (
+                1
+                + accounts_plan.physical_cards.count
+                + accounts_plan.virtual_cards.count
+                + accounts_plan.top_up_operations.count
+                + accounts_plan.purchase_operations.count
+                + accounts_plan.transfer_operations.count
+                + accounts_plan.cash_withdrawal_operations.count
+        )
+
+    return requests
+
+
+# Шаг плана карточного счёта: поле SeedAccountsPlan и SeedAccountResult, метод билдера,
+# количество выполнений и аргументы метода
+SeedCardAccountStep = tuple[str, Callable[..., Any], int, dict[str, str]]
+
+
+def get_card_account_stages(
+        builder: Any,
+        plan: SeedAccountsPlan,
+        user_id: str,
+        card_id: str,
+        account_id: str
+) -> list[list[SeedCardAccountStep]]:
+    """
+    Раскладывает план карточного счёта на этапы, общие для SeedsBuilder и AsyncSeedsBuilder.
+
+    Этапы выполняются по порядку: сначала пополнения, затем выпуск карт и списания (покупки, переводы,
+    снятия наличных), чтобы списания проходили по уже пополненному счёту. Шаги внутри этапа независимы,
+    поэтому асинхронный билдер выполняет их параллельно. Операции снятия наличных создаются переводами.
+
+    Args:
+        builder: Билдер, методы которого выполняют шаги (SeedsBuilder или AsyncSeedsBuilder)
+        plan: План создания карточного счёта
+        user_id: Идентификатор пользователя
+        card_id: Идентификатор карты, выпущенной вместе со счётом
+        account_id: Идентификатор счёта
+
+    Returns:
+        list[list[SeedCardAccountStep]]: Этапы плана
+    """
+    cards = {"user_id": user_id, "account_id": account_id}
+    operations = {"card_id": card_id, "account_id": account_id}
+    return [
+        [
+            ("top_up_operations", builder.build_top_up_operation_result, plan.top_up_operations.count, operations)
+        ],
+        [
+            ("physical_cards", builder.build_physical_card_result, plan.physical_cards.count, cards),
+            ("virtual_cards", builder.build_virtual_card_result, plan.virtual_cards.count, cards),
+            (
+                "purchase_operations",
+                builder.build_purchase_operation_result,
+                plan.purchase_operations.count,
+                operations
+            ),
+            (
+                "transfer_operations",
+                builder.build_transfer_operation_result,
+                plan.transfer_operations.count,
+                operations
+            ),
+            (
+                "cash_withdrawal_operations",
+                builder.build_transfer_operation_result,
+                plan.cash_withdrawal_operations.count,
+                operations
+            )
+        ]
+    ]
 
 
 class SeedsBuilder:
@@ -30,6 +124,8 @@ class SeedsBuilder:
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        concurrency: Сколько пользователей создаётся одновременно. Внутри одного пользователя
+            запросы всегда выполняются последовательно, т.к. зависят друг от друга.
     """
 
     def __init__(
@@ -37,12 +133,14 @@ class SeedsBuilder:
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            concurrency: int = 1
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.concurrency = max(concurrency, 1)
 
     def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -172,64 +270,58 @@ class SeedsBuilder:
         response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
-    def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+    def build_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            open_account: Callable[..., Any]
+    ) -> SeedAccountResult:
         """
-        Открывает дебетовый счёт для пользователя и при необходимости:
-        - выпускает физические карты
-        - выпускает виртуальные карты
+        Открывает карточный счёт (дебетовый или кредитный) и выполняет действия по плану
+        в порядке этапов get_card_account_stages:
         - выполняет операции пополнения (top-up)
-        - выполняет операции покупки
-        - выполняет операции перевода
-        - выполняет операции снятия наличных
+        - выпускает физические и виртуальные карты
+        - выполняет операции покупки, перевода и снятия наличных
 
         Args:
-            plan: План создания дебетового счёта (кол-во карт, операций и т.п.)
+            plan: План создания карточного счёта (кол-во карт, операций и т.п.)
             user_id: Идентификатор пользователя
+            open_account: Метод клиента, открывающий счёт
 
         Returns:
             SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
         """
-        response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
+        response = open_account(user_id=user_id)
         card_id = response.account.cards[0].id
         account_id = response.account.id
 
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
+        results: dict[str, list] = {}
+        for stage in get_card_account_stages(self, plan, user_id, card_id, account_id):
+            for field, method, count, kwargs in stage:
+                results[field] = [method(**kwargs) for _ in range(count)]
+
+        return SeedAccountResult(account_id=account_id, **results)
+
+    def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Открывает дебетовый счёт для пользователя и выполняет действия по плану (см. build_card_account_result).
+
+        Args:
+            plan: План создания дебетового счёта (кол-во карт, операций и т.п.)
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
+        """
+        return self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            open_account=self.accounts_gateway_client.open_debit_card_account
         )
 
     def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
         """
-        Открывает кредитный счёт и выполняет действия согласно плану:
-        - выпускает физические карты
-        - выпускает виртуальные карты
-        - выполняет операции пополнения (top-up)
-        - выполняет операции покупки
-        - выполняет операции перевода
-        - выполняет операции снятия наличных
+        Открывает кредитный счёт и выполняет действия по плану (см. build_card_account_result).
 
         Args:
             plan: План создания кредитного счёта
@@ -238,36 +330,10 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID счёта и деталями операций
         """
-        response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
+        return self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            open_account=self.accounts_gateway_client.open_credit_card_account
         )
 
     def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
@@ -304,6 +370,33 @@ class SeedsBuilder:
             ]
         )
 
+    def build_users(self, plan: SeedUsersPlan, count: int) -> Iterator[SeedUserResult]:
+        """
+        Создаёт пользователей по плану и отдаёт каждого сразу после создания.
+
+        Пользователи создаются параллельно пулом из `concurrency` гринлетов и отдаются
+        в порядке завершения. Это позволяет сохранять результат по мере генерации,
+        не дожидаясь создания всех пользователей.
+
+        Args:
+            plan: План генерации пользователя
+            count: Количество пользователей
+
+        Yields:
+            SeedUserResult: Очередной созданный пользователь
+        """
+        start_time = time.perf_counter()
+
+        pool = Pool(size=self.concurrency)
+        yield from pool.imap_unordered(lambda _: self.build_user(plan=plan), range(count))
+
+        elapsed = time.perf_counter() - start_time
+        requests = count_user_requests(plan) * count
+        logger.info(
+            f"Seeded {count} users with {requests} requests in {elapsed:.2f}s "
+            f"(concurrency: {self.concurrency}, throughput: {requests / elapsed if elapsed else 0:.1f} requests/s)"
+        )
+
     def build(self, plan: SeedsPlan) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
@@ -316,7 +409,7 @@ class SeedsBuilder:
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        return SeedsResult(users=list(self.build_users(plan=plan.users, count=plan.users.count)))
 
 
 def build_grpc_seeds_builder() -> SeedsBuilder:
@@ -330,7 +423,8 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
         users_gateway_client=build_users_gateway_grpc_client(),
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        concurrency=settings.seeds.concurrency
     )
 
 
@@ -345,5 +439,6 @@ def build_http_seeds_builder():
         users_gateway_client=build_users_gateway_http_client(),
         cards_gateway_client=build_cards_gateway_http_client(),
         accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        operations_gateway_client=build_operations_gateway_http_client(),
+        concurrency=settings.seeds.concurrency
     )
\ No newline at end of file
@@ -0,0 +1,222 @@
+from locust import events
+from locust.env import Environment
+from locust.rpc import Message
+from locust.runners import MasterRunner, WorkerRunner, STATE_MISSING, STATE_RUNNING, STATE_SPAWNING
+
+from config import settings
+from seeds.dumps import LoadedSeedsResult
+from seeds.pool import SeedUsersPool
+from seeds.scenario import SeedsScenario
+from seeds.schema.result import SeedsResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_COORDINATOR")
+
+# Тип сообщения Locust, в котором мастер передаёт воркеру его часть сидинговых данных
+SEEDS_SHARD_MESSAGE = "seeds_shard"
+
+# Тип сообщения Locust, в котором мастер забирает у воркера пользователей, переданных другому воркеру
+SEEDS_REVOKE_MESSAGE = "seeds_revoke"
+
+# Тип сообщения Locust, в котором воркер после инициализации запрашивает у мастера свою часть сидинговых данных
+SEEDS_REQUEST_MESSAGE = "seeds_request"
+
+
+@events.test_start.add_listener
+def check_seeds_pool(environment: Environment, **kwargs):
+    """
+    Перед запуском виртуальных пользователей проверяет, что пул сидинговых пользователей процесса не пуст.
+
+    Воркер, подключившийся во время теста, может получить команду на запуск пользователей раньше,
+    чем выполнится events.init сценария (и даже раньше, чем будет задан environment.runner),
+    поэтому пустой пул создаётся здесь же: при политике block
+    пользователи ждут в нём свою часть данных, которую воркер запросит у мастера при инициализации.
+    """
+    if isinstance(environment.runner, MasterRunner):
+        return
+
+    if not hasattr(environment, "seeds_pool"):
+        set_seeds(environment, SeedsResult())
+
+    if not environment.seeds_pool.stats.total:
+        logger.error("Starting users with an empty seed users pool: no seeded users were loaded or received.")
+
+
+@events.test_stop.add_listener
+def log_seeds_pool_stats(environment: Environment, **kwargs):
+    """
+    По завершении теста выводит статистику пула сидинговых пользователей процесса.
+    """
+    pool: SeedUsersPool | None = getattr(environment, "seeds_pool", None)
+    if pool is None or isinstance(environment.runner, MasterRunner):
+        return
+
+    stats = pool.stats
+    logger.info(
+        f"Seed users pool: {stats.total} users, in use: {stats.in_use}, peak: {stats.peak_in_use}, "
+        f"checkouts: {stats.checkouts}, recycled: {stats.recycled}, waits: {stats.waits}"
+    )
+
+
+def set_seeds(environment: Environment, result: LoadedSeedsResult) -> None:
+    """
+    Сохраняет сидинговые данные процесса в окружение Locust.
+
+    environment.seeds — загруженный результат сидинга,
+    environment.seeds_pool — пул для эксклюзивной выдачи пользователей виртуальным пользователям.
+
+    :param environment: Окружение Locust.
+    :param result: Результат сидинга (целиком или часть, полученная от мастера).
+    """
+    environment.seeds = result
+    environment.seeds_pool = SeedUsersPool(
+        users=result.users,
+        policy=settings.seeds.pool_policy,
+        timeout=settings.seeds.pool_timeout
+    )
+
+
+def split_seeds_result(result: LoadedSeedsResult, shards: int) -> list[SeedsResult]:
+    """
+    Делит результат сидинга на непересекающиеся части.
+
+    Пользователи распределяются по кругу, поэтому размеры частей отличаются не более чем на одного пользователя.
+
+    :param result: Полный результат сидинга.
+    :param shards: Количество частей.
+    :return: Список частей в том же порядке, что и получатели.
+    """
+    parts = [SeedsResult() for _ in range(shards)]
+    for index, user in enumerate(result.users):
+        parts[index % shards].users.append(user)
+
+    return parts
+
+
+def send_seeds_shards(runner: MasterRunner, result: LoadedSeedsResult) -> dict[str, SeedsResult]:
+    """
+    Отправляет каждому подключённому воркеру его часть сидинговых данных.
+
+    :param runner: Раннер мастера.
+    :param result: Полный результат сидинга.
+    :return: Части, отправленные воркерам, по идентификатору воркера.
+    """
+    workers = [worker for worker in runner.clients.values() if worker.state != STATE_MISSING]
+    if not workers:
+        logger.warning("No connected workers to send seeds shards to.")
+        return {}
+
+    shards = {worker.id: shard for worker, shard in zip(workers, split_seeds_result(result, len(workers)))}
+    for client_id, shard in shards.items():
+        runner.send_message(SEEDS_SHARD_MESSAGE, shard.model_dump(mode="json")["users"], client_id=client_id)
+
+    users = sum(len(shard.users) for shard in shards.values())
+    logger.info(f"Sent {users} seeded users to {len(workers)} workers.")
+    return shards
+
+
+def send_late_worker_seeds_shard(
+        runner: MasterRunner,
+        result: LoadedSeedsResult,
+        shards: dict[str, SeedsResult],
+        client_id: str
+) -> None:
+    """
+    Отправляет часть сидинговых данных воркеру, который запросил её во время теста (SEEDS_REQUEST_MESSAGE).
+
+    Воркер, которому часть уже выдана (например, она пришла до регистрации обработчика сообщения),
+    получает её повторно. Новый воркер получает части отключившихся воркеров. Если в них меньше пользователей,
+    чем равная доля, недостающие пользователи забираются с конца частей остальных воркеров (у каждого остаётся
+    не меньше равной доли): мастер отзывает их у прежних воркеров сообщением SEEDS_REVOKE_MESSAGE.
+
+    :param runner: Раннер мастера.
+    :param result: Полный результат сидинга (используется, если части ещё не розданы ни одному воркеру).
+    :param shards: Части, розданные воркерам; обновляется на месте.
+    :param client_id: Идентификатор воркера.
+    """
+    if client_id in shards:
+        users = shards[client_id].model_dump(mode="json")["users"]
+        runner.send_message(SEEDS_SHARD_MESSAGE, users, client_id=client_id)
+        return
+
+    live = {
+        worker_id: shard for worker_id, shard in shards.items()
+        if worker_id in runner.clients and runner.clients[worker_id].state != STATE_MISSING
+    }
+    if shards:
+        users = [user for worker_id, shard in shards.items() if worker_id not in live for user in shard.users]
+    else:
+        users = list(result.users)
+
+    share = (len(users) + sum(len(shard.users) for shard in live.values())) // (len(live) + 1)
+    for worker_id, shard in live.items():
+        count = min(share - len(users), len(shard.users) - share)
+        if count <= 0:
+            continue
+
+        revoked, shard.users = shard.users[-count:], shard.users[:-count]
+        runner.send_message(SEEDS_REVOKE_MESSAGE, [user.user_id for user in revoked], client_id=worker_id)
+        users.extend(revoked)
+
+    shards.clear()
+    shards.update(live)
+    shards[client_id] = SeedsResult(users=users)
+    runner.send_message(SEEDS_SHARD_MESSAGE, shards[client_id].model_dump(mode="json")["users"], client_id=client_id)
+    logger.info(f"Sent {len(users)} seeded users to worker {client_id} that joined during the test.")
+
+
+def setup_seeds(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Подготавливает сидинговые данные (environment.seeds и environment.seeds_pool) с учётом роли процесса Locust.
+
+    - Локальный запуск: данные генерируются (или переиспользуются) и загружаются целиком.
+    - Мастер: данные генерируются один раз, а при каждом старте теста мастер рассылает
+      воркерам непересекающиеся части через канал сообщений Locust.
+    - Воркер: данные не генерируются. Воркер хранит только свою часть, полученную от мастера.
+      Мастер отправляет её до команды на запуск пользователей, поэтому к старту
+      виртуальных пользователей данные уже на месте. Воркер, подключившийся во время теста, запрашивает
+      свою часть при инициализации (см. send_late_worker_seeds_shard) и добавляет её в пул, в котором
+      уже ждут запущенные пользователи. Если пользователи запускаются с пустым пулом, логируется ошибка.
+
+    Вызывается из обработчика events.init сценария.
+
+    :param environment: Окружение Locust.
+    :param seeds_scenario: Сценарий сидинга, данные которого нужны нагрузочному сценарию.
+    """
+    runner = environment.runner
+
+    if isinstance(runner, WorkerRunner):
+        if not hasattr(environment, "seeds_pool"):
+            set_seeds(environment, SeedsResult())
+
+        def on_seeds_shard(msg: Message, **kwargs):
+            shard = SeedsResult.model_validate({"users": msg.data})
+            environment.seeds_pool.revoke(user.user_id for user in environment.seeds.users)
+            environment.seeds_pool.add(shard.users)
+            environment.seeds = shard
+            logger.info(f"[{seeds_scenario.scenario}] Received {len(shard.users)} seeded users.")
+
+        def on_seeds_revoke(msg: Message, **kwargs):
+            revoked = environment.seeds_pool.revoke(msg.data)
+            logger.info(f"[{seeds_scenario.scenario}] Handed {revoked} seeded users over to another worker.")
+
+        runner.register_message(SEEDS_SHARD_MESSAGE, on_seeds_shard)
+        runner.register_message(SEEDS_REVOKE_MESSAGE, on_seeds_revoke)
+        runner.send_message(SEEDS_REQUEST_MESSAGE)
+        return
+
+    seeds_scenario.build()
+    set_seeds(environment, seeds_scenario.load())
+
+    if isinstance(runner, MasterRunner):
+        environment.seeds_shards = {}
+
+        @environment.events.test_start.add_listener
+        def on_test_start(environment: Environment, **kwargs):
+            environment.seeds_shards = send_seeds_shards(runner, environment.seeds)
+
+        def on_seeds_request(msg: Message, **kwargs):
+            if runner.state in (STATE_SPAWNING, STATE_RUNNING):
+                send_late_worker_seeds_shard(runner, environment.seeds, environment.seeds_shards, msg.node_id)
+
+        runner.register_message(SEEDS_REQUEST_MESSAGE, on_seeds_request)
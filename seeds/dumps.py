@@ -1,10 +1,19 @@
+import mmap
 import os
+from typing import Callable, Iterable
 
-from seeds.schema.result import SeedsResult
+from seeds.mapped import MappedSeedsResult, SeedsBinaryLayout, get_seed_user_ids, read_seeds_binary, write_seeds_binary
+from seeds.schema.meta import SeedsMeta
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.streamed import StreamedSeedsResult, StreamedSeedUsers
+from tools.config.seeds import SeedsDumpFormat
 from tools.logger import get_logger
 
 logger = get_logger("SEEDS_DUMPS")
 
+# Результат сидинга, загруженный из дампа любого формата (см. SeedsDumpFormat)
+LoadedSeedsResult = SeedsResult | MappedSeedsResult | StreamedSeedsResult
+
 
 def save_seeds_result(result: SeedsResult, scenario: str):
     """
@@ -23,6 +32,127 @@ def save_seeds_result(result: SeedsResult, scenario: str):
         logger.debug(f"Seeding result saved to file: {seeds_file}")
 
 
+def save_seeds_users(users: Iterable[SeedUserResult], scenario: str):
+    """
+    Сохраняет пользователей в JSON-файл результата сидинга потоково, не собирая SeedsResult в памяти.
+
+    Формат файла совпадает с save_seeds_result. Запись идёт во временный файл, который затем
+    атомарно заменяет дамп, поэтому прерванная запись не портит существующий дамп.
+
+    :param users: Пользователи (например, итератор по журналу сидинга).
+    :param scenario: Название сценария нагрузки, для которого создаются данные.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    seeds_file = f"./dumps/{scenario}_seeds.json"
+    with open(f"{seeds_file}.tmp", 'w', encoding="utf-8") as file:
+        file.write('{"users":[')
+        for index, user in enumerate(users):
+            if index:
+                file.write(",")
+            file.write(user.model_dump_json())
+        file.write("]}")
+
+    os.replace(f"{seeds_file}.tmp", seeds_file)
+    logger.debug(f"Seeding result saved to file: {seeds_file}")
+
+
+def save_seeds_binary(users: Callable[[], Iterable[SeedUserResult]], scenario: str):
+    """
+    Сохраняет пользователей в бинарный дамп (см. SeedsBinaryLayout) потоково, не собирая их в памяти.
+
+    Пользователи читаются дважды: первый проход определяет количество пользователей, структуру записи
+    и ширину слота идентификатора, второй записывает файл. Запись идёт во временный файл,
+    который затем атомарно заменяет дамп.
+
+    :param users: Функция, возвращающая новый итератор пользователей (например, SeedsJournal.iter_users).
+    :param scenario: Название сценария нагрузки, для которого создаются данные.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    count, id_width, first_user = 0, 1, None
+    for user in users():
+        count += 1
+        if first_user is None:
+            first_user = user
+        id_width = max(id_width, *(len(value.encode()) for value in get_seed_user_ids(user)))
+
+    layout = SeedsBinaryLayout(id_width=id_width, accounts={})
+    if first_user is not None:
+        layout = SeedsBinaryLayout.from_user(first_user, id_width=id_width)
+
+    seeds_file = f"./dumps/{scenario}_seeds.bin"
+    with open(f"{seeds_file}.tmp", 'wb') as file:
+        write_seeds_binary(file, users=users(), count=count, layout=layout)
+
+    os.replace(f"{seeds_file}.tmp", seeds_file)
+    logger.debug(f"Seeding result saved to file: {seeds_file} ({layout.record_size} bytes per user)")
+
+
+def load_seeds_binary(scenario: str) -> MappedSeedsResult:
+    """
+    Отображает бинарный дамп в память. Записи пользователей не читаются:
+    пользователи собираются в модели только при обращении к ним.
+
+    :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
+    :return: Объект MappedSeedsResult с ленивой последовательностью пользователей.
+    """
+    with open(f'./dumps/{scenario}_seeds.bin', 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    logger.debug(f"Seeding result mapped from file: ./dumps/{scenario}_seeds.bin")
+    return MappedSeedsResult(users=read_seeds_binary(buffer))
+
+
+def save_seeds_jsonl(users: Iterable[SeedUserResult], scenario: str):
+    """
+    Сохраняет пользователей в дамп формата JSON Lines (по строке на пользователя) потоково.
+    Запись идёт во временный файл, который затем атомарно заменяет дамп.
+
+    :param users: Пользователи (например, итератор по журналу сидинга).
+    :param scenario: Название сценария нагрузки, для которого создаются данные.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    seeds_file = f"./dumps/{scenario}_seeds.jsonl"
+    with open(f"{seeds_file}.tmp", 'w', encoding="utf-8") as file:
+        for user in users:
+            file.write(user.model_dump_json() + "\n")
+
+    os.replace(f"{seeds_file}.tmp", seeds_file)
+    logger.debug(f"Seeding result saved to file: {seeds_file}")
+
+
+def load_seeds_jsonl(scenario: str) -> StreamedSeedsResult:
+    """
+    Открывает дамп формата JSON Lines для потокового чтения. Пользователи не читаются заранее.
+
+    :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
+    :return: Объект StreamedSeedsResult, пользователи которого читаются из файла при переборе.
+    """
+    seeds_file = f"./dumps/{scenario}_seeds.jsonl"
+    if not os.path.exists(seeds_file):
+        raise FileNotFoundError(seeds_file)
+
+    logger.debug(f"Seeding result streamed from file: {seeds_file}")
+    return StreamedSeedsResult(users=StreamedSeedUsers(seeds_file))
+
+
+def get_seeds_dump_file(scenario: str, dump_format: SeedsDumpFormat) -> str:
+    """
+    Возвращает путь к файлу дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :param dump_format: Формат дампа.
+    :return: Путь к файлу дампа.
+    """
+    extension = {SeedsDumpFormat.BINARY: "bin", SeedsDumpFormat.JSONL: "jsonl"}.get(dump_format, "json")
+    return f"./dumps/{scenario}_seeds.{extension}"
+
+
 def load_seeds_result(scenario: str) -> SeedsResult:
     """
     Загружает результат сидинга из JSON-файла.
@@ -33,4 +163,40 @@ def load_seeds_result(scenario: str) -> SeedsResult:
     # Открываем файл и валидируем его как объект SeedsResult
     with open(f'./dumps/{scenario}_seeds.json', 'r', encoding="utf-8") as file:
         logger.debug(f"Seeding result loaded from file: ./dumps/{scenario}_seeds.json")
-        return SeedsResult.model_validate_json(file.read())
\ No newline at end of file
+        return SeedsResult.model_validate_json(file.read())
+
+
+def save_seeds_meta(meta: SeedsMeta, scenario: str):
+    """
+    Сохраняет метаданные дампа сидинга (SeedsMeta) в JSON-файл рядом с результатом.
+
+    :param meta: Метаданные дампа.
+    :param scenario: Название сценария нагрузки, для которого создаются данные.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    meta_file = f"./dumps/{scenario}_seeds.meta.json"
+    with open(meta_file, 'w+', encoding="utf-8") as file:
+        file.write(meta.model_dump_json())
+        logger.debug(f"Seeding meta saved to file: {meta_file}")
+
+
+def load_seeds_meta(scenario: str) -> SeedsMeta | None:
+    """
+    Загружает метаданные дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Объект SeedsMeta или None, если дампа (в формате из метаданных) или его метаданных нет.
+    """
+    meta_file = f"./dumps/{scenario}_seeds.meta.json"
+    if not os.path.exists(meta_file):
+        return None
+
+    with open(meta_file, 'r', encoding="utf-8") as file:
+        meta = SeedsMeta.model_validate_json(file.read())
+
+    if not os.path.exists(get_seeds_dump_file(scenario, meta.dump_format)):
+        return None
+
+    return meta
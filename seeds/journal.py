@@ -0,0 +1,127 @@
+import os
+from typing import Iterator, TextIO
+
+from pydantic import ValidationError
+
+from seeds.schema.meta import SeedsJournalHeader
+from seeds.schema.result import SeedUserResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_JOURNAL")
+
+
+class SeedsJournal:
+    """
+    Журнал сидинга — append-only файл в формате JSON Lines (dumps/<scenario>_seeds.journal.jsonl).
+
+    Первая строка — заголовок с отпечатком плана (SeedsJournalHeader), далее по строке на каждого
+    созданного пользователя. Пользователь записывается сразу после создания, поэтому при падении
+    сидинга уже созданные пользователи не теряются, а следующий запуск продолжает с места остановки.
+    """
+
+    def __init__(self, scenario: str, fingerprint: str):
+        """
+        :param scenario: Название сценария нагрузки.
+        :param fingerprint: Отпечаток плана и окружения. Журнал с другим отпечатком начинается заново.
+        """
+        self.path = f"./dumps/{scenario}_seeds.journal.jsonl"
+        self.fingerprint = fingerprint
+        self.users = 0
+
+        self._file: TextIO | None = None
+
+    def reset(self) -> int:
+        """
+        Начинает журнал заново: записывает только заголовок.
+        :return: Количество пользователей в журнале (0).
+        """
+        with open(self.path, 'w', encoding="utf-8") as file:
+            file.write(SeedsJournalHeader(fingerprint=self.fingerprint).model_dump_json() + "\n")
+
+        return 0
+
+    def recover(self) -> int:
+        """
+        Восстанавливает журнал после предыдущего запуска.
+
+        Журнал с другим отпечатком начинается заново. Недописанная или повреждённая
+        последняя строка (например, при аварийном завершении процесса) отбрасывается.
+
+        :return: Количество пользователей, уже сохранённых в журнале.
+        """
+        if not os.path.exists(self.path):
+            return self.reset()
+
+        users = 0
+        with open(self.path, 'rb') as file:
+            header = file.readline()
+            try:
+                if SeedsJournalHeader.model_validate_json(header).fingerprint != self.fingerprint:
+                    return self.reset()
+            except ValidationError:
+                return self.reset()
+
+            offset = file.tell()
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+
+                try:
+                    SeedUserResult.model_validate_json(line)
+                except ValidationError:
+                    break
+
+                users += 1
+                offset += len(line)
+
+        os.truncate(self.path, offset)
+        return users
+
+    def open(self) -> int:
+        """
+        Открывает журнал для дозаписи, восстанавливая его после предыдущего запуска.
+        :return: Количество пользователей, уже сохранённых в журнале.
+        """
+        if not os.path.exists("dumps"):
+            os.mkdir("dumps")
+
+        self.users = self.recover()
+        self._file = open(self.path, 'a', encoding="utf-8")
+
+        logger.debug(f"Seeding journal opened: {self.path} ({self.users} users)")
+        return self.users
+
+    def append(self, user: SeedUserResult) -> None:
+        """
+        Дописывает пользователя в журнал и сразу сбрасывает буфер на диск.
+        :param user: Созданный пользователь.
+        """
+        self._file.write(user.model_dump_json() + "\n")
+        self._file.flush()
+        self.users += 1
+
+    def close(self) -> None:
+        """
+        Закрывает файл журнала.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def iter_users(self) -> Iterator[SeedUserResult]:
+        """
+        Последовательно читает пользователей из журнала, не загружая его в память целиком.
+        :return: Итератор пользователей в порядке записи.
+        """
+        with open(self.path, 'r', encoding="utf-8") as file:
+            file.readline()
+            for line in file:
+                yield SeedUserResult.model_validate_json(line)
+
+    def remove(self) -> None:
+        """
+        Удаляет журнал (после того как итоговый дамп сохранён).
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+            logger.debug(f"Seeding journal removed: {self.path}")
@@ -0,0 +1,231 @@
+import mmap
+import struct
+from typing import Iterable, Sequence, overload
+
+from pydantic import BaseModel
+
+from seeds.schema.result import SeedUserResult
+
+# Сигнатура бинарного дампа и формат длины заголовка (uint32, little-endian)
+SEEDS_BINARY_MAGIC = b"SEEDSBIN"
+SEEDS_BINARY_HEADER_LENGTH = struct.Struct("<I")
+
+# Поля счетов пользователя и вложенных сущностей счёта в том порядке, в котором их идентификаторы
+# лежат в записи пользователя
+USER_ACCOUNTS_FIELDS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+ACCOUNT_ITEMS_FIELDS = (
+    ("physical_cards", "card_id"),
+    ("virtual_cards", "card_id"),
+    ("top_up_operations", "operation_id"),
+    ("purchase_operations", "operation_id"),
+    ("transfer_operations", "operation_id"),
+    ("cash_withdrawal_operations", "operation_id"),
+)
+
+
+def get_seed_user_ids(user: SeedUserResult) -> list[str]:
+    """
+    Возвращает идентификаторы пользователя в порядке их расположения в записи бинарного дампа.
+    :param user: Пользователь.
+    :return: user_id, затем по каждому счёту account_id и идентификаторы его карт и операций.
+    """
+    ids = [user.user_id]
+    for field in USER_ACCOUNTS_FIELDS:
+        for account in getattr(user, field):
+            ids.append(account.account_id)
+            for items_field, id_field in ACCOUNT_ITEMS_FIELDS:
+                ids.extend(getattr(item, id_field) for item in getattr(account, items_field))
+
+    return ids
+
+
+class SeedsBinaryLayout(BaseModel):
+    """
+    Структура записи пользователя в бинарном дампе.
+
+    Все пользователи одного дампа созданы по одному плану, поэтому у них одинаковое количество
+    счетов, карт и операций. Запись пользователя — это последовательность идентификаторов
+    фиксированной ширины: user_id, затем по каждому счёту account_id и идентификаторы
+    его карт и операций (порядок полей — USER_ACCOUNTS_FIELDS и ACCOUNT_ITEMS_FIELDS).
+
+    Attributes:
+        id_width (int): Ширина слота идентификатора в байтах (идентификаторы дополняются нулевыми байтами).
+        accounts (dict[str, list[list[int]]]): Для каждого поля счетов — список счетов,
+            для каждого счёта — количество элементов в полях ACCOUNT_ITEMS_FIELDS.
+    """
+    id_width: int
+    accounts: dict[str, list[list[int]]]
+
+    @classmethod
+    def from_user(cls, user: SeedUserResult, id_width: int) -> "SeedsBinaryLayout":
+        """
+        Строит структуру записи по форме пользователя.
+        :param user: Любой пользователь дампа.
+        :param id_width: Ширина слота идентификатора в байтах.
+        :return: Структура записи.
+        """
+        return cls(
+            id_width=id_width,
+            accounts={
+                field: [
+                    [len(getattr(account, items_field)) for items_field, _ in ACCOUNT_ITEMS_FIELDS]
+                    for account in getattr(user, field)
+                ]
+                for field in USER_ACCOUNTS_FIELDS
+            }
+        )
+
+    @property
+    def slots(self) -> int:
+        """
+        Количество идентификаторов в записи пользователя.
+        """
+        return 1 + sum(1 + sum(counts) for accounts in self.accounts.values() for counts in accounts)
+
+    @property
+    def record_size(self) -> int:
+        """
+        Размер записи пользователя в байтах.
+        """
+        return self.slots * self.id_width
+
+    def encode(self, user: SeedUserResult) -> bytes:
+        """
+        Кодирует пользователя в запись фиксированного размера.
+        :param user: Пользователь.
+        :return: Запись размером record_size байт.
+        :raises ValueError: Форма пользователя не совпадает со структурой записи.
+        """
+        if SeedsBinaryLayout.from_user(user, self.id_width).accounts != self.accounts:
+            raise ValueError(f"Seeded user {user.user_id} does not match the binary dump layout")
+
+        return b"".join(value.encode().ljust(self.id_width, b"\0") for value in get_seed_user_ids(user))
+
+    def decode(self, record: bytes | memoryview) -> SeedUserResult:
+        """
+        Собирает пользователя из записи.
+        :param record: Запись размером record_size байт.
+        :return: Пользователь со всеми счетами, картами и операциями.
+        """
+        width = self.id_width
+        ids = iter([
+            bytes(record[offset:offset + width]).rstrip(b"\0").decode()
+            for offset in range(0, len(record), width)
+        ])
+
+        user = {"user_id": next(ids)}
+        for field, accounts in self.accounts.items():
+            user[field] = []
+            for counts in accounts:
+                account = {"account_id": next(ids)}
+                for (items_field, id_field), count in zip(ACCOUNT_ITEMS_FIELDS, counts):
+                    account[items_field] = [{id_field: next(ids)} for _ in range(count)]
+                user[field].append(account)
+
+        return SeedUserResult.model_validate(user)
+
+
+class SeedsBinaryHeader(BaseModel):
+    """
+    Заголовок бинарного дампа.
+
+    Attributes:
+        users (int): Количество пользователей в дампе.
+        layout (SeedsBinaryLayout): Структура записи пользователя.
+    """
+    users: int
+    layout: SeedsBinaryLayout
+
+
+class MappedSeedUsers(Sequence[SeedUserResult]):
+    """
+    Пользователи бинарного дампа, отображённого в память.
+
+    Файл не читается целиком: операционная система подгружает страницы по мере обращения,
+    а модель SeedUserResult собирается только при обращении по индексу. Поэтому время загрузки
+    и занимаемая память не зависят от размера дампа.
+    """
+
+    def __init__(self, buffer: mmap.mmap | bytes, offset: int, header: SeedsBinaryHeader):
+        """
+        :param buffer: Содержимое файла дампа (mmap или bytes).
+        :param offset: Смещение первой записи от начала буфера.
+        :param header: Заголовок дампа.
+        """
+        self.header = header
+        self._buffer = memoryview(buffer)
+        self._offset = offset
+        self._record_size = header.layout.record_size
+
+    def __len__(self) -> int:
+        return self.header.users
+
+    @overload
+    def __getitem__(self, index: int) -> SeedUserResult:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[SeedUserResult]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> SeedUserResult | list[SeedUserResult]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Seeded user index out of range")
+
+        start = self._offset + index * self._record_size
+        return self.header.layout.decode(self._buffer[start:start + self._record_size])
+
+
+class MappedSeedsResult:
+    """
+    Результат сидинга, загруженный из бинарного дампа.
+    Повторяет интерфейс SeedsResult для чтения: пользователи доступны через users.
+    """
+
+    def __init__(self, users: MappedSeedUsers):
+        """
+        :param users: Пользователи дампа.
+        """
+        self.users = users
+
+
+def write_seeds_binary(file, users: Iterable[SeedUserResult], count: int, layout: SeedsBinaryLayout) -> None:
+    """
+    Записывает бинарный дамп в открытый файл: сигнатура, длина заголовка, заголовок (JSON), записи пользователей.
+
+    :param file: Файл, открытый на запись в бинарном режиме.
+    :param users: Пользователи.
+    :param count: Количество пользователей.
+    :param layout: Структура записи пользователя.
+    """
+    header = SeedsBinaryHeader(users=count, layout=layout).model_dump_json().encode()
+
+    file.write(SEEDS_BINARY_MAGIC)
+    file.write(SEEDS_BINARY_HEADER_LENGTH.pack(len(header)))
+    file.write(header)
+    for user in users:
+        file.write(layout.encode(user))
+
+
+def read_seeds_binary(buffer: mmap.mmap | bytes) -> MappedSeedUsers:
+    """
+    Разбирает заголовок бинарного дампа, не читая записи пользователей.
+
+    :param buffer: Содержимое файла дампа (mmap или bytes).
+    :return: Ленивая последовательность пользователей дампа.
+    :raises ValueError: Буфер не является бинарным дампом.
+    """
+    if buffer[:len(SEEDS_BINARY_MAGIC)] != SEEDS_BINARY_MAGIC:
+        raise ValueError("Not a binary seeds dump")
+
+    offset = len(SEEDS_BINARY_MAGIC)
+    (header_length,) = SEEDS_BINARY_HEADER_LENGTH.unpack_from(buffer, offset)
+    offset += SEEDS_BINARY_HEADER_LENGTH.size
+
+    header = SeedsBinaryHeader.model_validate_json(buffer[offset:offset + header_length])
+    return MappedSeedUsers(buffer=buffer, offset=offset + header_length, header=header)
@@ -0,0 +1,222 @@
+from collections import Counter
+from typing import Iterable, Sequence
+
+from gevent.queue import Queue, Empty
+
+from seeds.schema.result import SeedUserResult
+from tools.config.seeds import SeedsPoolPolicy
+
+
+class SeedUsersPoolExhaustedError(Exception):
+    """
+    Все пользователи пула выданы, а политика пула не позволяет ждать или выдавать их повторно.
+    """
+
+
+class SeedUsersPoolStats:
+    """
+    Статистика пула сидинговых пользователей.
+
+    Attributes:
+        total: Количество пользователей в пуле (для потокового источника — сколько уже прочитано).
+        in_use: Количество пользователей, выданных виртуальным пользователям в данный момент.
+        peak_in_use: Максимальное значение in_use за время жизни пула.
+        checkouts: Общее количество выдач.
+        recycled: Количество повторных (не эксклюзивных) выдач при политике recycle.
+        waits: Количество выдач, которым пришлось ждать освобождения пользователя при политике block.
+    """
+
+    def __init__(self, total: int):
+        self.total = total
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.recycled = 0
+        self.waits = 0
+
+    @property
+    def utilization(self) -> float:
+        """
+        Доля пользователей пула, выданных в данный момент (от 0 до 1).
+        """
+        return self.in_use / self.total if self.total else 0.0
+
+
+class SeedUsersPool:
+    """
+    Пул сидинговых пользователей с эксклюзивной арендой.
+
+    Виртуальный пользователь Locust берёт пользователя через checkout() и возвращает через release(),
+    поэтому два виртуальных пользователя не работают с одним и тем же пользователем (и его счетами)
+    одновременно. Выдача и возврат выполняются за O(1). Пул рассчитан на гринлеты одного процесса:
+    ожидание при политике block не блокирует остальные гринлеты.
+
+    Пул хранит только индексы пользователей: сам пользователь берётся из последовательности при выдаче,
+    поэтому ленивые последовательности (MappedSeedUsers) собирают модели только для выданных пользователей.
+    Если вместо последовательности передан потоковый источник (StreamedSeedUsers), пул читает из него
+    следующего пользователя только тогда, когда свободных пользователей нет, и хранит лишь прочитанных.
+    """
+
+    def __init__(self, users: Iterable[SeedUserResult], policy: SeedsPoolPolicy, timeout: float | None = None):
+        """
+        :param users: Пользователи, которыми управляет пул: список, ленивая последовательность
+            или потоковый источник, который читается по мере выдачи.
+        :param policy: Поведение при исчерпании пула.
+        :param timeout: Сколько секунд ждать свободного пользователя при политике block (None — без ограничения).
+        """
+        self.policy = policy
+        self.timeout = timeout
+
+        self._source = None
+        self._users = users
+        if not isinstance(users, Sequence):
+            self._source = iter(users)
+            self._users = []
+
+        self.stats = SeedUsersPoolStats(total=len(self._users))
+
+        self._free = Queue(items=range(len(self._users)))
+        self._leases: Counter[int] = Counter()
+        self._indexes: dict[str, int] = {}
+        self._revoked: set[int] = set()
+        self._recycle_index = 0
+
+    def checkout(self) -> SeedUserResult:
+        """
+        Выдаёт пользователя из пула.
+
+        :return: Пользователь, закреплённый за вызывающим до вызова release().
+        :raises SeedUsersPoolExhaustedError: Пул исчерпан при политике fail, не дождался пользователя
+            при политике block, либо в пуле нет ни одного пользователя при политике fail/recycle.
+        """
+        try:
+            index = self._free.get_nowait()
+        except Empty:
+            index = self._read_next()
+            if index is None:
+                index = self._checkout_exhausted()
+
+        if not self._leases[index]:
+            self.stats.in_use += 1
+            self.stats.peak_in_use = max(self.stats.peak_in_use, self.stats.in_use)
+
+        user = self._users[index]
+        self._leases[index] += 1
+        self._indexes[user.user_id] = index
+        self.stats.checkouts += 1
+        return user
+
+    def _read_next(self) -> int | None:
+        if self._source is None:
+            return None
+
+        user = next(self._source, None)
+        if user is None:
+            self._source = None
+            return None
+
+        self._users.append(user)
+        self.stats.total += 1
+        return len(self._users) - 1
+
+    def _checkout_exhausted(self) -> int:
+        # При политике block пустой пул тоже ждёт: пользователей могут добавить позже через add()
+        if self.policy == SeedsPoolPolicy.BLOCK:
+            self.stats.waits += 1
+            try:
+                return self._free.get(timeout=self.timeout)
+            except Empty:
+                raise SeedUsersPoolExhaustedError(f"No seed user was released within {self.timeout}s")
+
+        if not self.stats.total:
+            raise SeedUsersPoolExhaustedError("Seed users pool is empty")
+
+        if self.policy == SeedsPoolPolicy.RECYCLE:
+            self.stats.recycled += 1
+            while True:
+                index = self._recycle_index % len(self._users)
+                self._recycle_index = index + 1
+                if index not in self._revoked:
+                    return index
+
+        raise SeedUsersPoolExhaustedError(f"All {self.stats.total} seed users are checked out")
+
+    def release(self, user: SeedUserResult) -> None:
+        """
+        Возвращает пользователя в пул. Повторно выданный (recycle) пользователь становится
+        свободным только после того, как его вернут все, кому он был выдан.
+
+        :param user: Пользователь, полученный через checkout().
+        """
+        index = self._indexes.get(user.user_id)
+        if index is None:
+            return
+
+        self._leases[index] -= 1
+        if not self._leases[index]:
+            del self._leases[index]
+            del self._indexes[user.user_id]
+            self.stats.in_use -= 1
+            if index not in self._revoked:
+                self._free.put(index)
+
+    def add(self, users: Iterable[SeedUserResult]) -> int:
+        """
+        Добавляет пользователей в пул, например, часть сидинговых данных, которую воркер получил от мастера
+        уже после запуска виртуальных пользователей. Ожидающие при политике block получают их сразу.
+        Пользователи, которые уже есть в пуле, пропускаются, а отозванные через revoke() возвращаются в пул.
+
+        :param users: Пользователи.
+        :return: Количество добавленных пользователей.
+        """
+        self._users = list(self._users)
+        indexes = {user.user_id: index for index, user in enumerate(self._users)}
+
+        added = 0
+        for user in users:
+            index = indexes.get(user.user_id)
+            if index is None:
+                self._users.append(user)
+                index = indexes[user.user_id] = len(self._users) - 1
+            elif index in self._revoked:
+                self._revoked.discard(index)
+            else:
+                continue
+
+            added += 1
+            if not self._leases[index]:
+                self._free.put(index)
+
+        self.stats.total += added
+        return added
+
+    def revoke(self, user_ids: Iterable[str]) -> int:
+        """
+        Убирает пользователей из пула, например, когда мастер передаёт их другому воркеру.
+        Свободные пользователи больше не выдаются, а выданные не возвращаются в пул после release().
+
+        :param user_ids: Идентификаторы пользователей.
+        :return: Количество убранных пользователей.
+        """
+        user_ids = set(user_ids)
+        revoked = {
+            index for index, user in enumerate(self._users)
+            if user.user_id in user_ids and index not in self._revoked
+        }
+        if not revoked:
+            return 0
+
+        self._revoked |= revoked
+        free: list[int] = []
+        while True:
+            try:
+                free.append(self._free.get_nowait())
+            except Empty:
+                break
+
+        for index in free:
+            if index not in revoked:
+                self._free.put(index)
+
+        self.stats.total -= len(revoked)
+        return len(revoked)
@@ -1,9 +1,30 @@
+import hashlib
+import random
 from abc import ABC, abstractmethod
+from datetime import datetime
+from itertools import islice
+from typing import Iterator, Sequence
 
+from config import settings
+from seeds.async_builder import stream_async_seeds_users
 from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from seeds.dumps import (
+    save_seeds_result,
+    save_seeds_users,
+    save_seeds_binary,
+    load_seeds_result,
+    load_seeds_binary,
+    save_seeds_jsonl,
+    load_seeds_jsonl,
+    save_seeds_meta,
+    load_seeds_meta,
+    LoadedSeedsResult
+)
+from seeds.journal import SeedsJournal
+from seeds.schema.meta import SeedsMeta
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tools.config.seeds import SeedsEngine, SeedsDumpFormat
 from tools.logger import get_logger
 
 logger = get_logger("SEEDS_SCENARIO")
@@ -13,6 +34,9 @@ class SeedsScenario(ABC):
     """
     Абстрактный класс для работы со сценариями сидинга.
     Этот класс инкапсулирует общую логику генерации, сохранения и загрузки данных для тестов.
+
+    Вместе с дампом сохраняется отпечаток плана и целевого окружения (см. fingerprint).
+    Если при следующем запуске отпечаток совпадает, повторная генерация не выполняется.
     """
 
     def __init__(self):
@@ -40,6 +64,80 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        Отпечаток дампа: хэш плана сидинга и адресов gateway, в которых создаются данные.
+        Изменение плана или окружения приводит к повторной генерации.
+        """
+        content = "\n".join([
+            self.plan.model_dump_json(),
+            settings.gateway_grpc_client.client_url,
+            str(settings.gateway_http_client.client_url)
+        ])
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def verify_user(self, user: SeedUserResult) -> bool:
+        """
+        Проверяет, что пользователь из дампа и все его счета существуют в целевом окружении.
+        :param user: Пользователь из дампа.
+        :return: True, если пользователь и счета найдены.
+        """
+        expected_account_ids = {
+            account.account_id
+            for accounts in (
+                user.savings_accounts,
+                user.deposit_accounts,
+                user.debit_card_accounts,
+                user.credit_card_accounts
+            )
+            for account in accounts
+        }
+
+        try:
+            self.builder.users_gateway_client.get_user(user.user_id)
+            response = self.builder.accounts_gateway_client.get_accounts(user.user_id)
+        except Exception as error:
+            logger.warning(f"[{self.scenario}] Seeded user {user.user_id} is not available: {error!r}")
+            return False
+
+        missing_account_ids = expected_account_ids - {account.id for account in response.accounts}
+        if missing_account_ids:
+            logger.warning(f"[{self.scenario}] Seeded user {user.user_id} lost accounts: {missing_account_ids}")
+            return False
+
+        return True
+
+    def verify(self, result: LoadedSeedsResult) -> bool:
+        """
+        Выборочно проверяет, что данные из дампа всё ещё существуют (SEEDS.VERIFY_SAMPLE_SIZE пользователей).
+        Для потокового дампа проверяются первые пользователи, чтобы не читать файл целиком.
+        :param result: Загруженный результат сидинга.
+        :return: True, если все проверенные пользователи найдены.
+        """
+        if isinstance(result.users, Sequence):
+            sample_size = min(settings.seeds.verify_sample_size, len(result.users))
+            sample = random.sample(result.users, sample_size)
+        else:
+            sample = list(islice(result.users, settings.seeds.verify_sample_size))
+
+        logger.info(f"[{self.scenario}] Verifying {len(sample)} seeded users.")
+        return all(self.verify_user(user) for user in sample)
+
+    def is_cached(self) -> bool:
+        """
+        Проверяет, можно ли переиспользовать существующий дамп без повторной генерации.
+        :return: True, если отпечаток дампа совпадает с текущим и данные прошли проверку.
+        """
+        meta = load_seeds_meta(scenario=self.scenario)
+        if meta is None or meta.fingerprint != self.fingerprint or meta.dump_format != settings.seeds.dump_format:
+            return False
+
+        if settings.seeds.verify_sample_size > 0 and not self.verify(self.load()):
+            return False
+
+        return True
+
     def save(self, result: SeedsResult) -> None:
         """
         Сохраняет результат сидинга в файл.
@@ -49,22 +147,84 @@ class SeedsScenario(ABC):
         save_seeds_result(result=result, scenario=self.scenario)
         logger.info(f"[{self.scenario}] Seeding result saved successfully.")
 
-    def load(self) -> SeedsResult:
+    def load(self) -> LoadedSeedsResult:
         """
-        Загружает результаты сидинга из файла.
-        :return: Объект SeedsResult, содержащий данные, загруженные из файла.
+        Загружает результаты сидинга из файла в формате SEEDS.DUMP_FORMAT.
+        :return: Объект SeedsResult (json), MappedSeedsResult (binary) или StreamedSeedsResult (jsonl).
         """
         logger.info(f"[{self.scenario}] Loading seeding result from file.")
-        result = load_seeds_result(scenario=self.scenario)
+        if settings.seeds.dump_format == SeedsDumpFormat.BINARY:
+            result = load_seeds_binary(scenario=self.scenario)
+        elif settings.seeds.dump_format == SeedsDumpFormat.JSONL:
+            result = load_seeds_jsonl(scenario=self.scenario)
+        else:
+            result = load_seeds_result(scenario=self.scenario)
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
         return result
 
+    def build_users(self, count: int) -> Iterator[SeedUserResult]:
+        """
+        Создаёт пользователей по плану сценария выбранным движком (SEEDS.ENGINE).
+        :param count: Сколько пользователей создать.
+        :return: Итератор пользователей в порядке их создания.
+        """
+        if settings.seeds.engine == SeedsEngine.ASYNC:
+            plan = self.plan.model_copy(update={"users": self.plan.users.model_copy(update={"count": count})})
+            return stream_async_seeds_users(plan, protocol="grpc")
+
+        return self.builder.build_users(plan=self.plan.users, count=count)
+
     def build(self) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        При SEEDS.ENGINE=async генерация выполняется асинхронным движком (см. AsyncSeedsBuilder).
+
+        При включённом SEEDS.CACHE генерация пропускается, если дамп для того же плана и окружения уже есть.
+
+        Каждый созданный пользователь сразу дописывается в журнал (см. SeedsJournal). Если предыдущий
+        запуск упал, генерация продолжается с места остановки. Итоговый дамп записывается из журнала
+        потоково в формате SEEDS.DUMP_FORMAT, после чего журнал удаляется.
         """
+        if settings.seeds.cache and self.is_cached():
+            logger.info(f"[{self.scenario}] Seeding result for the same plan and environment found, skipping generation.")
+            return
+
         plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
         logger.info(f"[{self.scenario}] Starting seeding data generation for plan: {plan_json}")
-        result = self.builder.build(self.plan)
+
+        journal = SeedsJournal(scenario=self.scenario, fingerprint=self.fingerprint)
+        created = journal.open()
+        try:
+            if created:
+                logger.info(
+                    f"[{self.scenario}] Resuming seeding from journal: "
+                    f"{created} of {self.plan.users.count} users already created."
+                )
+
+            if created < self.plan.users.count:
+                for user in self.build_users(count=self.plan.users.count - created):
+                    journal.append(user)
+        finally:
+            journal.close()
+
         logger.info(f"[{self.scenario}] Seeding data generation completed.")
-        self.save(result)
\ No newline at end of file
+
+        logger.info(f"[{self.scenario}] Saving seeding result to file.")
+        if settings.seeds.dump_format == SeedsDumpFormat.BINARY:
+            save_seeds_binary(users=journal.iter_users, scenario=self.scenario)
+        elif settings.seeds.dump_format == SeedsDumpFormat.JSONL:
+            save_seeds_jsonl(users=journal.iter_users(), scenario=self.scenario)
+        else:
+            save_seeds_users(users=journal.iter_users(), scenario=self.scenario)
+
+        save_seeds_meta(
+            meta=SeedsMeta(
+                fingerprint=self.fingerprint,
+                users=journal.users,
+                created_at=datetime.now(),
+                dump_format=settings.seeds.dump_format
+            ),
+            scenario=self.scenario
+        )
+        journal.remove()
+        logger.info(f"[{self.scenario}] Seeding result saved successfully.")
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from tools.config.seeds import SeedsDumpFormat
+
+
+class SeedsMeta(BaseModel):
+    """
+    Метаданные дампа сидинга, сохраняемые рядом с результатом.
+
+    Attributes:
+        fingerprint (str): Хэш плана сидинга и целевого окружения, для которых создан дамп.
+        users (int): Количество пользователей в дампе.
+        created_at (datetime): Время создания дампа.
+        dump_format (SeedsDumpFormat): Формат файла дампа.
+    """
+    fingerprint: str
+    users: int
+    created_at: datetime
+    dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON
+
+
+class SeedsJournalHeader(BaseModel):
+    """
+    Заголовок журнала сидинга (первая строка файла журнала).
+
+    Attributes:
+        fingerprint (str): Хэш плана сидинга и целевого окружения, для которых ведётся журнал.
+    """
+    fingerprint: str
@@ -0,0 +1,38 @@
+from typing import Iterable, Iterator
+
+from seeds.schema.result import SeedUserResult
+
+
+class StreamedSeedUsers(Iterable[SeedUserResult]):
+    """
+    Пользователи дампа в формате JSON Lines, читаемые потоково.
+
+    Файл не загружается целиком: каждый проход открывает его заново и разбирает
+    по одной строке на пользователя. Пул сидинговых пользователей читает следующего
+    пользователя только при выдаче, поэтому запуск Locust не зависит от размера дампа,
+    а в памяти остаются только пользователи, до которых дошёл процесс.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Путь к файлу дампа в формате JSON Lines.
+        """
+        self.path = path
+
+    def __iter__(self) -> Iterator[SeedUserResult]:
+        with open(self.path, 'rb') as file:
+            for line in file:
+                yield SeedUserResult.model_validate_json(line)
+
+
+class StreamedSeedsResult:
+    """
+    Результат сидинга, загруженный из дампа в формате JSON Lines.
+    Повторяет интерфейс SeedsResult для чтения: пользователи доступны через users (только для перебора).
+    """
+
+    def __init__(self, users: StreamedSeedUsers):
+        """
+        :param users: Пользователи дампа.
+        """
+        self.users = users
@@ -0,0 +1,161 @@
+import json
+from typing import Any, Callable
+
+import pytest
+from httpx import QueryParams, Request
+from pydantic import BaseModel
+
+from clients.http.gateway.accounts.client import (
+    serialize_get_accounts_query,
+    serialize_open_deposit_account_request,
+    serialize_open_savings_account_request,
+    serialize_open_debit_card_account_request,
+    serialize_open_credit_card_account_request
+)
+from clients.http.gateway.accounts.schema import (
+    GetAccountsQuerySchema,
+    OpenDepositAccountRequestSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenCreditCardAccountRequestSchema
+)
+from clients.http.gateway.cards.client import serialize_issue_virtual_card_request, serialize_issue_physical_card_request
+from clients.http.gateway.cards.schema import IssueVirtualCardRequestSchema, IssuePhysicalCardRequestSchema
+from clients.http.gateway.operations.client import (
+    serialize_get_operations_query,
+    serialize_get_operations_summary_query,
+    serialize_make_fee_operation_request,
+    serialize_make_top_up_operation_request,
+    serialize_make_cashback_operation_request,
+    serialize_make_transfer_operation_request,
+    serialize_make_purchase_operation_request,
+    serialize_make_bill_payment_operation_request,
+    serialize_make_cash_withdrawal_operation_request
+)
+from clients.http.gateway.operations.schema import (
+    OperationStatus,
+    GetOperationsQuerySchema,
+    GetOperationsSummaryQuerySchema,
+    MakeFeeOperationRequestSchema,
+    MakeTopUpOperationRequestSchema,
+    MakeCashBackOperationRequestSchema,
+    MakeTransferOperationRequestSchema,
+    MakePurchaseOperationRequestSchema,
+    MakeBillPaymentOperationRequestSchema,
+    MakeCashWithdrawalOperationRequestSchema
+)
+from clients.http.gateway.users.client import serialize_create_user_request
+from clients.http.gateway.users.schema import CreateUserRequestSchema
+
+# Строки с не-ASCII символами, кавычками, обратным слэшем и управляющими символами,
+# которые JSON-кодировщик должен экранировать так же, как httpx
+STRINGS = [
+    "0b4a6c3e-2f1d-4c8e-9a7b-5d6e7f8a9b0c",
+    "Ёжик в тумане",
+    'кавычки "двойные" и \'одинарные\'',
+    "слэши \\ / и управляющие \n\t\r\x00\x1f символы",
+    "эмодзи 😀, иероглифы 漢字 и разделители   ",
+    "",
+]
+
+AMOUNTS = [0.1, 1.0, 123.45, 1e16, 1e-7, 99999.99]
+
+JSON_SERIALIZERS: list[tuple[Callable[..., bytes], type[BaseModel]]] = [
+    (serialize_create_user_request, CreateUserRequestSchema),
+    (serialize_issue_virtual_card_request, IssueVirtualCardRequestSchema),
+    (serialize_issue_physical_card_request, IssuePhysicalCardRequestSchema),
+    (serialize_open_deposit_account_request, OpenDepositAccountRequestSchema),
+    (serialize_open_savings_account_request, OpenSavingsAccountRequestSchema),
+    (serialize_open_debit_card_account_request, OpenDebitCardAccountRequestSchema),
+    (serialize_open_credit_card_account_request, OpenCreditCardAccountRequestSchema),
+    (serialize_make_fee_operation_request, MakeFeeOperationRequestSchema),
+    (serialize_make_top_up_operation_request, MakeTopUpOperationRequestSchema),
+    (serialize_make_cashback_operation_request, MakeCashBackOperationRequestSchema),
+    (serialize_make_transfer_operation_request, MakeTransferOperationRequestSchema),
+    (serialize_make_purchase_operation_request, MakePurchaseOperationRequestSchema),
+    (serialize_make_bill_payment_operation_request, MakeBillPaymentOperationRequestSchema),
+    (serialize_make_cash_withdrawal_operation_request, MakeCashWithdrawalOperationRequestSchema),
+]
+
+QUERY_SERIALIZERS: list[tuple[Callable[..., dict[str, Any]], type[BaseModel]]] = [
+    (serialize_get_accounts_query, GetAccountsQuerySchema),
+    (serialize_get_operations_query, GetOperationsQuerySchema),
+    (serialize_get_operations_summary_query, GetOperationsSummaryQuerySchema),
+]
+
+
+def build_values(schema: type[BaseModel], index: int) -> dict[str, Any]:
+    """
+    Подбирает значения всех полей схемы: строки и суммы по кругу из STRINGS и AMOUNTS, статус — из OperationStatus.
+    """
+    values = {}
+    for position, (name, field) in enumerate(schema.model_fields.items()):
+        if field.annotation is float:
+            values[name] = AMOUNTS[(index + position) % len(AMOUNTS)]
+        elif field.annotation is OperationStatus:
+            values[name] = list(OperationStatus)[(index + position) % len(OperationStatus)]
+        elif name == "email":
+            values[name] = f"user.{index}@example.com"
+        else:
+            values[name] = STRINGS[(index + position) % len(STRINGS)]
+
+    return values
+
+
+def build_httpx_body(schema: type[BaseModel], values: dict[str, Any]) -> bytes:
+    return Request("POST", "http://localhost", json=schema(**values).model_dump(by_alias=True)).content
+
+
+@pytest.mark.parametrize("serialize, schema", JSON_SERIALIZERS, ids=lambda value: getattr(value, "__name__", ""))
+@pytest.mark.parametrize("index", range(len(STRINGS)))
+def test_json_serializer_matches_httpx(serialize: Callable[..., bytes], schema: type[BaseModel], index: int):
+    values = build_values(schema, index)
+
+    assert serialize(**values) == build_httpx_body(schema, values)
+
+
+@pytest.mark.parametrize("serialize, schema", JSON_SERIALIZERS, ids=lambda value: getattr(value, "__name__", ""))
+def test_json_serializer_fills_defaults_like_schema(serialize: Callable[..., bytes], schema: type[BaseModel]):
+    required = {name: STRINGS[1] for name, field in schema.model_fields.items() if field.is_required()}
+    body = serialize(**required)
+
+    assert schema.model_validate_json(body).model_dump(include=set(required)) == required
+    assert list(json.loads(body)) == list(schema(**required).model_dump(by_alias=True))
+
+
+@pytest.mark.parametrize(
+    "serialize, schema",
+    [pair for pair in JSON_SERIALIZERS if any(field.annotation is float for field in pair[1].model_fields.values())],
+    ids=lambda value: getattr(value, "__name__", "")
+)
+@pytest.mark.parametrize("amount", [float("nan"), float("inf"), float("-inf")], ids=repr)
+def test_json_serializer_rejects_non_finite_floats_like_httpx(
+        serialize: Callable[..., bytes],
+        schema: type[BaseModel],
+        amount: float
+):
+    values = {
+        name: amount if field.annotation is float else value
+        for (name, value), field in zip(build_values(schema, 0).items(), schema.model_fields.values())
+    }
+
+    with pytest.raises(ValueError, match="Out of range float values are not JSON compliant"):
+        build_httpx_body(schema, values)
+
+    with pytest.raises(ValueError, match="Out of range float values are not JSON compliant"):
+        serialize(**values)
+
+
+@pytest.mark.parametrize("serialize, schema", QUERY_SERIALIZERS, ids=lambda value: getattr(value, "__name__", ""))
+@pytest.mark.parametrize("value", [*STRINGS, "a&b=c?d#e+f%20g"])
+def test_query_serializer_matches_query_params(
+        serialize: Callable[..., dict[str, Any]],
+        schema: type[BaseModel],
+        value: str
+):
+    values = {name: value for name in schema.model_fields}
+    expected = QueryParams(**schema(**values).model_dump(by_alias=True))
+
+    assert QueryParams(serialize(**values)) == expected
+    assert Request("GET", "http://localhost/api", params=serialize(**values)).url == \
+           Request("GET", "http://localhost/api", params=expected).url
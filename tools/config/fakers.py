@@ -0,0 +1,34 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class FakeMode(StrEnum):
+    """
+    Режим генерации тестовых данных (tools.fakers.fake).
+
+    DIRECT — каждое значение генерируется провайдером Faker в момент запроса.
+    POOLED — значения генерируются пачками заранее и выдаются из кольцевых буферов (PooledFake).
+    """
+    DIRECT = "direct"
+    POOLED = "pooled"
+
+
+class FakersConfig(BaseModel):
+    """
+    Настройки генерации тестовых данных.
+
+    mode — режим генерации.
+    pool_size — размер кольцевого буфера для каждого вида значений в режиме pooled.
+    pool_refresh — в режиме pooled перегенерировать буферы в фоновом гринлете, чтобы последовательность
+    значений не повторялась каждые pool_size значений.
+    seed — seed прогона (None — случайные данные). Из него выводятся подпотоки воркеров и виртуальных
+    пользователей (в режиме direct), поэтому запуск с тем же seed и той же конфигурацией нагрузки
+    повторяет последовательность тел запросов (кроме уникальных email).
+    run_id — идентификатор прогона в уникальных email (None — генерируется из времени запуска процесса).
+    """
+    mode: FakeMode = FakeMode.DIRECT
+    pool_size: int = 10_000
+    pool_refresh: bool = True
+    seed: int | None = None
+    run_id: str | None = None
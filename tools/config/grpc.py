@@ -1,9 +1,34 @@
+from enum import StrEnum
+
 from pydantic import BaseModel
 
 
+class GRPCChannelStrategy(StrEnum):
+    """
+    Стратегия выбора канала из пула для очередного вызова.
+
+    ROUND_ROBIN — каналы выбираются по кругу.
+    LEAST_OUTSTANDING — выбирается канал с наименьшим числом незавершённых вызовов.
+    """
+    ROUND_ROBIN = "round_robin"
+    LEAST_OUTSTANDING = "least_outstanding"
+
+
+class GRPCChannelPoolConfig(BaseModel):
+    """
+    Настройки пула gRPC-каналов, общего для всех виртуальных пользователей воркера.
+
+    channels — количество каналов (HTTP/2 соединений) к grpc-gateway на один процесс.
+    strategy — стратегия распределения вызовов между каналами.
+    """
+    channels: int = 1
+    strategy: GRPCChannelStrategy = GRPCChannelStrategy.ROUND_ROBIN
+
+
 class GRPCClientConfig(BaseModel):
     port: int
     host: str
+    pool: GRPCChannelPoolConfig = GRPCChannelPoolConfig()
 
     @property
     def client_url(self) -> str:
@@ -11,4 +36,4 @@ class GRPCClientConfig(BaseModel):
         Возвращает адрес подключения в формате host:port,
         который требуется для создания gRPC-канала через insecure_channel().
         """
-        return f"{self.host}:{self.port}"
\ No newline at end of file
+        return f"{self.host}:{self.port}"
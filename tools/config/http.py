@@ -1,9 +1,47 @@
+from enum import StrEnum
+
 from pydantic import BaseModel, HttpUrl
 
 
+class HTTPParseMode(StrEnum):
+    """
+    Режим разбора ответов HTTP клиентами.
+
+    FULL — полная валидация pydantic-схемой.
+    LAZY — валидация откладывается до первого обращения к атрибуту ответа.
+    FIELDS — без валидации: JSON разбирается, а читаются только поля, к которым обращается сценарий.
+    """
+    FULL = "full"
+    LAZY = "lazy"
+    FIELDS = "fields"
+
+
+class HTTPPoolConfig(BaseModel):
+    """
+    Настройки пула соединений httpx.
+
+    shared=True — один пул на весь процесс (воркер Locust), его используют все виртуальные пользователи.
+    shared=False — отдельный пул на каждого виртуального пользователя, общий для всех его API клиентов.
+    """
+    shared: bool = True
+    max_connections: int = 1000
+    max_keepalive_connections: int = 1000
+    keepalive_expiry: float = 30.0
+
+
 class HTTPClientConfig(BaseModel):
+    """
+    Настройки HTTP клиента.
+
+    phase_timings=True — Locust-клиенты замеряют фазы установки соединения (DNS, connect, TLS) и репортят их
+    в HDR статистику и Prometheus, не в статистику Locust (см. InstrumentedHTTPTransport). По умолчанию выключено.
+    parse_mode — режим разбора ответов Locust-клиентами (клиенты сидинга всегда используют FULL).
+    """
     url: HttpUrl
     timeout: float = 100.0
+    pool: HTTPPoolConfig = HTTPPoolConfig()
+    phase_timings: bool = False
+    parse_mode: HTTPParseMode = HTTPParseMode.FULL
 
     @property
     def client_url(self) -> str:
@@ -15,4 +53,4 @@ class HTTPClientConfig(BaseModel):
         - httpx.Client требует base_url именно как строку.
         - Если передать HttpUrl напрямую, будет ошибка типов.
         """
-        return str(self.url)
\ No newline at end of file
+        return str(self.url)
@@ -2,5 +2,13 @@ from pydantic import BaseModel
 
 
 class LocustUserConfig(BaseModel):
+    """
+    Настройки виртуального пользователя Locust.
+
+    corrected_latency — регистрировать рядом с фактической задержкой запросов задержку с поправкой
+    на coordinated omission (записи "HTTP:corrected", "gRPC:corrected" в HDR статистике и Prometheus,
+    см. CorrectedLatencyRecorder). По умолчанию выключено.
+    """
     wait_time_min: float = 1
-    wait_time_max: float = 3
\ No newline at end of file
+    wait_time_max: float = 3
+    corrected_latency: bool = False
\ No newline at end of file
@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+
+
+class MetricsConfig(BaseModel):
+    """
+    Настройки сбора метрик нагрузки.
+
+    hdr — записывать задержки в HDR-гистограммы (tools.metrics.hdr) и выгружать их рядом с CSV отчётами Locust.
+    hdr_significant_digits — точность HDR-гистограмм в значащих цифрах (1–5).
+    hdr_highest_latency — максимальная задержка, хранимая с заданной точностью, в миллисекундах.
+    batch_reporting — регистрировать запросы через кольцевой буфер с фоновой выгрузкой пачками
+    (tools.metrics.reporter) вместо синхронного events.request.fire. По умолчанию выключено: слушатели
+    events.request не получают записи из буфера, context и response не сохраняются.
+    batch_capacity — размер кольцевого буфера, записей.
+    batch_flush_interval — период выгрузки буфера, в секундах.
+    prometheus — поднимать в каждом процессе Locust HTTP-эндпоинт /metrics в формате Prometheus
+    (tools.metrics.prometheus). Эндпоинт не требует аутентификации, поэтому по умолчанию выключен.
+    prometheus_host — адрес, на котором слушает эндпоинт (по умолчанию только локальный интерфейс).
+    prometheus_port — порт эндпоинта мастера и локального запуска; воркеры занимают первый свободный порт после него.
+    prometheus_buckets — верхние границы корзин гистограмм задержки, в секундах.
+    """
+    hdr: bool = True
+    hdr_significant_digits: int = 3
+    hdr_highest_latency: float = 3_600_000
+    batch_reporting: bool = False
+    batch_capacity: int = 65_536
+    batch_flush_interval: float = 0.2
+    prometheus: bool = False
+    prometheus_host: str = "127.0.0.1"
+    prometheus_port: int = 9646
+    prometheus_buckets: list[float] = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
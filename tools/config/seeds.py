@@ -0,0 +1,67 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class SeedsEngine(StrEnum):
+    """
+    Движок, которым выполняется сидинг.
+
+    SYNC — SeedsBuilder: синхронные клиенты, параллельность через пул гринлетов (concurrency).
+    ASYNC — AsyncSeedsBuilder: grpc.aio / httpx.AsyncClient, параллельность ограничена max_in_flight.
+    """
+    SYNC = "sync"
+    ASYNC = "async"
+
+
+class SeedsPoolPolicy(StrEnum):
+    """
+    Поведение пула сидинговых пользователей, когда все пользователи уже выданы.
+
+    BLOCK — ждать, пока какой-нибудь виртуальный пользователь вернёт своего пользователя в пул.
+    RECYCLE — повторно выдать уже занятого пользователя (аренда перестаёт быть эксклюзивной).
+    FAIL — выбросить SeedUsersPoolExhaustedError.
+    """
+    BLOCK = "block"
+    RECYCLE = "recycle"
+    FAIL = "fail"
+
+
+class SeedsDumpFormat(StrEnum):
+    """
+    Формат файла с результатом сидинга.
+
+    JSON — dumps/<scenario>_seeds.json, загружается целиком в модели SeedsResult.
+    BINARY — dumps/<scenario>_seeds.bin, идентификаторы фиксированной ширины, файл отображается в память (mmap),
+    а пользователи собираются в модели только при выдаче.
+    JSONL — dumps/<scenario>_seeds.jsonl, по строке на пользователя, читается потоково по мере выдачи пользователей.
+    """
+    JSON = "json"
+    BINARY = "binary"
+    JSONL = "jsonl"
+
+
+class SeedsConfig(BaseModel):
+    """
+    Настройки сидинга тестовых данных.
+
+    concurrency — сколько пользователей (вместе со всеми их счетами, картами и операциями)
+    создаются одновременно. Значение 1 соответствует последовательному созданию.
+    engine — движок сидинга.
+    max_in_flight — максимальное число одновременно выполняющихся запросов в асинхронном движке.
+    cache — переиспользовать дамп, если он создан для того же плана и окружения.
+    verify_sample_size — сколько пользователей из закэшированного дампа проверить через API
+    перед переиспользованием (0 — без проверки).
+    pool_policy — поведение пула сидинговых пользователей при исчерпании. По умолчанию block: каждый
+    пользователь выдаётся эксклюзивно; recycle (неэксклюзивная выдача) включается только явно.
+    pool_timeout — сколько секунд ждать свободного пользователя при политике block (None — без ограничения).
+    dump_format — формат файла с результатом сидинга.
+    """
+    concurrency: int = 1
+    engine: SeedsEngine = SeedsEngine.SYNC
+    max_in_flight: int = 1000
+    cache: bool = True
+    verify_sample_size: int = 0
+    pool_policy: SeedsPoolPolicy = SeedsPoolPolicy.BLOCK
+    pool_timeout: float | None = None
+    dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON
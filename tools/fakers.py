@@ -1,20 +1,162 @@
+import hashlib
+import itertools
+import os
 import time
+from contextvars import ContextVar
+from typing import Callable, Generic, Hashable, TypeVar
 
+import gevent
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from tools.config.fakers import FakeMode, FakersConfig
+
+T = TypeVar("T")
+
+# Сколько значений фоновый гринлет генерирует между переключениями на другие гринлеты
+FAKE_RING_REFRESH_CHUNK_SIZE = 100
+
+# Домен уникальных email (зарезервирован под примеры и тесты, RFC 2606)
+IDENTITY_EMAIL_DOMAIN = "example.com"
+
+BASE36_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# Экземпляр Faker подпотока виртуального пользователя, привязанный к его гринлету (см. Fake.seed_user)
+user_faker: ContextVar[Faker | None] = ContextVar("user_faker", default=None)
+
+
+def derive_seed(*parts: object) -> int:
+    """
+    Выводит seed подпотока из seed прогона и ключей подпотока (индекс воркера, пользователя, вид значений).
+
+    Используется хеш, а не встроенный hash(), поэтому результат не зависит от PYTHONHASHSEED
+    и совпадает между процессами и запусками.
+    """
+    digest = hashlib.blake2b(":".join(map(str, parts)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def to_base36(value: int) -> str:
+    """
+    Кодирует неотрицательное целое число в строку base36 (0-9a-z).
+    """
+    digits = []
+    while True:
+        value, digit = divmod(value, 36)
+        digits.append(BASE36_ALPHABET[digit])
+        if value == 0:
+            return "".join(reversed(digits))
+
+
+class IdentityGenerator:
+    """
+    Генератор уникальных идентификаторов и email для всего кластера Locust без координации между процессами.
+
+    Идентификатор состоит из трёх частей:
+    - run_id — идентификатор прогона (по умолчанию время запуска процесса в миллисекундах, base36);
+    - worker_id — идентификатор процесса в кластере: "w<worker_index>" для воркера (индексы воркерам
+      раздаёт мастер, у одновременно подключённых воркеров они различаются), "m" для мастера,
+      "l" для локального запуска и "p<pid>", пока раннер Locust ещё не создан;
+    - монотонный счётчик процесса.
+
+    Пара (run_id, worker_id) не повторяется между процессами, а счётчик — внутри процесса,
+    поэтому идентификаторы не совпадают ни между гринлетами, ни между воркерами.
+    """
+
+    def __init__(self, run_id: str | None = None, worker_id: str | None = None):
+        """
+        :param run_id: Идентификатор прогона (None — время запуска процесса).
+        :param worker_id: Идентификатор процесса в кластере (None — "p<pid>").
+        """
+        self.run_id = run_id or to_base36(time.time_ns() // 1_000_000)
+        self._counter = itertools.count()
+        self.set_worker_id(worker_id or f"p{os.getpid()}")
+
+    def set_worker_id(self, worker_id: str) -> None:
+        """
+        Устанавливает идентификатор процесса. Счётчик не сбрасывается.
+
+        :param worker_id: Идентификатор процесса в кластере.
+        """
+        self.worker_id = worker_id
+        self._prefix = f"{self.run_id}.{worker_id}."
+
+    def next_id(self) -> str:
+        """
+        Возвращает следующий уникальный идентификатор вида "<run_id>.<worker_id>.<counter>".
+        """
+        return f"{self._prefix}{next(self._counter)}"
+
+    def email(self) -> str:
+        """
+        Возвращает следующий уникальный email вида "<run_id>.<worker_id>.<counter>@example.com".
+        """
+        return f"{self._prefix}{next(self._counter)}@{IDENTITY_EMAIL_DOMAIN}"
+
+
+identity_generator = IdentityGenerator(run_id=settings.fakers.run_id)
 
 
 class Fake:
     """
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
+
+    Если задан seed, данные воспроизводимы между запусками: процесс получает подпоток воркера
+    (seed_worker), а каждый виртуальный пользователь — собственный подпоток (seed_user), поэтому
+    значения пользователя не зависят от того, как чередуются запросы разных пользователей.
     """
 
-    def __init__(self, faker: Faker):
+    def __init__(self, faker: Faker, identity: IdentityGenerator | None = None, seed: int | None = None):
         """
         :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param identity: Генератор уникальных email (None — общий генератор процесса).
+        :param seed: Seed прогона (None — случайные значения).
+        """
+        self._faker = faker
+        self.identity = identity or identity_generator
+        self.seed = seed
+        self.worker_index = 0
+
+        if seed is not None:
+            faker.seed_instance(seed)
+
+    @property
+    def faker(self) -> Faker:
+        """
+        Экземпляр Faker подпотока текущего виртуального пользователя, если он привязан, иначе общий экземпляр.
+        """
+        faker = user_faker.get()
+        return self._faker if faker is None else faker
+
+    def seed_worker(self, worker_index: int) -> None:
+        """
+        Переключает общий экземпляр Faker на подпоток воркера, чтобы воркеры не генерировали одинаковые
+        последовательности. Без seed ничего не делает.
+
+        :param worker_index: Индекс воркера (0 — локальный запуск, -1 — мастер).
         """
-        self.faker = faker
+        self.worker_index = worker_index
+        if self.seed is not None:
+            self._faker.seed_instance(derive_seed(self.seed, worker_index))
+
+    def seed_user(self, user_index: int) -> None:
+        """
+        Привязывает к текущему гринлету подпоток виртуального пользователя. Вызывается в гринлете
+        пользователя; все вызовы fake из этого гринлета используют подпоток. Без seed ничего не делает.
+
+        :param user_index: Порядковый номер виртуального пользователя в процессе.
+        """
+        if self.seed is None:
+            return
+
+        faker = Faker(self._faker.locales)
+        faker.seed_instance(derive_seed(self.seed, self.worker_index, user_index))
+        user_faker.set(faker)
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -27,12 +169,11 @@ class Fake:
 
     def email(self) -> str:
         """
-        Генерирует случайный email.
+        Генерирует уникальный email (см. IdentityGenerator).
 
-        Если не указан, будет использован случайный домен.
-        :return: Случайный email.
+        :return: Email, уникальный в пределах всего кластера Locust.
         """
-        return f"{time.time()}.{self.faker.email()}"
+        return self.identity.email()
 
     def category(self) -> str:
         """
@@ -123,4 +264,215 @@ class Fake:
         return self.faker.random_element(value.values())
 
 
-fake = Fake(faker=Faker())
\ No newline at end of file
+class FakeRing(Generic[T]):
+    """
+    Кольцевой буфер заранее сгенерированных значений.
+
+    Значения выдаются по кругу. Если включено обновление, то после выдачи половины буфера
+    фоновый гринлет генерирует следующую пачку значений (небольшими порциями, уступая управление
+    другим гринлетам), и на следующем круге буфер заменяется новой пачкой. Если пачка ещё не готова,
+    выдача продолжается из текущего буфера, не дожидаясь генерации.
+    """
+
+    def __init__(self, factory: Callable[[], T], size: int, refresh: bool = True):
+        """
+        :param factory: Функция, генерирующая одно значение.
+        :param size: Размер буфера.
+        :param refresh: Перегенерировать буфер в фоновом гринлете.
+        """
+        self._factory = factory
+        self._size = size
+        self._refresh = refresh
+        self._values = [factory() for _ in range(size)]
+        self._next_values: list[T] | None = None
+        self._refreshing = False
+        self._index = 0
+
+    def __call__(self) -> T:
+        value = self._values[self._index]
+        self._index += 1
+
+        if self._index == self._size:
+            self._index = 0
+            if self._next_values is not None:
+                self._values, self._next_values = self._next_values, None
+        elif self._index == self._size // 2 and self._refresh and not self._refreshing and self._next_values is None:
+            self._refreshing = True
+            gevent.spawn(self._build_next_values)
+
+        return value
+
+    def refill(self) -> None:
+        """
+        Заполняет буфер заново и начинает выдачу с начала. Пачка, подготовленная фоновым гринлетом, отбрасывается.
+        """
+        self._values = [self._factory() for _ in range(self._size)]
+        self._next_values = None
+        self._index = 0
+
+    def _build_next_values(self) -> None:
+        values: list[T] = []
+        while len(values) < self._size:
+            chunk = min(FAKE_RING_REFRESH_CHUNK_SIZE, self._size - len(values))
+            values.extend(self._factory() for _ in range(chunk))
+            gevent.sleep(0)
+
+        self._next_values = values
+        self._refreshing = False
+
+
+class PooledFake(Fake):
+    """
+    Генератор тестовых данных, который выдаёт значения из заранее сгенерированных кольцевых буферов (FakeRing)
+    вместо вызова провайдеров Faker на каждый запрос.
+
+    Для каждого вида значений (имя, телефон, сумма, значение конкретного enum и т.д.) заводится свой буфер
+    со своим экземпляром Faker. Если задан seed, экземпляр Faker буфера инициализируется seed'ом,
+    производным от seed прогона, индекса воркера и вида значений, поэтому последовательность значений
+    каждого вида воспроизводима и не зависит от порядка вызовов и фоновых обновлений других буферов.
+    Подпотоков пользователей нет: буферы общие для процесса, и какой пользователь получит какое значение,
+    зависит от порядка запросов.
+
+    Email не берутся из буфера: они генерируются IdentityGenerator и уникальны в пределах кластера.
+    """
+
+    def __init__(
+            self,
+            faker: Faker,
+            size: int = 10_000,
+            refresh: bool = True,
+            seed: int | None = None,
+            identity: IdentityGenerator | None = None
+    ):
+        """
+        :param faker: Экземпляр Faker, локали которого используются для буферов.
+        :param size: Размер буфера для каждого вида значений.
+        :param refresh: Перегенерировать буферы в фоновом гринлете.
+        :param seed: Общий seed буферов (None — случайные значения).
+        :param identity: Генератор уникальных email (None — общий генератор процесса).
+        """
+        super().__init__(faker, identity, seed)
+        self.size = size
+        self.refresh = refresh
+
+        self._rings: dict[Hashable, FakeRing] = {}
+        self._sources: dict[Hashable, tuple[str, Faker]] = {}
+
+        # Буферы значений без параметров строятся сразу, чтобы не генерировать их на пути запроса
+        self._category = self._get_ring("category", "category", Fake.category)
+        self._last_name = self._get_ring("last_name", "last_name", Fake.last_name)
+        self._first_name = self._get_ring("first_name", "first_name", Fake.first_name)
+        self._middle_name = self._get_ring("middle_name", "middle_name", Fake.middle_name)
+        self._phone_number = self._get_ring("phone_number", "phone_number", Fake.phone_number)
+        self._amount = self._get_ring("amount", "amount", Fake.amount)
+
+    def _get_ring(self, key: Hashable, name: str, generate: Callable[[Fake], T]) -> FakeRing[T]:
+        """
+        Возвращает буфер для вида значений, создавая и заполняя его при первом обращении.
+
+        :param key: Ключ буфера.
+        :param name: Стабильное имя вида значений, из которого выводится seed буфера.
+        :param generate: Функция, генерирующая значение с помощью Fake буфера.
+        :return: Буфер значений.
+        """
+        ring = self._rings.get(key)
+        if ring is None:
+            faker = Faker(self._faker.locales)
+            if self.seed is not None:
+                faker.seed_instance(derive_seed(self.seed, self.worker_index, name))
+
+            source = Fake(faker=faker)
+            self._sources[key] = (name, faker)
+            ring = self._rings[key] = FakeRing(lambda: generate(source), self.size, self.refresh)
+
+        return ring
+
+    def seed_worker(self, worker_index: int) -> None:
+        """
+        Переключает буферы на подпоток воркера: экземпляры Faker буферов инициализируются заново,
+        а уже построенные буферы заполняются заново. Без seed ничего не делает.
+
+        :param worker_index: Индекс воркера (0 — локальный запуск, -1 — мастер).
+        """
+        super().seed_worker(worker_index)
+        if self.seed is None:
+            return
+
+        for key, (name, faker) in self._sources.items():
+            faker.seed_instance(derive_seed(self.seed, worker_index, name))
+            self._rings[key].refill()
+
+    def seed_user(self, user_index: int) -> None:
+        """
+        Не делает ничего: значения выдаются из общих буферов процесса.
+        """
+
+    def enum(self, value: type[TEnum]) -> TEnum:
+        name = f"enum:{value.__module__}.{value.__qualname__}"
+        return self._get_ring(value, name, lambda source: source.enum(value))()
+
+    def category(self) -> str:
+        return self._category()
+
+    def last_name(self) -> str:
+        return self._last_name()
+
+    def first_name(self) -> str:
+        return self._first_name()
+
+    def middle_name(self) -> str:
+        return self._middle_name()
+
+    def phone_number(self) -> str:
+        return self._phone_number()
+
+    def float(self, start: int = 1, end: int = 100) -> float:
+        return self._get_ring(("float", start, end), f"float:{start}:{end}", lambda source: source.float(start, end))()
+
+    def amount(self) -> float:
+        return self._amount()
+
+    def proto_enum(self, value: EnumTypeWrapper) -> int:
+        name = f"proto_enum:{value.DESCRIPTOR.full_name}"
+        return self._get_ring(value, name, lambda source: source.proto_enum(value))()
+
+
+def build_fake(config: FakersConfig) -> Fake:
+    """
+    Создаёт генератор тестовых данных в соответствии с настройками.
+
+    :param config: Настройки генерации тестовых данных.
+    :return: Fake (режим direct) или PooledFake (режим pooled).
+    """
+    faker = Faker()
+    if config.mode == FakeMode.POOLED:
+        return PooledFake(faker=faker, size=config.pool_size, refresh=config.pool_refresh, seed=config.seed)
+
+    return Fake(faker=faker, seed=config.seed)
+
+
+fake = build_fake(settings.fakers)
+
+
+@events.init.add_listener
+def set_fake_worker(environment: Environment, **kwargs):
+    """
+    После создания раннера Locust переключает генератор идентификаторов на идентификатор процесса
+    в кластере, а fake — на подпоток воркера.
+
+    Локальный запуск использует подпоток воркера 0, поэтому его данные совпадают с данными
+    единственного воркера распределённого запуска.
+    """
+    runner = environment.runner
+    if isinstance(runner, WorkerRunner):
+        if runner.worker_index < 0:
+            return
+
+        identity_generator.set_worker_id(f"w{runner.worker_index}")
+        fake.seed_worker(runner.worker_index)
+    elif isinstance(runner, MasterRunner):
+        identity_generator.set_worker_id("m")
+        fake.seed_worker(-1)
+    elif runner is not None:
+        identity_generator.set_worker_id("l")
+        fake.seed_worker(0)
\ No newline at end of file
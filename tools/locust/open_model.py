@@ -0,0 +1,340 @@
+import math
+import random
+import time
+from enum import StrEnum
+from typing import Iterable, Iterator
+
+import gevent
+from locust import SequentialTaskSet, events
+from locust.env import Environment
+from locust.rpc import Message
+from locust.runners import MasterRunner, WorkerRunner, STATE_MISSING
+
+from config import settings
+from tools.fakers import derive_seed, fake
+from tools.logger import get_logger
+from tools.metrics.corrected import set_schedule_delay
+from tools.metrics.reporter import build_report_metric
+
+logger = get_logger("OPEN_MODEL")
+
+# Тип сообщения Locust, в котором мастер передаёт воркерам количество воркеров, между которыми делится поток итераций
+OPEN_MODEL_SHARE_MESSAGE = "open_model_share"
+
+# Тип записей HDR статистики и Prometheus с метриками открытой модели
+OPEN_MODEL_REQUEST_TYPE = "OPEN_MODEL"
+
+
+class ArrivalProcess(StrEnum):
+    """
+    Процесс поступления итераций сценария в открытой модели.
+
+    CONSTANT — итерации поступают через равные интервалы 1 / rate.
+    POISSON — пуассоновский поток: интервалы экспоненциально распределены со средним 1 / rate.
+    RAMP — интенсивность линейно растёт от ramp_from до rate за ramp_time секунд, затем постоянна.
+    """
+    CONSTANT = "constant"
+    POISSON = "poisson"
+    RAMP = "ramp"
+
+
+class ArrivalSchedule:
+    """
+    Расписание поступления итераций: бесконечная последовательность моментов старта
+    (в секундах от начала теста) для заданного процесса поступления.
+    """
+
+    def __init__(
+            self,
+            process: ArrivalProcess,
+            rate: float,
+            ramp_from: float = 0.0,
+            ramp_time: float = 0.0,
+            generator: random.Random | None = None
+    ):
+        """
+        :param process: Процесс поступления.
+        :param rate: Целевая интенсивность, итераций в секунду.
+        :param ramp_from: Начальная интенсивность для RAMP.
+        :param ramp_time: Длительность разгона для RAMP, в секундах.
+        :param generator: Генератор случайных чисел для POISSON.
+        """
+        self.process = process
+        self.rate = rate
+        self.ramp_from = ramp_from
+        self.ramp_time = ramp_time
+        self.generator = generator or random.Random()
+
+    def __iter__(self) -> Iterator[float]:
+        if self.process == ArrivalProcess.POISSON:
+            offset = 0.0
+            while True:
+                offset += self.generator.expovariate(self.rate)
+                yield offset
+
+        index = 0
+        while True:
+            yield self.get_offset(index)
+            index += 1
+
+    def get_offset(self, index: int) -> float:
+        """
+        Возвращает момент поступления итерации с номером index для CONSTANT и RAMP.
+
+        Для RAMP число итераций к моменту t внутри разгона равно ramp_from * t + (rate - ramp_from) * t² / (2 * ramp_time),
+        момент поступления — решение этого уравнения относительно t.
+
+        :param index: Номер итерации, начиная с 0.
+        :return: Момент поступления в секундах от начала теста.
+        """
+        if self.process != ArrivalProcess.RAMP or self.ramp_time <= 0:
+            return index / self.rate
+
+        ramped = (self.ramp_from + self.rate) * self.ramp_time / 2
+        if index >= ramped:
+            return self.ramp_time + (index - ramped) / self.rate
+
+        acceleration = (self.rate - self.ramp_from) / (2 * self.ramp_time)
+        if acceleration == 0:
+            return index / self.ramp_from
+
+        return (-self.ramp_from + math.sqrt(self.ramp_from ** 2 + 4 * acceleration * index)) / (2 * acceleration)
+
+
+class OpenModelScheduler:
+    """
+    Планировщик итераций открытой модели для процесса Locust.
+
+    Виртуальные пользователи служат слотами: свободный пользователь забирает следующий момент поступления
+    и ждёт его, поэтому темп итераций задаётся расписанием и не зависит от времени ответов системы.
+    Если пользователь забрал момент, который уже прошёл, итерация стартует с опозданием (start lag);
+    если опоздание больше max_start_lag, итерация считается отброшенной.
+
+    Опоздание старта и отброшенные итерации регистрируются записями OPEN_MODEL "start lag" и OPEN_MODEL "dropped"
+    через build_report_metric: только в HDR статистике и Prometheus, не в статистике Locust, поэтому
+    они не влияют на Aggregated, RPS и долю ошибок. Количество отброшенных итераций — число значений "dropped".
+    """
+
+    def __init__(self, environment: Environment, schedule: Iterable[float], max_start_lag: float | None):
+        """
+        :param environment: Окружение Locust, в котором регистрируются метрики.
+        :param schedule: Моменты поступления итераций в секундах от начала теста.
+        :param max_start_lag: Максимальное опоздание старта итерации в секундах (None — итерации не отбрасываются).
+        """
+        self.environment = environment
+        self.max_start_lag = max_start_lag
+        self.started = 0
+        self.dropped = 0
+        self.report_metric = build_report_metric(environment)
+
+        self._arrivals = iter(schedule)
+        self._start_time = time.perf_counter()
+        self._next_arrival: float | None = None
+
+    def _take_arrival(self) -> float:
+        if self._next_arrival is None:
+            return self._start_time + next(self._arrivals)
+
+        arrival, self._next_arrival = self._next_arrival, None
+        return arrival
+
+    def _fire_dropped(self, lag: float) -> None:
+        self.dropped += 1
+        self.report_metric(OPEN_MODEL_REQUEST_TYPE, "dropped", lag * 1000)
+
+    def acquire(self) -> float:
+        """
+        Ждёт момента старта следующей итерации. Вызывается в гринлете виртуального пользователя.
+
+        :return: Запланированный момент старта итерации (time.perf_counter(), секунды).
+        """
+        while True:
+            arrival = self._take_arrival()
+            delay = arrival - time.perf_counter()
+            if delay > 0:
+                gevent.sleep(delay)
+
+            lag = max(time.perf_counter() - arrival, 0.0)
+            if self.max_start_lag is not None and lag > self.max_start_lag:
+                self._fire_dropped(lag)
+                continue
+
+            self.started += 1
+            self.report_metric(OPEN_MODEL_REQUEST_TYPE, "start lag", lag * 1000)
+            return arrival
+
+    def stop(self) -> None:
+        """
+        Отмечает отброшенными итерации, которые должны были начаться до остановки теста,
+        но так и не были взяты ни одним пользователем.
+        """
+        if self.max_start_lag is None:
+            return
+
+        now = time.perf_counter()
+        while True:
+            arrival = self._take_arrival()
+            if now - arrival <= self.max_start_lag:
+                self._next_arrival = arrival
+                return
+
+            self._fire_dropped(now - arrival)
+
+
+class OpenModelTaskSetMixin:
+    """
+    Примесь к TaskSet и SequentialTaskSet, которая в режиме открытой модели (environment.open_model)
+    начинает каждую итерацию сценария по расписанию OpenModelScheduler.
+
+    Итерация SequentialTaskSet — проход по всем задачам, итерация TaskSet — одна задача.
+    Паузы wait_time между задачами внутри итерации сохраняются, а после последней задачи итерации
+    паузы нет: пользователь сразу ждёт следующего поступления.
+    Запланированный момент старта текущей итерации доступен в iteration_intended_start, а опоздание старта
+    передаётся первому запросу итерации для записи скорректированной задержки (см. CorrectedLatencyRecorder).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.iteration_intended_start: float | None = None
+        self._iteration_position = 0
+
+    @property
+    def iteration_length(self) -> int:
+        """
+        Количество задач в одной итерации сценария.
+        """
+        return len(self.tasks) if isinstance(self, SequentialTaskSet) else 1
+
+    def get_next_task(self):
+        scheduler: OpenModelScheduler | None = getattr(self.user.environment, "open_model", None)
+        if self._iteration_position == 0 and scheduler is not None:
+            self.iteration_intended_start = scheduler.acquire()
+            set_schedule_delay(max(time.perf_counter() - self.iteration_intended_start, 0.0))
+
+        self._iteration_position = (self._iteration_position + 1) % self.iteration_length
+        return super().get_next_task()
+
+    def wait_time(self):
+        if self._iteration_position == 0 and getattr(self.user.environment, "open_model", None) is not None:
+            return 0
+
+        return super().wait_time()
+
+
+@events.init_command_line_parser.add_listener
+def add_open_model_arguments(parser):
+    """
+    Добавляет параметры открытой модели, которые можно задать в командной строке или в v1.0.conf сценария
+    (например, arrival-rate = 50). Количество пользователей (users) в открытой модели — число слотов,
+    то есть максимальное число одновременно выполняющихся итераций.
+    """
+    parser.add_argument(
+        "--arrival-rate",
+        type=float,
+        default=0.0,
+        help="Open model: target scenario iterations per second for the whole run (0 keeps the closed model)"
+    )
+    parser.add_argument(
+        "--arrival-process",
+        type=ArrivalProcess,
+        choices=list(ArrivalProcess),
+        default=ArrivalProcess.CONSTANT,
+        help="Open model: arrival process of iterations"
+    )
+    parser.add_argument(
+        "--arrival-ramp-from",
+        type=float,
+        default=0.0,
+        help="Open model: initial arrival rate for the ramp process"
+    )
+    parser.add_argument(
+        "--arrival-ramp-time",
+        type=float,
+        default=60.0,
+        help="Open model: seconds to ramp from --arrival-ramp-from to --arrival-rate"
+    )
+    parser.add_argument(
+        "--max-start-lag",
+        type=float,
+        default=1.0,
+        help="Open model: iterations starting later than this many seconds after schedule are dropped"
+    )
+
+
+def build_open_model_scheduler(environment: Environment, share: float) -> OpenModelScheduler | None:
+    """
+    Создаёт планировщик открытой модели по параметрам запуска Locust.
+
+    :param environment: Окружение Locust.
+    :param share: Доля общего потока итераций, которую выполняет процесс.
+    :return: Планировщик или None, если открытая модель не включена (arrival-rate не задан).
+    """
+    options = environment.parsed_options
+    rate = getattr(options, "arrival_rate", 0.0) * share
+    if rate <= 0:
+        return None
+
+    generator = random.Random()
+    if settings.fakers.seed is not None:
+        generator.seed(derive_seed(settings.fakers.seed, "arrivals", fake.worker_index))
+
+    schedule = ArrivalSchedule(
+        process=ArrivalProcess(options.arrival_process),
+        rate=rate,
+        ramp_from=options.arrival_ramp_from * share,
+        ramp_time=options.arrival_ramp_time,
+        generator=generator
+    )
+    return OpenModelScheduler(environment, schedule, options.max_start_lag)
+
+
+@events.init.add_listener
+def setup_open_model(environment: Environment, **kwargs):
+    """
+    Включает открытую модель для процесса Locust.
+
+    - Мастер при старте теста сообщает воркерам их количество, и каждый воркер выполняет
+      свою долю потока итераций (arrival-rate / количество воркеров).
+    - Воркер и локальный запуск при старте теста создают планировщик (environment.open_model),
+      а при остановке отмечают невзятые итерации отброшенными и выводят сводку.
+    """
+    runner = environment.runner
+    environment.open_model = None
+
+    if isinstance(runner, MasterRunner):
+        @environment.events.test_start.add_listener
+        def send_open_model_share(environment: Environment, **kwargs):
+            if getattr(environment.parsed_options, "arrival_rate", 0.0) <= 0:
+                return
+
+            workers = [worker for worker in runner.clients.values() if worker.state != STATE_MISSING]
+            for worker in workers:
+                runner.send_message(OPEN_MODEL_SHARE_MESSAGE, {"workers": len(workers)}, client_id=worker.id)
+
+        return
+
+    environment.open_model_share = 1.0
+    if isinstance(runner, WorkerRunner):
+        def on_open_model_share(msg: Message, **kwargs):
+            environment.open_model_share = 1 / msg.data["workers"]
+
+        runner.register_message(OPEN_MODEL_SHARE_MESSAGE, on_open_model_share)
+
+    @environment.events.test_start.add_listener
+    def start_open_model(environment: Environment, **kwargs):
+        environment.open_model = build_open_model_scheduler(environment, environment.open_model_share)
+        if environment.open_model is not None:
+            options = environment.parsed_options
+            logger.info(
+                f"Open model: {options.arrival_process} arrivals at {options.arrival_rate * environment.open_model_share:g}"
+                f" iterations/s, max start lag {options.max_start_lag}s"
+            )
+
+    @environment.events.test_stop.add_listener
+    def stop_open_model(environment: Environment, **kwargs):
+        scheduler: OpenModelScheduler | None = environment.open_model
+        if scheduler is None:
+            return
+
+        scheduler.stop()
+        logger.info(f"Open model: iterations started: {scheduler.started}, dropped: {scheduler.dropped}")
@@ -1,6 +1,13 @@
+import itertools
+
 from locust import User, between
 
 from config import settings
+from tools.fakers import fake
+from tools.metrics import hdr, prometheus  # noqa: F401 (регистрируют слушатели событий Locust)
+
+# Порядковые номера виртуальных пользователей процесса, из которых выводятся их подпотоки тестовых данных
+user_indexes = itertools.count()
 
 
 class LocustBaseUser(User):
@@ -13,4 +20,11 @@ class LocustBaseUser(User):
     wait_time = between(
         min_wait=settings.locust_user.wait_time_min,
         max_wait=settings.locust_user.wait_time_max
-    )
\ No newline at end of file
+    )
+
+    def run(self):
+        """
+        Выполняется в гринлете пользователя: привязывает к нему подпоток тестовых данных и запускает задачи.
+        """
+        fake.seed_user(next(user_indexes))
+        return super().run()
\ No newline at end of file
@@ -0,0 +1,111 @@
+from contextvars import ContextVar
+
+from locust.env import Environment
+
+from config import settings
+from tools.metrics.reporter import build_report_metric
+
+# Опоздание старта текущей итерации виртуального пользователя относительно расписания (секунды),
+# ещё не учтённое ни в одном запросе. None — у пользователя нет расписания (закрытая модель).
+# Переменная привязана к гринлету пользователя, поэтому читать её нужно в момент отправки запроса.
+schedule_delay: ContextVar[float | None] = ContextVar("schedule_delay", default=None)
+
+
+def set_schedule_delay(delay: float) -> None:
+    """
+    Сохраняет опоздание старта итерации для первого запроса, который отправит текущий виртуальный пользователь.
+
+    :param delay: Разница между фактическим и запланированным моментом старта итерации, в секундах.
+    """
+    schedule_delay.set(delay)
+
+
+def take_schedule_delay() -> float | None:
+    """
+    Забирает опоздание старта итерации: первый запрос итерации получает его целиком, следующие — 0.
+
+    :return: Опоздание в секундах или None, если у пользователя нет расписания.
+    """
+    delay = schedule_delay.get()
+    if delay:
+        schedule_delay.set(0.0)
+
+    return delay
+
+
+class CorrectedLatencyRecorder:
+    """
+    Регистрирует задержку запросов с поправкой на coordinated omission рядом с фактической.
+
+    Записи регистрируются с типом "<тип запроса>:corrected" (например, "HTTP:corrected", "gRPC:corrected")
+    через build_report_metric: только в HDR статистике (и её CSV) и гистограммах Prometheus.
+    В статистику Locust (записи, Aggregated, RPS) добавленные задержки не попадают.
+
+    - Открытая модель: запланированный момент старта итерации известен, и первый запрос итерации
+      получает задержку от запланированного момента (фактическая задержка + опоздание старта).
+    - Закрытая модель: пока пользователь ждёт медленный ответ, он не отправляет запросы, которые
+      отправил бы по расписанию wait_time. Как в HdrHistogram (recordValueWithExpectedInterval),
+      для ответа дольше ожидаемого интервала между запросами пользователя добавляются задержки
+      пропущенных запросов: latency - interval, latency - 2 * interval, ... пока они положительны.
+    """
+
+    def __init__(self, environment: Environment, expected_interval: float | None, max_backfill: int = 1000):
+        """
+        :param environment: Окружение Locust, в котором регистрируются метрики.
+        :param expected_interval: Ожидаемый интервал между запросами пользователя в закрытой модели, в секундах
+            (None или 0 — без добавления пропущенных запросов).
+        :param max_backfill: Максимальное число добавляемых задержек на один ответ.
+        """
+        self.environment = environment
+        self.expected_interval = expected_interval
+        self.max_backfill = max_backfill
+        self.report_metric = build_report_metric(environment)
+
+    def fire(self, request_type: str, name: str, response_time: float) -> None:
+        self.report_metric(f"{request_type}:corrected", name, response_time)
+
+    def record(self, request_type: str, name: str, response_time: float, delay: float | None) -> None:
+        """
+        Регистрирует скорректированную задержку запроса.
+
+        :param request_type: Тип запроса (HTTP, gRPC).
+        :param name: Имя записи статистики (метод и маршрут).
+        :param response_time: Фактическая задержка, в миллисекундах.
+        :param delay: Опоздание старта, полученное take_schedule_delay() при отправке запроса
+            (None — закрытая модель).
+        """
+        if delay is not None:
+            self.fire(request_type, name, response_time + delay * 1000)
+            return
+
+        self.fire(request_type, name, response_time)
+        if not self.expected_interval:
+            return
+
+        interval = self.expected_interval * 1000
+        missed = response_time - interval
+        for _ in range(self.max_backfill):
+            if missed <= 0:
+                break
+
+            self.fire(request_type, name, missed)
+            missed -= interval
+
+
+def build_corrected_latency_recorder(environment: Environment) -> CorrectedLatencyRecorder | None:
+    """
+    Создаёт регистратор скорректированной задержки по настройкам виртуального пользователя.
+
+    Ожидаемый интервал между запросами в закрытой модели — среднее значение wait_time (LocustBaseUser).
+
+    :param environment: Окружение Locust.
+    :return: Регистратор или None, если запись скорректированной задержки выключена.
+    """
+    config = settings.locust_user
+    if not config.corrected_latency:
+        return None
+
+    return CorrectedLatencyRecorder(
+        environment=environment,
+        expected_interval=(config.wait_time_min + config.wait_time_max) / 2
+    )
@@ -0,0 +1,532 @@
+import base64
+import csv
+import math
+import struct
+import time
+import zlib
+from array import array
+from typing import Iterable, Iterator
+
+import gevent
+import locust.stats
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from tools.logger import get_logger
+from tools.metrics.reporter import RequestBatch, get_metric_sinks, get_request_reporter
+
+logger = get_logger("HDR_STATS")
+
+# Заголовок закодированной гистограммы: значащие цифры, максимальное отслеживаемое значение,
+# количество записей, минимум, максимум и сумма значений
+HDR_HEADER = struct.Struct("<BQQQQQ")
+
+# Ключ данных гистограмм в отчёте воркера мастеру (events.report_to_master)
+HDR_REPORT_KEY = "hdr_histograms"
+
+# Перцентили, которые отчёты HDR выводят дополнительно к locust.stats.PERCENTILES_TO_REPORT
+HDR_EXTRA_PERCENTILES = (0.999, 0.9999)
+
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varints(data: bytes) -> Iterator[int]:
+    value, shift = 0, 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+
+        yield value
+        value, shift = 0, 0
+
+
+class HDRHistogram:
+    """
+    Гистограмма с логарифмически-линейными корзинами (HDR Histogram) для целых значений, например задержек в микросекундах.
+
+    Любое значение от 1 до highest_trackable_value хранится с относительной погрешностью не больше
+    10^-significant_digits, поэтому высокие перцентили и максимум не огрубляются, как в корзинах статистики Locust.
+    Память фиксирована и зависит только от диапазона и точности: для 3 значащих цифр и часа в микросекундах —
+    около 190 КБ. Значения больше highest_trackable_value записываются в последнюю корзину
+    (точный максимум хранится отдельно).
+
+    Гистограммы с одинаковыми параметрами складываются без потерь (merge), а encode/decode дают компактное
+    представление (ненулевые корзины в виде varint, сжатые zlib) для передачи между процессами.
+    """
+
+    def __init__(self, highest_trackable_value: int, significant_digits: int = 3):
+        """
+        :param highest_trackable_value: Максимальное значение, которое хранится с заданной точностью.
+        :param significant_digits: Количество значащих цифр точности (1–5).
+        """
+        self.highest_trackable_value = highest_trackable_value
+        self.significant_digits = significant_digits
+
+        sub_bucket_count_magnitude = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self.sub_bucket_half_count_magnitude = sub_bucket_count_magnitude - 1
+        self.sub_bucket_count = 1 << sub_bucket_count_magnitude
+        self.sub_bucket_half_count = self.sub_bucket_count // 2
+        self.sub_bucket_mask = self.sub_bucket_count - 1
+
+        bucket_count, smallest_untrackable_value = 1, self.sub_bucket_count
+        while smallest_untrackable_value <= highest_trackable_value:
+            smallest_untrackable_value <<= 1
+            bucket_count += 1
+
+        self.counts_length = (bucket_count + 1) * self.sub_bucket_half_count
+        self.counts = array("q", bytes(8 * self.counts_length))
+        self.max_index = self.get_counts_index(highest_trackable_value)
+
+        self.total_count = 0
+        self.min_value = 0
+        self.max_value = 0
+        self.total_value = 0
+        self._lowest_index = self.counts_length
+        self._highest_index = -1
+
+    def get_counts_index(self, value: int) -> int:
+        bucket_index = (value | self.sub_bucket_mask).bit_length() - self.sub_bucket_half_count_magnitude - 1
+        sub_bucket_index = value >> bucket_index
+        return ((bucket_index + 1) << self.sub_bucket_half_count_magnitude) + sub_bucket_index - self.sub_bucket_half_count
+
+    def get_value_from_index(self, index: int) -> int:
+        """
+        Возвращает наибольшее значение, которое попадает в корзину с индексом index.
+        """
+        bucket_index = (index >> self.sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self.sub_bucket_half_count
+            bucket_index = 0
+
+        return (sub_bucket_index << bucket_index) + (1 << bucket_index) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        Записывает значение.
+
+        :param value: Значение (отрицательные записываются как 0).
+        :param count: Сколько раз записать значение.
+        """
+        value = max(value, 0)
+        index = min(self.get_counts_index(value), self.max_index)
+        self.counts[index] += count
+
+        if self.total_count == 0 or value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+
+        self.total_count += count
+        self.total_value += value * count
+        if index < self._lowest_index:
+            self._lowest_index = index
+        if index > self._highest_index:
+            self._highest_index = index
+
+    def iter_recorded(self) -> Iterator[tuple[int, int]]:
+        """
+        Перебирает непустые корзины по возрастанию.
+
+        :return: Пары (наибольшее значение корзины, количество записей).
+        """
+        counts = self.counts
+        for index in range(self._lowest_index, self._highest_index + 1):
+            if counts[index]:
+                yield self.get_value_from_index(index), counts[index]
+
+    @property
+    def mean(self) -> float:
+        return self.total_value / self.total_count if self.total_count else 0.0
+
+    def get_values_at_percentiles(self, percentiles: Iterable[float]) -> dict[float, int]:
+        """
+        Вычисляет значения перцентилей за один проход по гистограмме.
+
+        :param percentiles: Перцентили в долях (0.99 — 99-й перцентиль).
+        :return: Значение для каждого перцентиля (наибольшее значение корзины, не больше точного максимума).
+        """
+        targets = sorted(percentiles)
+        values = {percentile: 0 for percentile in targets}
+        if not self.total_count:
+            return values
+
+        position, accumulated = 0, 0
+        for value, count in self.iter_recorded():
+            accumulated += count
+            while position < len(targets) and accumulated >= max(math.ceil(targets[position] * self.total_count), 1):
+                values[targets[position]] = min(value, self.max_value)
+                position += 1
+
+            if position == len(targets):
+                break
+
+        return values
+
+    def merge(self, other: "HDRHistogram") -> None:
+        """
+        Добавляет записи другой гистограммы с теми же параметрами.
+
+        :param other: Гистограмма для слияния.
+        :raises ValueError: Параметры гистограмм различаются.
+        """
+        if (other.highest_trackable_value, other.significant_digits) != (
+                self.highest_trackable_value, self.significant_digits
+        ):
+            raise ValueError("Cannot merge HDR histograms with different ranges or precision")
+
+        if not other.total_count:
+            return
+
+        counts, other_counts = self.counts, other.counts
+        for index in range(other._lowest_index, other._highest_index + 1):
+            if other_counts[index]:
+                counts[index] += other_counts[index]
+
+        self.min_value = other.min_value if not self.total_count else min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self.total_count += other.total_count
+        self.total_value += other.total_value
+        self._lowest_index = min(self._lowest_index, other._lowest_index)
+        self._highest_index = max(self._highest_index, other._highest_index)
+
+    def reset(self) -> None:
+        """
+        Удаляет все записи.
+        """
+        if self._highest_index >= 0:
+            length = self._highest_index - self._lowest_index + 1
+            self.counts[self._lowest_index:self._highest_index + 1] = array("q", bytes(8 * length))
+
+        self.total_count = 0
+        self.min_value = 0
+        self.max_value = 0
+        self.total_value = 0
+        self._lowest_index = self.counts_length
+        self._highest_index = -1
+
+    def encode(self) -> bytes:
+        """
+        Кодирует гистограмму: заголовок (HDR_HEADER) и пары varint (смещение индекса корзины, количество)
+        для непустых корзин, сжатые zlib.
+        """
+        buffer = bytearray(HDR_HEADER.pack(
+            self.significant_digits,
+            self.highest_trackable_value,
+            self.total_count,
+            self.min_value,
+            self.max_value,
+            self.total_value
+        ))
+
+        previous_index = 0
+        counts = self.counts
+        for index in range(self._lowest_index, self._highest_index + 1):
+            if counts[index]:
+                write_varint(buffer, index - previous_index)
+                write_varint(buffer, counts[index])
+                previous_index = index
+
+        return zlib.compress(bytes(buffer))
+
+    @classmethod
+    def decode(cls, data: bytes) -> "HDRHistogram":
+        """
+        Восстанавливает гистограмму из результата encode().
+        """
+        data = zlib.decompress(data)
+        significant_digits, highest_trackable_value, total_count, min_value, max_value, total_value = (
+            HDR_HEADER.unpack_from(data)
+        )
+
+        histogram = cls(highest_trackable_value, significant_digits)
+        varints = read_varints(data[HDR_HEADER.size:])
+        index = 0
+        for delta, count in zip(varints, varints):
+            index += delta
+            histogram.counts[index] = count
+            histogram._lowest_index = min(histogram._lowest_index, index)
+            histogram._highest_index = index
+
+        histogram.total_count = total_count
+        histogram.min_value = min_value
+        histogram.max_value = max_value
+        histogram.total_value = total_value
+        return histogram
+
+
+class HDRStatsEntry:
+    """
+    Гистограммы задержки одной записи статистики Locust (тип запроса и имя), в микросекундах.
+
+    interval — записи с последней выгрузки (интервальный отчёт или отправка мастеру),
+    total — записи за весь тест (на воркере не ведётся: суммарную гистограмму собирает мастер).
+    """
+
+    def __init__(self, highest_trackable_value: int, significant_digits: int, track_total: bool):
+        self.interval = HDRHistogram(highest_trackable_value, significant_digits)
+        self.total = HDRHistogram(highest_trackable_value, significant_digits) if track_total else None
+
+    def record(self, value: int) -> None:
+        self.interval.record(value)
+        if self.total is not None:
+            self.total.record(value)
+
+    def merge(self, histogram: HDRHistogram) -> None:
+        self.interval.merge(histogram)
+        if self.total is not None:
+            self.total.merge(histogram)
+
+
+class HDRStats:
+    """
+    Статистика задержек на HDR-гистограммах для процесса Locust.
+
+    Гистограммы заполняются всеми записями, которые регистрируют HTTP event hooks и gRPC интерцептор:
+    из events.request, из пачек RequestEventReporter и из дополнительных метрик (build_report_metric),
+    которые в статистику Locust не попадают. Воркеры отправляют мастеру интервальные гистограммы
+    в закодированном виде вместе со штатным отчётом статистики, а мастер сливает их без потерь.
+    """
+
+    def __init__(self, highest_trackable_value: int, significant_digits: int, track_total: bool):
+        """
+        :param highest_trackable_value: Максимальная задержка, хранимая с заданной точностью, в микросекундах.
+        :param significant_digits: Количество значащих цифр точности.
+        :param track_total: Вести гистограммы за весь тест (мастер и локальный запуск).
+        """
+        self.highest_trackable_value = highest_trackable_value
+        self.significant_digits = significant_digits
+        self.track_total = track_total
+        self.entries: dict[tuple[str, str], HDRStatsEntry] = {}
+
+    def get_entry(self, request_type: str, name: str) -> HDRStatsEntry:
+        entry = self.entries.get((request_type, name))
+        if entry is None:
+            entry = self.entries[(request_type, name)] = HDRStatsEntry(
+                self.highest_trackable_value, self.significant_digits, self.track_total
+            )
+
+        return entry
+
+    def record(self, request_type: str, name: str, response_time: float) -> None:
+        """
+        :param response_time: Задержка в миллисекундах.
+        """
+        self.get_entry(request_type, name).record(round(response_time * 1000))
+
+    def record_batch(self, batch: RequestBatch) -> None:
+        """
+        Записывает пачку запросов из RequestEventReporter.
+        """
+        entries = {}
+        for key_id, response_time in zip(batch.key_ids, batch.response_times):
+            entry = entries.get(key_id)
+            if entry is None:
+                entry = entries[key_id] = self.get_entry(*batch.keys[key_id])
+
+            entry.record(round(response_time * 1000))
+
+    def serialize_interval(self) -> list[list]:
+        """
+        Кодирует интервальные гистограммы для отправки мастеру и начинает новый интервал.
+
+        :return: Список [тип запроса, имя, закодированная гистограмма] для непустых записей.
+        """
+        data = []
+        for (request_type, name), entry in self.entries.items():
+            if entry.interval.total_count:
+                data.append([request_type, name, entry.interval.encode()])
+                entry.interval.reset()
+
+        return data
+
+    def merge_serialized(self, data: list[list]) -> None:
+        """
+        Сливает интервальные гистограммы, полученные от воркера.
+        """
+        for request_type, name, encoded in data:
+            self.get_entry(request_type, name).merge(HDRHistogram.decode(encoded))
+
+    def reset(self) -> None:
+        self.entries.clear()
+
+
+def get_report_percentiles() -> list[float]:
+    return sorted({*locust.stats.PERCENTILES_TO_REPORT, *HDR_EXTRA_PERCENTILES})
+
+
+def format_percentile(percentile: float) -> str:
+    return f"{percentile * 100:g}%"
+
+
+def format_latency(value: float) -> str:
+    """
+    Форматирует задержку из микросекунд в миллисекунды.
+    """
+    return f"{value / 1000:.3f}"
+
+
+def get_histogram_row(request_type: str, name: str, histogram: HDRHistogram, percentiles: list[float]) -> list:
+    values = histogram.get_values_at_percentiles(percentiles)
+    return [
+        request_type,
+        name,
+        histogram.total_count,
+        format_latency(histogram.min_value),
+        format_latency(histogram.max_value),
+        format_latency(histogram.mean),
+        *(format_latency(values[percentile]) for percentile in percentiles)
+    ]
+
+
+class HDRStatsWriter:
+    """
+    Выгружает HDR статистику в файлы рядом с CSV отчётами Locust (--csv <prefix>):
+
+    - <prefix>_hdr_stats_history.csv — перцентили каждой записи за каждый интервал;
+    - <prefix>_hdr.hlog — полное распределение каждой записи за каждый интервал
+      (закодированная гистограмма в base64, восстанавливается HDRHistogram.decode);
+    - <prefix>_hdr_stats.csv — перцентили за весь тест, перезаписывается при остановке.
+
+    Задержки в файлах — в миллисекундах с точностью до микросекунды.
+    """
+
+    def __init__(self, stats: HDRStats, prefix: str):
+        self.stats = stats
+        self.prefix = prefix
+        self.percentiles = get_report_percentiles()
+        self.header = [
+            "Type", "Name", "Request Count", "Min Response Time", "Max Response Time", "Average Response Time",
+            *map(format_percentile, self.percentiles)
+        ]
+
+        with open(f"{prefix}_hdr_stats_history.csv", "w", newline="") as file:
+            csv.writer(file).writerow(["Timestamp", *self.header])
+
+        with open(f"{prefix}_hdr.hlog", "w", newline="") as file:
+            csv.writer(file).writerow(["Timestamp", "Interval", "Type", "Name", "Histogram"])
+
+        self._interval_start = time.time()
+
+    def write_interval(self) -> None:
+        """
+        Дописывает интервальные перцентили и распределения и начинает новый интервал.
+        """
+        now = time.time()
+        interval = now - self._interval_start
+        self._interval_start = now
+
+        with (
+            open(f"{self.prefix}_hdr_stats_history.csv", "a", newline="") as history_file,
+            open(f"{self.prefix}_hdr.hlog", "a", newline="") as log_file
+        ):
+            history, log = csv.writer(history_file), csv.writer(log_file)
+            for (request_type, name), entry in self.stats.entries.items():
+                if not entry.interval.total_count:
+                    continue
+
+                history.writerow([int(now), *get_histogram_row(request_type, name, entry.interval, self.percentiles)])
+                log.writerow([
+                    f"{now:.3f}", f"{interval:.3f}", request_type, name, base64.b64encode(entry.interval.encode()).decode()
+                ])
+                entry.interval.reset()
+
+    def write_total(self) -> None:
+        """
+        Записывает перцентили за весь тест.
+        """
+        with open(f"{self.prefix}_hdr_stats.csv", "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(self.header)
+            for (request_type, name), entry in sorted(self.stats.entries.items()):
+                writer.writerow(get_histogram_row(request_type, name, entry.total, self.percentiles))
+
+
+@events.init.add_listener
+def setup_hdr_stats(environment: Environment, **kwargs):
+    """
+    Подключает HDR статистику (environment.hdr_stats) к процессу Locust, если она включена (METRICS.HDR).
+
+    - Воркер записывает задержки в интервальные гистограммы и отправляет их мастеру с каждым отчётом статистики.
+    - Мастер сливает гистограммы воркеров, локальный запуск записывает задержки сам.
+    - Мастер и локальный запуск выгружают интервальную статистику раз в locust.stats.CSV_STATS_INTERVAL_SEC
+      и итоговую при остановке теста и при завершении процесса (HDRStatsWriter), если задан --csv.
+    """
+    config = settings.metrics
+    environment.hdr_stats = None
+    if not config.hdr:
+        return
+
+    runner = environment.runner
+    stats = environment.hdr_stats = HDRStats(
+        highest_trackable_value=round(config.hdr_highest_latency * 1000),
+        significant_digits=config.hdr_significant_digits,
+        track_total=not isinstance(runner, WorkerRunner)
+    )
+
+    if not isinstance(runner, MasterRunner):
+        @environment.events.request.add_listener
+        def on_request(request_type: str, name: str, response_time: float, **kwargs):
+            stats.record(request_type, name, response_time)
+
+        get_metric_sinks(environment).append(stats.record)
+        reporter = get_request_reporter(environment)
+        if reporter is not None:
+            reporter.add_sink(stats.record_batch)
+
+    if isinstance(runner, WorkerRunner):
+        @environment.events.report_to_master.add_listener
+        def on_report_to_master(client_id: str, data: dict, **kwargs):
+            data[HDR_REPORT_KEY] = stats.serialize_interval()
+
+        return
+
+    if isinstance(runner, MasterRunner):
+        @environment.events.worker_report.add_listener
+        def on_worker_report(client_id: str, data: dict, **kwargs):
+            stats.merge_serialized(data.get(HDR_REPORT_KEY, []))
+
+    prefix = getattr(environment.parsed_options, "csv_prefix", None)
+    writer_greenlet: gevent.Greenlet | None = None
+    writer: HDRStatsWriter | None = None
+
+    def write_intervals():
+        while True:
+            gevent.sleep(locust.stats.CSV_STATS_INTERVAL_SEC)
+            writer.write_interval()
+
+    @environment.events.test_start.add_listener
+    def on_test_start(environment: Environment, **kwargs):
+        nonlocal writer, writer_greenlet
+        stats.reset()
+        if prefix:
+            writer = HDRStatsWriter(stats, prefix)
+            writer_greenlet = gevent.spawn(write_intervals)
+
+    def flush():
+        if writer is not None:
+            writer.write_interval()
+            writer.write_total()
+
+    @environment.events.test_stop.add_listener
+    def on_test_stop(environment: Environment, **kwargs):
+        if writer_greenlet is not None:
+            writer_greenlet.kill()
+
+        flush()
+
+    @environment.events.quitting.add_listener
+    def on_quitting(environment: Environment, **kwargs):
+        # При завершении по --run-time мастер получает последние отчёты воркеров уже после test_stop
+        flush()
+        if writer is not None:
+            logger.info(f"HDR stats written to {prefix}_hdr_stats.csv")
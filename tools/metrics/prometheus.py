@@ -0,0 +1,369 @@
+from array import array
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+from gevent.pywsgi import WSGIServer
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner, STATE_MISSING
+
+from clients.grpc.gateway.client import gateway_grpc_channel_pools
+from clients.http.gateway.client import gateway_http_transports
+from config import settings
+from seeds.pool import SeedUsersPool
+from tools.logger import get_logger
+from tools.metrics.hdr import HDRStats
+from tools.metrics.reporter import RequestBatch, get_metric_sinks, get_request_reporter
+
+logger = get_logger("PROMETHEUS")
+
+# Content-Type текстового формата Prometheus
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Сколько портов после METRICS.PROMETHEUS_PORT перебирает воркер в поисках свободного
+PROMETHEUS_WORKER_PORTS = 100
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricFamily:
+    """
+    Метрика в текстовом формате Prometheus: заголовки HELP и TYPE и значения с метками.
+    """
+
+    def __init__(self, name: str, metric_type: str, documentation: str):
+        """
+        :param name: Имя метрики.
+        :param metric_type: Тип метрики (counter, gauge, histogram).
+        :param documentation: Описание метрики (HELP).
+        """
+        self.name = name
+        self.metric_type = metric_type
+        self.documentation = documentation
+        self.samples: list[tuple[str, dict[str, str], float]] = []
+
+    def add(self, value: float, labels: dict[str, str] | None = None, suffix: str = "") -> None:
+        """
+        :param value: Значение.
+        :param labels: Метки значения.
+        :param suffix: Суффикс имени (_bucket, _sum, _count для гистограмм).
+        """
+        self.samples.append((suffix, labels or {}, value))
+
+    def add_histogram(
+            self,
+            labels: dict[str, str],
+            bounds: Iterable[float],
+            counts: Iterable[int],
+            total: float
+    ) -> None:
+        """
+        Добавляет гистограмму: корзины с накопленными количествами, сумму и количество значений.
+
+        :param labels: Метки гистограммы.
+        :param bounds: Верхние границы корзин без +Inf.
+        :param counts: Количество значений в каждой корзине (не накопленное), последняя — выше всех границ.
+        :param total: Сумма значений.
+        """
+        accumulated = 0
+        for bound, count in zip([*bounds, float("inf")], counts):
+            accumulated += count
+            self.add(accumulated, {**labels, "le": format_value(bound)}, "_bucket")
+
+        self.add(total, labels, "_sum")
+        self.add(accumulated, labels, "_count")
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for suffix, labels, value in self.samples:
+            rendered = ",".join(f'{key}="{escape_label_value(str(item))}"' for key, item in labels.items())
+            selector = f"{{{rendered}}}" if rendered else ""
+            lines.append(f"{self.name}{suffix}{selector} {format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+class LatencyHistogramEntry:
+    """
+    Накопленная гистограмма задержки одной записи статистики (тип запроса и имя).
+    """
+
+    def __init__(self, buckets: int):
+        self.counts = array("q", bytes(8 * (buckets + 1)))
+        self.total = 0.0
+        self.failures = 0
+
+
+class LatencyHistograms:
+    """
+    Гистограммы задержки запросов процесса Locust с корзинами Prometheus (METRICS.PROMETHEUS_BUCKETS).
+
+    Заполняются так же, как HDRStats: из events.request, из пачек RequestEventReporter и из дополнительных
+    метрик (build_report_metric). Значения накапливаются с начала работы процесса, как положено счётчикам
+    Prometheus, и не обнуляются отчётами мастеру.
+    """
+
+    def __init__(self, buckets: list[float]):
+        """
+        :param buckets: Верхние границы корзин в секундах.
+        """
+        self.buckets = sorted(buckets)
+        self._bounds_ms = [bound * 1000 for bound in self.buckets]
+        self.entries: dict[tuple[str, str], LatencyHistogramEntry] = {}
+
+    def get_entry(self, request_type: str, name: str) -> LatencyHistogramEntry:
+        entry = self.entries.get((request_type, name))
+        if entry is None:
+            entry = self.entries[(request_type, name)] = LatencyHistogramEntry(len(self.buckets))
+
+        return entry
+
+    def record(self, request_type: str, name: str, response_time: float, failed: bool = False) -> None:
+        """
+        :param response_time: Задержка в миллисекундах.
+        :param failed: Запрос завершился ошибкой.
+        """
+        entry = self.get_entry(request_type, name)
+        entry.counts[bisect_left(self._bounds_ms, response_time)] += 1
+        entry.total += response_time
+        if failed:
+            entry.failures += 1
+
+    def record_batch(self, batch: RequestBatch) -> None:
+        """
+        Записывает пачку запросов из RequestEventReporter.
+        """
+        entries, bounds = {}, self._bounds_ms
+        for key_id, response_time in zip(batch.key_ids, batch.response_times):
+            entry = entries.get(key_id)
+            if entry is None:
+                entry = entries[key_id] = self.get_entry(*batch.keys[key_id])
+
+            entry.counts[bisect_left(bounds, response_time)] += 1
+            entry.total += response_time
+
+        for position in batch.errors:
+            entries[batch.key_ids[position]].failures += 1
+
+    def collect(self) -> list[MetricFamily]:
+        durations = MetricFamily(
+            "locust_request_duration_seconds", "histogram", "Request latency measured by the load generator"
+        )
+        failures = MetricFamily("locust_request_failures_total", "counter", "Failed requests")
+        for (request_type, name), entry in sorted(self.entries.items()):
+            labels = {"request_type": request_type, "name": name}
+            durations.add_histogram(labels, self.buckets, entry.counts, entry.total / 1000)
+            failures.add(entry.failures, labels)
+
+        return [durations, failures]
+
+
+def collect_hdr_histograms(environment: Environment, hdr_stats: HDRStats, buckets: list[float]) -> list[MetricFamily]:
+    """
+    Собирает гистограммы задержки мастера из HDR-гистограмм, слитых из отчётов воркеров (накоплены с начала теста),
+    и количество ошибок из статистики Locust.
+
+    Значение относится к корзине, если наибольшее значение его HDR-корзины не больше границы
+    (погрешность отнесения — точность HDR-гистограммы).
+    """
+    bounds_us = [bound * 1_000_000 for bound in sorted(buckets)]
+    durations = MetricFamily(
+        "locust_request_duration_seconds", "histogram", "Request latency measured by the load generator (all workers)"
+    )
+    failures = MetricFamily("locust_request_failures_total", "counter", "Failed requests (all workers)")
+
+    for (request_type, name), entry in sorted(hdr_stats.entries.items()):
+        counts = [0] * (len(bounds_us) + 1)
+        for value, count in entry.total.iter_recorded():
+            counts[bisect_left(bounds_us, value)] += count
+
+        labels = {"request_type": request_type, "name": name}
+        durations.add_histogram(labels, sorted(buckets), counts, entry.total.total_value / 1_000_000)
+
+        stats_entry = environment.stats.entries.get((name, request_type))
+        failures.add(stats_entry.num_failures if stats_entry is not None else 0, labels)
+
+    return [durations, failures]
+
+
+def collect_runner_metrics(environment: Environment) -> list[MetricFamily]:
+    runner = environment.runner
+    users = MetricFamily("locust_users", "gauge", "Running virtual users")
+    users.add(runner.user_count)
+
+    if not isinstance(runner, MasterRunner):
+        return [users]
+
+    workers = MetricFamily("locust_workers", "gauge", "Connected workers")
+    workers.add(sum(1 for worker in runner.clients.values() if worker.state != STATE_MISSING))
+    return [users, workers]
+
+
+def collect_client_metrics() -> list[MetricFamily]:
+    """
+    Собирает незавершённые запросы и статистику пулов соединений HTTP (gateway_http_transports)
+    и gRPC (gateway_grpc_channel_pools) процесса.
+    """
+    in_flight = MetricFamily("locust_requests_in_flight", "gauge", "Requests sent and not yet answered")
+    http_connections = MetricFamily("locust_http_pool_connections", "gauge", "Connections in HTTP pools")
+    http_requests = MetricFamily("locust_http_pool_requests_total", "counter", "HTTP requests by connection reuse")
+    grpc_in_flight = MetricFamily("locust_grpc_channel_in_flight", "gauge", "Unfinished calls per gRPC pool channel")
+    grpc_calls = MetricFamily("locust_grpc_channel_calls_total", "counter", "Calls sent per gRPC pool channel")
+
+    transports = list(gateway_http_transports)
+    in_flight.add(sum(transport.stats.in_flight for transport in transports), {"protocol": "HTTP"})
+    http_connections.add(sum(transport.connections_open for transport in transports), {"state": "open"})
+    http_connections.add(sum(transport.connections_idle for transport in transports), {"state": "idle"})
+    http_requests.add(sum(transport.stats.created for transport in transports), {"connection": "created"})
+    http_requests.add(sum(transport.stats.reused for transport in transports), {"connection": "reused"})
+
+    pools = list(gateway_grpc_channel_pools)
+    in_flight.add(sum(pool.stats.in_flight_total for pool in pools), {"protocol": "gRPC"})
+    for pool in pools:
+        for index, (channel_in_flight, channel_calls) in enumerate(zip(pool.stats.in_flight, pool.stats.calls)):
+            grpc_in_flight.add(channel_in_flight, {"channel": str(index)})
+            grpc_calls.add(channel_calls, {"channel": str(index)})
+
+    return [in_flight, http_connections, http_requests, grpc_in_flight, grpc_calls]
+
+
+def collect_seeds_pool_metrics(environment: Environment) -> list[MetricFamily]:
+    pool: SeedUsersPool | None = getattr(environment, "seeds_pool", None)
+    if pool is None:
+        return []
+
+    stats = pool.stats
+    metrics = [
+        ("locust_seed_users", "gauge", "Seed users in the pool", stats.total),
+        ("locust_seed_users_in_use", "gauge", "Seed users checked out by virtual users", stats.in_use),
+        ("locust_seed_users_peak_in_use", "gauge", "Peak of seed users checked out at once", stats.peak_in_use),
+        ("locust_seed_users_utilization", "gauge", "Share of seed users checked out", stats.utilization),
+        ("locust_seed_users_checkouts_total", "counter", "Seed user checkouts", stats.checkouts),
+        ("locust_seed_users_recycled_total", "counter", "Non-exclusive seed user checkouts", stats.recycled),
+        ("locust_seed_users_waits_total", "counter", "Seed user checkouts that waited for release", stats.waits),
+    ]
+
+    families = []
+    for name, metric_type, documentation, value in metrics:
+        family = MetricFamily(name, metric_type, documentation)
+        family.add(value)
+        families.append(family)
+
+    return families
+
+
+class PrometheusExporter:
+    """
+    HTTP-эндпоинт /metrics процесса Locust в текстовом формате Prometheus на gevent WSGI-сервере.
+
+    Метрики собираются в момент запроса (scrape) вызовом всех сборщиков (collectors).
+    """
+
+    def __init__(self, collectors: list[Callable[[], list[MetricFamily]]]):
+        """
+        :param collectors: Функции, возвращающие метрики.
+        """
+        self.collectors = collectors
+        self.server: WSGIServer | None = None
+
+    def render(self) -> str:
+        return "".join(family.render() for collector in self.collectors for family in collector())
+
+    def application(self, environ: dict, start_response: Callable):
+        if environ.get("PATH_INFO") != "/metrics":
+            start_response("404 Not Found", [("Content-Type", "text/plain")])
+            return [b"Not Found"]
+
+        body = self.render().encode()
+        start_response("200 OK", [("Content-Type", PROMETHEUS_CONTENT_TYPE), ("Content-Length", str(len(body)))])
+        return [body]
+
+    def start(self, host: str, ports: Iterable[int]) -> int | None:
+        """
+        Запускает сервер на первом свободном порту из ports.
+
+        :return: Занятый порт или None, если все порты заняты.
+        """
+        for port in ports:
+            server = WSGIServer((host, port), self.application, log=None, error_log=logger)
+            try:
+                server.start()
+            except OSError:
+                continue
+
+            self.server = server
+            return port
+
+        return None
+
+    def stop(self) -> None:
+        if self.server is not None:
+            self.server.stop(timeout=1)
+
+
+@events.init.add_listener
+def setup_prometheus_exporter(environment: Environment, **kwargs):
+    """
+    Поднимает эндпоинт /metrics процесса Locust, если он включён (METRICS.PROMETHEUS).
+
+    - Воркер и локальный запуск отдают собственные гистограммы задержки по записям статистики, незавершённые
+      запросы, статистику пулов соединений HTTP и gRPC и пула сидинговых пользователей.
+      Воркер занимает первый свободный порт после METRICS.PROMETHEUS_PORT.
+    - Мастер на METRICS.PROMETHEUS_PORT отдаёт гистограммы задержки всех воркеров, собранные из HDR-гистограмм
+      (нужна METRICS.HDR), количество пользователей и воркеров.
+    """
+    config = settings.metrics
+    environment.prometheus_exporter = None
+    if not config.prometheus:
+        return
+
+    runner = environment.runner
+    collectors: list[Callable[[], list[MetricFamily]]] = [lambda: collect_runner_metrics(environment)]
+
+    if isinstance(runner, MasterRunner):
+        hdr_stats: HDRStats | None = getattr(environment, "hdr_stats", None)
+        if hdr_stats is not None:
+            collectors.append(lambda: collect_hdr_histograms(environment, hdr_stats, config.prometheus_buckets))
+    else:
+        histograms = LatencyHistograms(config.prometheus_buckets)
+
+        @environment.events.request.add_listener
+        def on_request(request_type: str, name: str, response_time: float, exception=None, **kwargs):
+            histograms.record(request_type, name, response_time, exception is not None)
+
+        get_metric_sinks(environment).append(histograms.record)
+        reporter = get_request_reporter(environment)
+        if reporter is not None:
+            reporter.add_sink(histograms.record_batch)
+
+        collectors += [
+            histograms.collect,
+            collect_client_metrics,
+            lambda: collect_seeds_pool_metrics(environment)
+        ]
+
+    exporter = environment.prometheus_exporter = PrometheusExporter(collectors)
+    if isinstance(runner, WorkerRunner):
+        ports = range(config.prometheus_port + 1, config.prometheus_port + 1 + PROMETHEUS_WORKER_PORTS)
+    else:
+        ports = [config.prometheus_port]
+
+    port = exporter.start(config.prometheus_host, ports)
+    if port is None:
+        logger.warning(f"Prometheus metrics endpoint is disabled: no free port in {ports}")
+        return
+
+    logger.info(f"Prometheus metrics are served at http://{config.prometheus_host}:{port}/metrics")
+
+    @environment.events.quitting.add_listener
+    def stop_prometheus_exporter(environment: Environment, **kwargs):
+        exporter.stop()